@@ -6,29 +6,42 @@ Provides configuration dataclasses for Langdock inline assistants.
 All settings are versioned in Git for Single Source of Truth.
 """
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 
-@dataclass
+# Shared system prompts (one string object each, referenced by all configs)
+
+_DETERMINISTIC_SYSTEM_PROMPT = """Befolge präzise die Anweisungen im User Prompt.
+Antworte ausschließlich im angeforderten JSON-Format.
+Keine zusätzlichen Erklärungen außerhalb des JSON."""
+
+_OCR_SYSTEM_PROMPT = """Extrahiere ALLEN sichtbaren Text präzise aus dem Dokument.
+Befolge exakt die Anweisungen im User Prompt.
+Antworte ausschließlich im angeforderten Format."""
+
+
+@dataclass(frozen=True, slots=True)
 class AssistantConfig:
     """
     Configuration for Langdock Inline Assistant
 
     This configuration is passed per API request, allowing full control
     over model, temperature, and instructions without pre-created assistants.
+    Instances are frozen so they can be shared safely (e.g. from caches).
 
     Attributes:
         model: LLM model to use (default: gpt-4o for vision/PDF support)
         temperature: Sampling temperature 0-1 (default: 0 for deterministic)
         system_prompt: System-level instructions for the assistant
         name: Display name for the assistant (for logging/debugging)
+        prompt_cache: Mark stable instructions as cacheable (Claude models only;
+                      OpenAI caches long prefixes automatically)
     """
     model: str = "gpt-4o"
     temperature: float = 0.0  # Deterministic by default
-    system_prompt: str = """Befolge präzise die Anweisungen im User Prompt.
-Antworte ausschließlich im angeforderten JSON-Format.
-Keine zusätzlichen Erklärungen außerhalb des JSON."""
+    system_prompt: str = _DETERMINISTIC_SYSTEM_PROMPT
     name: str = "Invoice Analysis"
+    prompt_cache: bool = False
 
     def __post_init__(self):
         """Validate configuration parameters"""
@@ -55,9 +68,24 @@ Keine zusätzlichen Erklärungen außerhalb des JSON."""
             "name": self.name,
             "model": self.model,
             "temperature": self.temperature,
-            "instructions": self.system_prompt
+            "instructions": self._instructions()
         }
 
+    @property
+    def uses_prompt_cache(self) -> bool:
+        """True if stable prompt parts should carry cache_control tags"""
+        return self.prompt_cache and self.model.startswith("claude-")
+
+    def _instructions(self) -> Any:
+        """System prompt in API form (tagged as ephemeral cache block for Claude)"""
+        if self.uses_prompt_cache:
+            return [{
+                "type": "text",
+                "text": self.system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }]
+        return self.system_prompt
+
     def __repr__(self) -> str:
         """Human-readable representation for logging"""
         return f"AssistantConfig(model={self.model}, temp={self.temperature}, name='{self.name}')"
@@ -69,9 +97,7 @@ DETERMINISTIC_CONFIG = AssistantConfig(
     name="Invoice Analysis (Deterministic)",
     model="gpt-4o",
     temperature=0.0,
-    system_prompt="""Befolge präzise die Anweisungen im User Prompt.
-Antworte ausschließlich im angeforderten JSON-Format.
-Keine zusätzlichen Erklärungen außerhalb des JSON."""
+    system_prompt=_DETERMINISTIC_SYSTEM_PROMPT
 )
 
 CREATIVE_CONFIG = AssistantConfig(
@@ -87,9 +113,7 @@ BALANCED_CONFIG = AssistantConfig(
     name="Invoice Analysis (Balanced)",
     model="gpt-4o",
     temperature=0.3,
-    system_prompt="""Befolge präzise die Anweisungen im User Prompt.
-Antworte ausschließlich im angeforderten JSON-Format.
-Keine zusätzlichen Erklärungen außerhalb des JSON."""
+    system_prompt=_DETERMINISTIC_SYSTEM_PROMPT
 )
 
 # OCR-optimized configurations for Two-Pass OCR testing
@@ -99,51 +123,63 @@ OCR_GPT4O_CONFIG = AssistantConfig(
     name="OCR Extraction (GPT-4o)",
     model="gpt-4o",
     temperature=0.0,
-    system_prompt="""Extrahiere ALLEN sichtbaren Text präzise aus dem Dokument.
-Befolge exakt die Anweisungen im User Prompt.
-Antworte ausschließlich im angeforderten Format."""
+    system_prompt=_OCR_SYSTEM_PROMPT
 )
 
 OCR_GPT41_CONFIG = AssistantConfig(
     name="OCR Extraction (GPT-4.1)",
     model="gpt-4.1",
     temperature=0.0,
-    system_prompt="""Extrahiere ALLEN sichtbaren Text präzise aus dem Dokument.
-Befolge exakt die Anweisungen im User Prompt.
-Antworte ausschließlich im angeforderten Format."""
+    system_prompt=_OCR_SYSTEM_PROMPT
 )
 
 OCR_CLAUDE45_CONFIG = AssistantConfig(
     name="OCR Extraction (Claude Sonnet 4.5)",
     model="claude-sonnet-4-5@20250929",
     temperature=0.0,
-    system_prompt="""Extrahiere ALLEN sichtbaren Text präzise aus dem Dokument.
-Befolge exakt die Anweisungen im User Prompt.
-Antworte ausschließlich im angeforderten Format."""
+    system_prompt=_OCR_SYSTEM_PROMPT
 )
 
 OCR_GEMINI25_CONFIG = AssistantConfig(
     name="OCR Extraction (Gemini 2.5 Pro)",
     model="gemini-2.5-pro",
     temperature=0.0,
-    system_prompt="""Extrahiere ALLEN sichtbaren Text präzise aus dem Dokument.
-Befolge exakt die Anweisungen im User Prompt.
-Antworte ausschließlich im angeforderten Format."""
+    system_prompt=_OCR_SYSTEM_PROMPT
 )
 
 OCR_GPT5_CONFIG = AssistantConfig(
     name="OCR Extraction (GPT-5)",
     model="gpt-5",
     temperature=0.0,
-    system_prompt="""Extrahiere ALLEN sichtbaren Text präzise aus dem Dokument.
-Befolge exakt die Anweisungen im User Prompt.
-Antworte ausschließlich im angeforderten Format."""
+    system_prompt=_OCR_SYSTEM_PROMPT
 )
 
 # Default OCR config (based on test results - Claude Sonnet 4.5 performs best)
 # Test results (2025-10-13): Claude extracted 9 items vs 3-4 for others, correctly detected Bauleistung
 OCR_DEFAULT_CONFIG = OCR_CLAUDE45_CONFIG
 
+# Map model names to OCR configs
+OCR_CONFIGS: Dict[str, AssistantConfig] = {
+    "gpt-4o": OCR_GPT4O_CONFIG,
+    "gpt-4.1": OCR_GPT41_CONFIG,
+    "claude-sonnet-4-5@20250929": OCR_CLAUDE45_CONFIG,
+    "gemini-2.5-pro": OCR_GEMINI25_CONFIG,
+    "gpt-5": OCR_GPT5_CONFIG
+}
+
+# (config_type, model) -> config; analysis configs reuse the OCR model but
+# with deterministic instructions and an analysis-specific name
+_CONFIG_TABLE: Dict[Tuple[str, str], AssistantConfig] = {}
+for _name, _cfg in OCR_CONFIGS.items():
+    _CONFIG_TABLE[("ocr", _name)] = _cfg
+    _CONFIG_TABLE[("analysis", _name)] = AssistantConfig(
+        model=_cfg.model,
+        temperature=0.0,  # Deterministic for analysis
+        system_prompt=_DETERMINISTIC_SYSTEM_PROMPT,
+        name=f"Invoice Analysis ({_name})"
+    )
+del _name, _cfg
+
 
 def get_config(temperature: float = 0.0, name: str = None) -> AssistantConfig:
     """
@@ -167,6 +203,7 @@ def get_config_by_model_name(model: str, config_type: str = "analysis") -> Assis
     Get AssistantConfig by model name string.
 
     Maps model names from frontend to appropriate AssistantConfig objects.
+    All (config_type, model) combinations are prebuilt in _CONFIG_TABLE.
 
     Args:
         model: Model name (e.g., "gpt-4o", "claude-sonnet-4-5@20250929")
@@ -178,35 +215,12 @@ def get_config_by_model_name(model: str, config_type: str = "analysis") -> Assis
     Raises:
         ValueError: If model name is unknown
     """
-    # Map model names to OCR configs
-    ocr_configs = {
-        "gpt-4o": OCR_GPT4O_CONFIG,
-        "gpt-4.1": OCR_GPT41_CONFIG,
-        "claude-sonnet-4-5@20250929": OCR_CLAUDE45_CONFIG,
-        "gemini-2.5-pro": OCR_GEMINI25_CONFIG,
-        "gpt-5": OCR_GPT5_CONFIG
-    }
-
-    # For analysis configs, use deterministic config with specified model
-    if config_type == "analysis":
-        if model in ocr_configs:
-            # Reuse OCR config but change name to indicate analysis purpose
-            config = ocr_configs[model]
-            return AssistantConfig(
-                model=config.model,
-                temperature=0.0,  # Deterministic for analysis
-                system_prompt=DETERMINISTIC_CONFIG.system_prompt,
-                name=f"Invoice Analysis ({model})"
-            )
-        else:
-            raise ValueError(f"Unknown model for analysis: {model}")
-
-    # For OCR configs, return pre-configured OCR config
-    elif config_type == "ocr":
-        if model in ocr_configs:
-            return ocr_configs[model]
-        else:
-            raise ValueError(f"Unknown model for OCR: {model}")
-
-    else:
+    try:
+        return _CONFIG_TABLE[(config_type, model)]
+    except KeyError:
+        pass
+
+    if config_type not in ("analysis", "ocr"):
         raise ValueError(f"Unknown config_type: {config_type}. Use 'analysis' or 'ocr'.")
+    label = "analysis" if config_type == "analysis" else "OCR"
+    raise ValueError(f"Unknown model for {label}: {model}")
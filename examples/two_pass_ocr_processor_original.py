@@ -4,13 +4,21 @@ TwoPassOCRProcessor - Advanced OCR handling for scanned PDFs
 Implements a two-pass strategy for documents with poor text extraction
 """
 
+import os
+import re
+import json
 import time
-import atexit
+import uuid
+import hashlib
+import asyncio
 import logging
 import tempfile
-import shutil
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, partial
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 try:
@@ -21,6 +29,11 @@ except ImportError:
         "Install with: pip install pymupdf"
     )
 
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is used when orjson is missing
+    orjson = None
+
 from prompt_manager import PromptManager
 from assistant_config import AssistantConfig, OCR_DEFAULT_CONFIG
 from file_operations import extract_json_from_response
@@ -28,6 +41,69 @@ from pdf_type_detector import PDFTypeDetector, PDFType
 
 logger = logging.getLogger(__name__)
 
+# Max concurrent Pass 1 OCR requests (keep below the provider's QPM limit)
+OCR_CONCURRENCY = int(os.getenv("OCR_CONCURRENCY", "8"))
+
+# Pass 1 requests per minute across all processors (provider QPM limit)
+OCR_QPM = int(os.getenv("OCR_QPM", "500"))
+
+# Scanned pages sent per Pass 1 request. Fewer round-trips and less repeated
+# prompt preamble, at the cost of longer individual calls; 1 disables batching.
+OCR_BATCH_SIZE = max(1, int(os.getenv("OCR_BATCH_SIZE", "4")))
+
+# On-disk Pass 1 cache: OCR text per (PDF content, page, model, prompt)
+_OCR_CACHE_DIR = Path(os.getenv('OCR_CACHE_DIR', Path.home() / '.cache' / 'two_pass_ocr'))
+_OCR_CACHE_DISABLED = os.getenv('OCR_CACHE_DISABLED') == '1'
+
+# Fenced ```text block in OCR replies (first block, lazily matched)
+_OCR_BLOCK_RE = re.compile(r"```text\n(.*?)\n```", re.DOTALL)
+
+_OCR_BATCH_INSTRUCTIONS = """
+
+WICHTIG: Das Dokument enthält {count} Seiten. Sie entsprechen in dieser
+Reihenfolge den Originalseiten {pages}.
+Extrahiere den Text jeder Seite separat und antworte ausschließlich mit einem
+JSON-Objekt, das die Originalseitennummer auf den extrahierten Text abbildet:
+
+```json
+{example}
+```"""
+
+
+class _RateLimiter:
+    """
+    Token bucket limiting calls to `rate` per `period` seconds
+
+    acquire() reserves the next slot under a thread lock and sleeps until it
+    is due, so one limiter can be shared by concurrent event loops (each
+    extract_text_pass() call runs its own). Up to `burst` calls pass at once.
+    """
+
+    def __init__(self, rate: int, period: float = 60.0, burst: int = 1):
+        self._interval = period / max(1, rate)
+        self._burst_window = (max(1, burst) - 1) * self._interval
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Reserve a slot and return the seconds to wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self._interval
+            return max(0.0, slot - self._burst_window - now)
+
+    async def acquire(self) -> None:
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+_OCR_RATE_LIMITER = _RateLimiter(OCR_QPM, 60.0, burst=OCR_CONCURRENCY)
+
+# Serializes PyMuPDF calls made from worker threads
+_FITZ_LOCK = threading.Lock()
+
 
 class TwoPassOCRProcessor:
     """
@@ -77,20 +153,20 @@ class TwoPassOCRProcessor:
         from assistant_config import DETERMINISTIC_CONFIG
         self.analysis_model_config = analysis_model_config or DETERMINISTIC_CONFIG
 
-        # Create OCR-specific client with configured model
-        # Import here to avoid circular dependency
-        from langdock_inline_client import LangdockInlineClient
-        self.ocr_client = LangdockInlineClient(config=self.ocr_model_config)
-        self.analysis_client = LangdockInlineClient(config=self.analysis_model_config)
-
         # Initialize PDF Type Detector (Issue #4 Phase 0)
         self.pdf_detector = PDFTypeDetector(
             text_block_threshold=2,
             image_block_threshold=1
         )
 
-        # Create secure temp directory
-        self.temp_dir = Path(tempfile.mkdtemp(prefix="ocr_processor_"))
+        # Pass 1 OCR text cache (see _OCR_CACHE_DIR)
+        self._cache_dir = None if _OCR_CACHE_DISABLED else _OCR_CACHE_DIR
+
+        # Create secure temp directory. Removed by close()/__exit__, or when
+        # the processor is garbage collected (no atexit reference to self)
+        self._tempdir_ctx = tempfile.TemporaryDirectory(prefix="ocr_processor_")
+        self.temp_dir = Path(self._tempdir_ctx.name)
+        self._finalizer = weakref.finalize(self, self._tempdir_ctx.cleanup)
         logger.info(
             f"Initialized TwoPassOCRProcessor with temp dir: {self.temp_dir}",
             extra={
@@ -100,18 +176,62 @@ class TwoPassOCRProcessor:
             }
         )
 
-        # Register cleanup on exit
-        atexit.register(self._cleanup_temp_dir)
+    @cached_property
+    def ocr_client(self):
+        """OCR-specific client (Pass 1), created on first use"""
+        # Import here to avoid circular dependency
+        from langdock_inline_client import LangdockInlineClient
+        return LangdockInlineClient(config=self.ocr_model_config)
+
+    @cached_property
+    def analysis_client(self):
+        """Analysis client (Pass 2), created on first use"""
+        from langdock_inline_client import LangdockInlineClient
+        return LangdockInlineClient(config=self.analysis_model_config)
+
+    @cached_property
+    def _executor(self) -> ThreadPoolExecutor:
+        """
+        Worker threads for blocking calls (API requests, page splits, uploads)
 
-    def _cleanup_temp_dir(self):
-        """Clean up temporary directory on exit"""
-        if self.temp_dir and self.temp_dir.exists():
+        Sized for OCR_CONCURRENCY requests plus the Pass 2 upload and a split;
+        the default executor is capped by CPU count, which would throttle the
+        I/O-bound OCR requests on small machines.
+        """
+        return ThreadPoolExecutor(
+            max_workers=OCR_CONCURRENCY + 2,
+            thread_name_prefix="two_pass_ocr"
+        )
+
+    async def _run_blocking(self, func, *args, **kwargs):
+        """Run a blocking call in the processor's thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    def close(self):
+        """Remove the temp directory and close clients created by this processor"""
+        if self._finalizer.alive:
             try:
-                shutil.rmtree(self.temp_dir)
+                self._finalizer()
                 logger.info(f"Cleaned up temp directory: {self.temp_dir}")
             except Exception as e:
                 logger.warning(f"Failed to cleanup temp dir: {e}")
 
+        executor = self.__dict__.pop('_executor', None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+        for name in ('ocr_client', 'analysis_client'):
+            client = self.__dict__.pop(name, None)
+            if client is not None and hasattr(client, 'close'):
+                client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def classify_pdf_type(self, pdf_path: Path):
         """
         Classify PDF type using block-type detection (Issue #4 Phase 0).
@@ -141,6 +261,19 @@ class TwoPassOCRProcessor:
             FileNotFoundError: If PDF doesn't exist
             Exception: If PDF cannot be opened
         """
+        scanned_pages, _ = self._detect_scanned_pages(pdf_path)
+        return scanned_pages
+
+    def _detect_scanned_pages(self, pdf_path: Path) -> Tuple[List[int], Any]:
+        """
+        Detect scanned pages and also return the full classification
+
+        process() reuses the classification (e.g. total_pages) instead of
+        opening the PDF again.
+
+        Returns:
+            Tuple of (scanned page numbers, PDFClassificationResult)
+        """
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
@@ -170,18 +303,21 @@ class TwoPassOCRProcessor:
                 }
             )
 
-            return scanned_pages
+            return scanned_pages, classification
 
         except Exception as e:
             logger.error(f"Error detecting scanned pages: {e}", exc_info=True)
             raise
 
-    def _split_page_to_temp(self, pdf_path: Path, page_num: int) -> Path:
+    def _split_page_to_temp(self, src_doc: fitz.Document, stem: str, page_num: int) -> Path:
         """
         Extract single page from PDF and save to temp file
 
+        For callers that need a file; Pass 1 itself uses _split_pages_to_bytes().
+
         Args:
-            pdf_path: Source PDF path
+            src_doc: Open source PDF document
+            stem: Source file stem (used for the temp file name)
             page_num: 1-indexed page number to extract
 
         Returns:
@@ -190,138 +326,419 @@ class TwoPassOCRProcessor:
         Raises:
             Exception: If page extraction fails
         """
-        try:
-            # Open source PDF
-            doc = fitz.open(pdf_path)
+        temp_file = self.temp_dir / self._split_name(stem, [page_num])
+        temp_file.write_bytes(self._split_pages_to_bytes(src_doc, [page_num]))
+        return temp_file
+
+    @staticmethod
+    def _split_name(stem: str, page_nums: List[int]) -> str:
+        """File name for a split (e.g. invoice_page_3.pdf, invoice_pages_1_2.pdf)"""
+        suffix = "_".join(str(p) for p in page_nums)
+        label = "page" if len(page_nums) == 1 else "pages"
+        return f"{stem}_{label}_{suffix}.pdf"
+
+    def _split_pages_to_bytes(self, src_doc: fitz.Document, page_nums: List[int]) -> bytes:
+        """
+        Extract pages from PDF (in the given order) into an in-memory PDF
+
+        The source document is opened once per Pass 1 run by the caller and
+        shared by all splits instead of being re-parsed per page. The result
+        is uploaded directly, without a temp file round-trip.
 
-            # Create new PDF with single page (convert to 0-indexed)
-            new_doc = fitz.open()
-            new_doc.insert_pdf(doc, from_page=page_num - 1, to_page=page_num - 1)
+        Args:
+            src_doc: Open source PDF document
+            page_nums: 1-indexed page numbers to extract
 
-            # Save to temp file
-            temp_file = self.temp_dir / f"{pdf_path.stem}_page_{page_num}.pdf"
-            new_doc.save(temp_file)
+        Returns:
+            PDF bytes containing only these pages
 
-            # Cleanup
-            new_doc.close()
-            doc.close()
+        Raises:
+            Exception: If page extraction fails
+        """
+        try:
+            # PyMuPDF is not thread-safe; splits run in worker threads
+            with _FITZ_LOCK:
+                # Create new PDF with the requested pages (convert to 0-indexed)
+                new_doc = fitz.open()
+                for page_num in page_nums:
+                    new_doc.insert_pdf(src_doc, from_page=page_num - 1, to_page=page_num - 1)
+
+                # Serialize compacted, with content streams cleaned (smaller
+                # upload). insert_pdf() is used rather than select(): select()
+                # mutates the document, so it would need a private re-parsed
+                # copy of the source per split.
+                pdf_bytes = new_doc.tobytes(garbage=4, deflate=True, clean=True)
+                new_doc.close()
 
             logger.debug(
-                f"Extracted page {page_num} to: {temp_file.name}",
-                extra={'page': page_num, 'temp_file': str(temp_file)}
+                f"Extracted pages {page_nums} ({len(pdf_bytes)} bytes)",
+                extra={'pages': page_nums, 'bytes': len(pdf_bytes)}
             )
 
-            return temp_file
+            return pdf_bytes
 
         except Exception as e:
-            logger.error(f"Failed to extract page {page_num}: {e}", exc_info=True)
+            logger.error(f"Failed to extract pages {page_nums}: {e}", exc_info=True)
             raise
 
-    @retry(
-        stop=stop_after_attempt(2),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True
-    )
     def extract_text_pass(
         self,
         pdf_path: Path,
-        scanned_pages: List[int]
+        scanned_pages: List[int],
+        force_refresh: bool = False,
+        pdf_bytes: Optional[bytes] = None
     ) -> Dict[int, str]:
         """
         Pass 1: Extract text from scanned pages using OCR prompt
 
-        For each scanned page:
-        1. Split page to temporary single-page PDF
+        For each scanned page (concurrently, bounded by OCR_CONCURRENCY):
+        1. Split page to an in-memory single-page PDF
         2. Send to Langdock API with OCR extraction prompt
         3. Parse and store extracted text
 
+        Pages already OCR'd for the same PDF content, model and prompt are
+        served from the on-disk cache. Runs its own event loop; use
+        extract_text_pass_async() from async code.
+
         Args:
             pdf_path: Path to original PDF
             scanned_pages: List of 1-indexed page numbers to process
+            force_refresh: Ignore cached OCR text (results are still cached)
+            pdf_bytes: Content of pdf_path if already read (avoids re-reading)
 
         Returns:
             Dictionary mapping page numbers to extracted text
             Example: {1: "Company Name\\nInvoice 123", 3: "Line items..."}
 
         Raises:
-            Exception: If OCR extraction fails after retries
+            Exception: If the PDF cannot be opened (failed batches are
+                       retried and then recorded per page instead)
         """
         if not scanned_pages:
             logger.info("No scanned pages to process in Pass 1")
             return {}
 
-        ocr_context = {}
-        ocr_prompt = PromptManager.get_ocr_extraction_prompt()
-
-        logger.info(
-            f"Starting OCR text extraction (Pass 1): {len(scanned_pages)} pages",
-            extra={'scanned_pages': scanned_pages, 'pdf': pdf_path.name}
+        return asyncio.run(
+            self.extract_text_pass_async(
+                pdf_path, scanned_pages, force_refresh=force_refresh, pdf_bytes=pdf_bytes
+            )
         )
 
-        for page_num in scanned_pages:
-            page_start_time = time.time()
+    async def extract_text_pass_async(
+        self,
+        pdf_path: Path,
+        scanned_pages: List[int],
+        force_refresh: bool = False,
+        pdf_bytes: Optional[bytes] = None
+    ) -> Dict[int, str]:
+        """
+        Async variant of extract_text_pass() for callers with a running event loop
 
-            try:
-                logger.info(
-                    f"Extracting text from page {page_num}...",
-                    extra={'page': page_num, 'total_pages': len(scanned_pages)}
-                )
+        Pages are sent in batches of OCR_BATCH_SIZE, and batches are OCR'd
+        concurrently (at most OCR_CONCURRENCY requests in flight). Pages of a
+        failed batch are recorded as "[OCR extraction failed: ...]" without
+        affecting the other batches.
 
-                # Split page to temp file
-                temp_page_pdf = self._split_page_to_temp(pdf_path, page_num)
+        Args:
+            pdf_path: Path to original PDF
+            scanned_pages: List of 1-indexed page numbers to process
+            force_refresh: Ignore cached OCR text (results are still cached)
+            pdf_bytes: Content of pdf_path if already read (avoids re-reading)
 
-                # Call API with OCR-specific client and prompt (90s timeout per page)
-                response = self.ocr_client._make_api_call(
-                    pdf_path=temp_page_pdf,
-                    prompt=ocr_prompt,
-                    request_timeout=90
-                )
+        Returns:
+            Dictionary mapping page numbers to extracted text
+        """
+        if not scanned_pages:
+            logger.info("No scanned pages to process in Pass 1")
+            return {}
 
-                # Extract text from response using OCR client's parser
-                extracted_text = self._extract_ocr_text_from_response(response)
+        ocr_context = {}
+        ocr_prompt = PromptManager.get_ocr_extraction_prompt()
 
-                if extracted_text:
-                    ocr_context[page_num] = extracted_text
-                    logger.info(
-                        f"✅ Page {page_num}: Extracted {len(extracted_text)} chars",
-                        extra={
-                            'page': page_num,
-                            'chars': len(extracted_text),
-                            'duration': round(time.time() - page_start_time, 2)
-                        }
-                    )
-                    # DEBUG: Log first 500 chars of extracted text
+        logger.info(
+            f"Starting OCR text extraction (Pass 1): {len(scanned_pages)} pages",
+            extra={
+                'scanned_pages': scanned_pages,
+                'pdf': pdf_path.name,
+                'concurrency': OCR_CONCURRENCY
+            }
+        )
+
+        cache_prefix = None
+        if self._cache_dir is not None:
+            cache_prefix = await self._run_blocking(
+                self._ocr_cache_prefix, pdf_path, ocr_prompt, pdf_bytes
+            )
+            if not force_refresh:
+                for page_num in scanned_pages:
+                    cached = self._read_ocr_cache(cache_prefix, page_num)
+                    if cached is not None:
+                        ocr_context[page_num] = cached
+                if ocr_context:
                     logger.info(
-                        f"📝 OCR Text Preview (Page {page_num}): {extracted_text[:500]}...",
-                        extra={'page': page_num, 'preview_length': min(500, len(extracted_text))}
-                    )
-                else:
-                    logger.warning(
-                        f"⚠️  Page {page_num}: No text extracted",
-                        extra={'page': page_num}
+                        f"OCR cache hit for {len(ocr_context)}/{len(scanned_pages)} pages",
+                        extra={'cached_pages': sorted(ocr_context)}
                     )
 
-                # Cleanup temp file
+        pending_pages = [p for p in scanned_pages if p not in ocr_context]
+        semaphore = asyncio.Semaphore(OCR_CONCURRENCY)
+        batches = self._page_batches(pending_pages)
+
+        # Parse the source PDF once for all page splits. Batches are consumed
+        # in completion order, so progress (and cache writes) happen as soon
+        # as each batch returns rather than after the slowest one.
+        if batches:
+            if pdf_bytes is not None:
+                src = fitz.open(stream=pdf_bytes, filetype="pdf")
+            else:
+                src = fitz.open(pdf_path)
+            with src as src_doc:
+                tasks = [
+                    asyncio.create_task(
+                        self._ocr_batch_async(src_doc, pdf_path.stem, batch, semaphore, ocr_prompt)
+                    )
+                    for batch in batches
+                ]
                 try:
-                    temp_page_pdf.unlink()
-                except Exception:
-                    pass
-
-            except Exception as e:
-                logger.error(
-                    f"❌ Page {page_num} extraction failed: {str(e)[:100]}",
-                    extra={'page': page_num, 'error': str(e)},
-                    exc_info=True
-                )
-                # Continue with other pages even if one fails
-                ocr_context[page_num] = f"[OCR extraction failed: {str(e)[:100]}]"
+                    for done, next_batch in enumerate(asyncio.as_completed(tasks), 1):
+                        batch, result, duration = await next_batch
+                        self._collect_batch(
+                            batch, result, duration, ocr_context, cache_prefix,
+                            progress=f"{done}/{len(batches)}"
+                        )
+                finally:
+                    for task in tasks:
+                        task.cancel()
 
         logger.info(
             f"OCR text extraction complete: {len(ocr_context)}/{len(scanned_pages)} successful",
             extra={'successful_pages': len(ocr_context), 'total_pages': len(scanned_pages)}
         )
 
-        return ocr_context
+        # Page order as requested (cached pages were filled in first)
+        return {p: ocr_context[p] for p in scanned_pages if p in ocr_context}
+
+    def _ocr_cache_prefix(
+        self,
+        pdf_path: Path,
+        ocr_prompt: str,
+        pdf_bytes: Optional[bytes] = None
+    ) -> str:
+        """Cache key prefix: hash of PDF content plus OCR model and prompt"""
+        if pdf_bytes is not None:
+            pdf_hash = hashlib.sha256(pdf_bytes)
+        else:
+            pdf_hash = hashlib.sha256()
+            with open(pdf_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    pdf_hash.update(chunk)
+
+        request_hash = hashlib.sha256(
+            f"{self.ocr_model_config.model}\0{ocr_prompt}".encode('utf-8')
+        )
+        return f"{pdf_hash.hexdigest()[:16]}_{request_hash.hexdigest()[:16]}"
+
+    def _read_ocr_cache(self, cache_prefix: str, page_num: int) -> Optional[str]:
+        """Return cached OCR text for a page, or None on miss"""
+        try:
+            return (self._cache_dir / f"{cache_prefix}_{page_num}.txt").read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def _write_ocr_cache(self, cache_prefix: str, page_num: int, text: str) -> None:
+        """Write OCR text to cache atomically (temp file + os.replace); best-effort"""
+        cache_file = self._cache_dir / f"{cache_prefix}_{page_num}.txt"
+        tmp_file = cache_file.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(text, encoding='utf-8')
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.warning(f"Failed to write OCR cache for page {page_num}: {e}")
+            tmp_file.unlink(missing_ok=True)
+
+    @staticmethod
+    def _page_batches(scanned_pages: List[int]) -> List[List[int]]:
+        """Chunk scanned pages into Pass 1 request batches of OCR_BATCH_SIZE"""
+        return [
+            scanned_pages[i:i + OCR_BATCH_SIZE]
+            for i in range(0, len(scanned_pages), OCR_BATCH_SIZE)
+        ]
+
+    async def _ocr_batch_async(
+        self,
+        src_doc: fitz.Document,
+        stem: str,
+        page_nums: List[int],
+        semaphore: asyncio.Semaphore,
+        ocr_prompt: str
+    ) -> Tuple[List[int], Any, float]:
+        """
+        OCR a batch of pages with one API call
+
+        The pages are split into one in-memory PDF; for more than one page
+        the prompt asks for a JSON object mapping page number to text.
+
+        Args:
+            src_doc: Open source PDF document
+            stem: Source file stem (used for the upload file name)
+            page_nums: 1-indexed page numbers in this batch
+            semaphore: Limits concurrent API calls
+            ocr_prompt: OCR extraction prompt
+
+        Returns:
+            Tuple of (page_nums, result, duration in seconds). result maps page
+            numbers to extracted text ("" if none), or is the exception raised
+            by splitting, the API call or batch parsing.
+        """
+        batch_start_time = time.time()
+        try:
+            texts = await self._ocr_batch_texts_async(
+                src_doc, stem, page_nums, semaphore, ocr_prompt
+            )
+        except Exception as e:
+            return page_nums, e, round(time.time() - batch_start_time, 2)
+        return page_nums, texts, round(time.time() - batch_start_time, 2)
+
+    @retry(
+        stop=stop_after_attempt(2),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        reraise=True
+    )
+    async def _ocr_batch_texts_async(
+        self,
+        src_doc: fitz.Document,
+        stem: str,
+        page_nums: List[int],
+        semaphore: asyncio.Semaphore,
+        ocr_prompt: str
+    ) -> Dict[int, str]:
+        """
+        Split, call the OCR API and parse the reply for one batch
+
+        Retried per batch, so one flaky batch does not redo the others. Each
+        attempt waits for a rate limiter slot (OCR_QPM) before calling the API.
+
+        Raises:
+            Exception: If the last attempt fails
+        """
+        if len(page_nums) > 1:
+            ocr_prompt += _OCR_BATCH_INSTRUCTIONS.format(
+                count=len(page_nums),
+                pages=", ".join(str(p) for p in page_nums),
+                example=json.dumps({str(p): "..." for p in page_nums})
+            )
+
+        async with semaphore:
+            logger.info(
+                f"Extracting text from pages {page_nums}...",
+                extra={'pages': page_nums}
+            )
+
+            # Split pages to one in-memory PDF, off the event loop so it
+            # overlaps with other batches' uploads
+            pdf_bytes = await self._run_blocking(self._split_pages_to_bytes, src_doc, page_nums)
+
+            await _OCR_RATE_LIMITER.acquire()
+
+            # Blocking HTTP call runs in a worker thread (90s timeout per page)
+            response = await self._run_blocking(
+                self.ocr_client._make_api_call,
+                pdf_path=Path(self._split_name(stem, page_nums)),
+                prompt=ocr_prompt,
+                request_timeout=90 * len(page_nums),
+                pdf_bytes=pdf_bytes
+            )
+
+        # Extract text from response using OCR client's parser
+        extracted_text = self._extract_ocr_text_from_response(response)
+        if len(page_nums) == 1:
+            return {page_nums[0]: extracted_text}
+        return self._split_batch_text(extracted_text, page_nums)
+
+    def _collect_batch(
+        self,
+        page_nums: List[int],
+        result: Any,
+        duration: float,
+        ocr_context: Dict[int, str],
+        cache_prefix: Optional[str],
+        progress: str
+    ) -> None:
+        """
+        Log a finished batch and fold its texts into ocr_context (and the cache)
+
+        Args:
+            page_nums: Pages of the batch
+            result: Page texts, or the exception the batch failed with
+            duration: Batch duration in seconds
+            ocr_context: Pass 1 result being built (updated in place)
+            cache_prefix: OCR cache key prefix (None: caching disabled)
+            progress: "<finished>/<total>" batches, for logging
+        """
+        if isinstance(result, BaseException):
+            logger.error(
+                f"❌ Pages {page_nums} extraction failed ({progress}): {str(result)[:100]}",
+                extra={'pages': page_nums, 'error': str(result)},
+                exc_info=result
+            )
+            # Other batches are kept even if one fails
+            for page_num in page_nums:
+                ocr_context[page_num] = f"[OCR extraction failed: {str(result)[:100]}]"
+            return
+
+        for page_num in page_nums:
+            text = result.get(page_num, "")
+            if text:
+                ocr_context[page_num] = text
+                if cache_prefix is not None:
+                    self._write_ocr_cache(cache_prefix, page_num, text)
+                logger.info(
+                    f"✅ Page {page_num}: Extracted {len(text)} chars ({progress})",
+                    extra={'page': page_num, 'chars': len(text), 'duration': duration}
+                )
+                # DEBUG: Log first 500 chars of extracted text (formatted lazily)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "📝 OCR Text Preview (Page %s): %.500s...", page_num, text,
+                        extra={'page': page_num, 'preview_length': min(500, len(text))}
+                    )
+            else:
+                logger.warning(
+                    f"⚠️  Page {page_num}: No text extracted",
+                    extra={'page': page_num}
+                )
+
+    @staticmethod
+    def _split_batch_text(text: str, page_nums: List[int]) -> Dict[int, str]:
+        """
+        Parse a batched OCR reply ({"<page>": "<text>", ...}) into per-page text
+
+        Keys are expected to be original page numbers; replies numbered by
+        position in the batch (1..K) are mapped back to the original pages.
+
+        Raises:
+            ValueError: If the reply contains no JSON object
+        """
+        start = text.find('{')
+        end = text.rfind('}')
+        if start == -1 or end < start:
+            raise ValueError("Batched OCR response contains no JSON object")
+
+        payload = text[start:end + 1]
+        pages = orjson.loads(payload) if orjson is not None else json.loads(payload)
+        if not isinstance(pages, dict):
+            raise ValueError("Batched OCR response is not a JSON object")
+
+        wanted = {str(p) for p in page_nums}
+        if not wanted & pages.keys():
+            # Model numbered pages by position in the temp PDF
+            pages = {
+                str(page_num): pages.get(str(i), "")
+                for i, page_num in enumerate(page_nums, 1)
+            }
+
+        return {p: str(pages.get(str(p)) or "").strip() for p in page_nums}
 
     def _extract_ocr_text_from_response(self, response: Dict[str, Any]) -> str:
         """
@@ -338,39 +755,24 @@ class TwoPassOCRProcessor:
         Raises:
             ValueError: If text cannot be extracted
         """
-        # Navigate response structure
-        for result in response.get('result', []):
-            if result.get('role') == 'assistant':
-                content = result.get('content', '')
-
-                # Handle list format (new API)
-                if isinstance(content, list):
-                    for item in content:
-                        if item.get('type') == 'text':
-                            text_content = item.get('text', '')
-                            # Look for ```text block
-                            if '```text' in text_content:
-                                start_idx = text_content.find('```text\n')
-                                if start_idx != -1:
-                                    start_idx += len('```text\n')
-                                    end_idx = text_content.find('\n```', start_idx)
-                                    if end_idx != -1:
-                                        return text_content[start_idx:end_idx]
-                            # Fallback: return full text if no code block
-                            return text_content.strip()
-
-                # Handle string format (old API)
-                elif isinstance(content, str):
-                    # Look for ```text block
-                    if '```text' in content:
-                        start_idx = content.find('```text\n')
-                        if start_idx != -1:
-                            start_idx += len('```text\n')
-                            end_idx = content.find('\n```', start_idx)
-                            if end_idx != -1:
-                                return content[start_idx:end_idx]
-                    # Fallback: return full content
-                    return content.strip()
+        # First assistant message with text content wins
+        for result in response.get('result', ()):
+            if result.get('role') != 'assistant':
+                continue
+
+            content = result.get('content', '')
+            if isinstance(content, list):
+                # List format (new API): use the first text item
+                content = next(
+                    (item.get('text', '') for item in content if item.get('type') == 'text'),
+                    ''
+                )
+            if not content or not isinstance(content, str):
+                continue
+
+            # Prefer the ```text block, otherwise return the full text
+            match = _OCR_BLOCK_RE.search(content)
+            return match.group(1) if match else content.strip()
 
         logger.warning("Could not extract OCR text from response")
         return ""
@@ -379,7 +781,8 @@ class TwoPassOCRProcessor:
         self,
         pdf_path: Path,
         base_prompt: str,
-        ocr_context: Dict[int, str]
+        ocr_context: Dict[int, str],
+        attachment_id: Optional[str] = None
     ) -> dict:
         """
         Pass 2: Analyze full document with OCR context
@@ -391,6 +794,7 @@ class TwoPassOCRProcessor:
             pdf_path: Path to original PDF
             base_prompt: Base analysis prompt (from PromptManager)
             ocr_context: OCR text extracted in Pass 1 (page_num -> text)
+            attachment_id: ID of the already uploaded PDF (skips the upload)
 
         Returns:
             Analysis result dictionary
@@ -420,10 +824,13 @@ class TwoPassOCRProcessor:
 
             # Call API with enhanced prompt using analysis client (Pass 2)
             # This ensures the configured analysis model is used
-            response = self.analysis_client.process(
-                pdf_path=pdf_path,
-                prompt=enhanced_prompt
-            )
+            if attachment_id is not None:
+                response = self.analysis_client.analyze_invoice(attachment_id, enhanced_prompt)
+            else:
+                response = self.analysis_client.process(
+                    pdf_path=pdf_path,
+                    prompt=enhanced_prompt
+                )
 
             # Parse result using file_operations helper
             parsed_result = extract_json_from_response(response)
@@ -446,17 +853,65 @@ class TwoPassOCRProcessor:
             )
             raise
 
+    async def _ocr_and_upload_async(
+        self,
+        pdf_path: Path,
+        scanned_pages: List[int],
+        force_refresh: bool = False,
+        pdf_bytes: Optional[bytes] = None
+    ) -> Tuple[Dict[int, str], Optional[str]]:
+        """
+        Run Pass 1 while the full PDF is uploaded for Pass 2 in parallel
+
+        The Pass 2 upload does not depend on the OCR result, so it overlaps
+        with the OCR calls instead of starting after the last page.
+
+        Args:
+            pdf_path: Path to original PDF
+            scanned_pages: List of 1-indexed page numbers to OCR
+            force_refresh: Ignore cached OCR text
+            pdf_bytes: Content of pdf_path if already read (shared by both passes)
+
+        Returns:
+            Tuple of (ocr_context, attachment_id). attachment_id is None if
+            the upload failed; analysis_pass() then uploads again itself.
+        """
+        upload_task = asyncio.create_task(
+            self._run_blocking(self.analysis_client.upload_pdf, pdf_path, pdf_bytes=pdf_bytes)
+        )
+
+        try:
+            ocr_context = await self.extract_text_pass_async(
+                pdf_path, scanned_pages, force_refresh=force_refresh, pdf_bytes=pdf_bytes
+            )
+        except BaseException:
+            upload_task.cancel()
+            raise
+
+        try:
+            attachment_id = (await upload_task)['attachmentId']
+        except Exception as e:
+            logger.warning(
+                f"Pass 2 pre-upload failed, will upload with analysis: {str(e)[:100]}",
+                extra={'error': str(e)}
+            )
+            attachment_id = None
+
+        return ocr_context, attachment_id
+
     def process(
         self,
         pdf_path: Path,
-        prompt: str
+        prompt: str,
+        force_refresh: bool = False
     ) -> dict:
         """
         Main entry point: Process PDF with two-pass OCR strategy
 
         Workflow:
         1. Detect scanned pages
-        2. If scanned pages found: Run Pass 1 (OCR extraction)
+        2. If scanned pages found: Run Pass 1 (OCR extraction) while the
+           full PDF is uploaded for Pass 2
         3. Run Pass 2 (analysis with OCR context)
         4. Return result with two_pass_metadata
 
@@ -465,6 +920,7 @@ class TwoPassOCRProcessor:
         Args:
             pdf_path: Path to PDF file
             prompt: Base analysis prompt
+            force_refresh: Re-run OCR for pages found in the Pass 1 cache
 
         Returns:
             {
@@ -495,13 +951,9 @@ class TwoPassOCRProcessor:
         )
 
         try:
-            # Step 1: Detect scanned pages
-            scanned_pages = self.detect_scanned_pages(pdf_path)
-
-            # Get total page count
-            doc = fitz.open(pdf_path)
-            total_pages = len(doc)
-            doc.close()
+            # Step 1: Detect scanned pages (classification also gives page count)
+            scanned_pages, classification = self._detect_scanned_pages(pdf_path)
+            total_pages = classification.total_pages
 
             # If no scanned pages, use normal processing
             if not scanned_pages:
@@ -517,14 +969,21 @@ class TwoPassOCRProcessor:
                     process_start_time=process_start_time
                 )
 
-            # Step 2: OCR extraction (Pass 1)
+            # Read the PDF once: Pass 1 splits, the OCR cache key and the
+            # Pass 2 upload all use these bytes
+            pdf_bytes = pdf_path.read_bytes()
+
+            # Step 2: OCR extraction (Pass 1), uploading the PDF for Pass 2
+            # in the background meanwhile
             ocr_start_time = time.time()
-            ocr_context = self.extract_text_pass(pdf_path, scanned_pages)
+            ocr_context, attachment_id = asyncio.run(
+                self._ocr_and_upload_async(pdf_path, scanned_pages, force_refresh, pdf_bytes)
+            )
             ocr_duration = time.time() - ocr_start_time
 
             # Step 3: Analysis with OCR context (Pass 2)
             analysis_start_time = time.time()
-            result_data = self.analysis_pass(pdf_path, prompt, ocr_context)
+            result_data = self.analysis_pass(pdf_path, prompt, ocr_context, attachment_id)
             analysis_duration = time.time() - analysis_start_time
 
             total_duration = time.time() - process_start_time
@@ -537,7 +996,7 @@ class TwoPassOCRProcessor:
                 "detection_method": "pymupdf_text_threshold",
                 "text_threshold": self.text_threshold,
                 "ocr_model": self.ocr_model_config.model,
-                "ocr_api_calls": len(scanned_pages),
+                "ocr_api_calls": len(self._page_batches(scanned_pages)),
                 "ocr_duration_seconds": round(ocr_duration, 2),
                 "analysis_duration_seconds": round(analysis_duration, 2),
                 "total_duration_seconds": round(total_duration, 2)
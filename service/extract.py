@@ -0,0 +1,310 @@
+"""
+Synchronous Extraction Endpoints
+================================
+
+/api/v1/extract and its NDJSON streaming variant. Both save the upload to
+UPLOAD_TMP_DIR, pick the processor for the requested quality/model and
+share one result cache keyed by content hash, quality and model.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+from typing import Any
+
+import orjson
+from fastapi import APIRouter, File, HTTPException, Query, UploadFile
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from service.cache import LRUCache
+from service.responses import ORJSONResponse
+from service.uploads import is_pdf_filename, new_upload_path, save_upload
+from text_extraction import TwoPassProcessor
+from text_extraction.backends import PageOCRResult
+from text_extraction.models import ExtractionResult, QualityLevel
+
+# ============================================================================
+# Pydantic Models
+# ============================================================================
+
+
+class BackendStatusResponse(BaseModel):
+    """OCR backend status in extraction response."""
+
+    primary_backend: str
+    primary_available: bool
+    fallback_backend: str | None = None
+    fallback_available: bool = False
+    attempted_pages: int = 0
+    successful_pages: int = 0
+    failed_pages: int = 0
+
+
+class PageErrorResponse(BaseModel):
+    """Error from a specific page during OCR extraction."""
+
+    page_number: int
+    backend: str
+    error: str
+
+
+class ExtractionResponse(BaseModel):
+    """Text extraction response."""
+
+    success: bool
+    file_name: str
+    pdf_type: str
+    total_pages: int
+    text: str
+    word_count: int
+    confidence: float
+    processing_time_ms: float
+    extraction_method: str
+    backend_status: BackendStatusResponse | None = None
+    page_errors: list[PageErrorResponse] = []
+
+
+class ErrorResponse(BaseModel):
+    """Error response."""
+
+    success: bool = False
+    error: str
+    detail: str | None = None
+
+
+def _extraction_payload(result: ExtractionResult, file_name: str | None) -> dict:
+    """ExtractionResponse fields for a successful result."""
+    # BackendStatus/PageError dataclasses serialize natively with orjson
+    return {
+        "success": True,
+        "file_name": file_name,
+        "pdf_type": result.pdf_type,
+        "total_pages": result.total_pages,
+        "text": result.text,
+        "word_count": result.word_count,
+        "confidence": result.confidence,
+        "processing_time_ms": result.processing_time_ms,
+        "extraction_method": result.extraction_method,
+        "backend_status": result.backend_status,
+        "page_errors": result.page_errors,
+    }
+
+
+def _ndjson(value: Any) -> bytes:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+
+
+def create_router(
+    get_processor_fn: Callable[[str | None], TwoPassProcessor],
+    direct_processor: TwoPassProcessor,
+    cache: LRUCache,
+) -> APIRouter:
+    """
+    Create the synchronous extraction APIRouter.
+
+    ``quality=fast`` never OCRs, so it runs on ``direct_processor`` without
+    building a backend; other requests use ``get_processor_fn(model)``.
+    Successful results without page errors are kept in ``cache``.
+    """
+    router = APIRouter(tags=["Extraction"])
+
+    async def prepare_upload(
+        file: UploadFile, quality: str, model: str | None
+    ) -> tuple[Path, str, TwoPassProcessor]:
+        """
+        Save the upload and resolve its cache key and processor.
+
+        Returns (upload path, cache key, processor); the caller deletes the
+        file. Backend setup blocks, so it runs in a thread.
+        """
+        tmp_path = new_upload_path()
+        try:
+            digest = await save_upload(file, tmp_path)
+            if quality == "fast":
+                processor = direct_processor
+            else:
+                processor = await asyncio.to_thread(get_processor_fn, model)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return tmp_path, f"{digest}:{quality}:{model or ''}", processor
+
+    @router.post(
+        "/api/v1/extract",
+        responses={
+            200: {"model": ExtractionResponse},
+            400: {"model": ErrorResponse},
+            500: {"model": ErrorResponse},
+        },
+    )
+    async def extract_text(
+        file: UploadFile = File(..., description="PDF file to extract text from"),
+        quality: QualityLevel = Query(
+            default="balanced",
+            description="Quality preference: fast, balanced, accurate",
+        ),
+        model: str | None = Query(
+            default=None,
+            description=(
+                "OCR model override. "
+                "Default: claude-sonnet-4-5@20250929. "
+                "Available: claude-sonnet-4-5@20250929, claude-haiku-4-5@20251001, "
+                "claude-opus-4-5@20251101, claude-opus-4-6@default, "
+                "gemini-2.5-flash, gemini-2.5-pro, "
+                "gpt-5-mini-eu, gpt-5.1, gpt-5.2, gpt-5.2-pro, "
+                "tesseract (free, local, ~2s/page)"
+            ),
+        ),
+    ) -> ORJSONResponse:
+        """
+        Extract text from a PDF file.
+
+        **Quality options:**
+        - **fast**: Direct extraction only, no OCR
+        - **balanced**: OCR for image pages only (default)
+        - **accurate**: Full OCR verification for all pages
+
+        **Available OCR models** (EU region, only used when OCR is triggered):
+
+        | Model | Provider | Notes |
+        |-------|----------|-------|
+        | `claude-sonnet-4-5@20250929` | Anthropic | **Default** - Best quality/cost ratio |
+        | `claude-haiku-4-5@20251001` | Anthropic | Fastest, lowest cost |
+        | `claude-opus-4-5@20251101` | Anthropic | Highest quality |
+        | `claude-opus-4-6@default` | Anthropic | Latest Opus |
+        | `gemini-2.5-flash` | Google | Fast, good quality |
+        | `gemini-2.5-pro` | Google | High quality |
+        | `gpt-5-mini-eu` | OpenAI | Fast, EU-hosted |
+        | `gpt-5.1` | OpenAI | Good quality |
+        | `gpt-5.2` | OpenAI | Latest GPT |
+        | `gpt-5.2-pro` | OpenAI | Highest OpenAI quality |
+        | `tesseract` | Local | Free, ~2s/page, no API key needed |
+
+        Use **GET /api/v1/models** for the live list from the API.
+        """
+        if not is_pdf_filename(file.filename):
+            raise HTTPException(status_code=400, detail="Only PDF files are supported")
+
+        try:
+            tmp_path, cache_key, processor = await prepare_upload(file, quality, model)
+            try:
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    return ORJSONResponse(_extraction_payload(cached, file.filename))
+
+                # PDF parsing and OCR calls block, so run them in a thread
+                result = await asyncio.to_thread(
+                    processor.extract, tmp_path, quality=quality, model=model
+                )
+
+                if not result.success:
+                    raise HTTPException(
+                        status_code=500,
+                        detail=result.error or "Extraction failed"
+                    )
+                # Pages that failed OCR may succeed on retry; don't pin them
+                if not result.page_errors:
+                    cache.put(cache_key, result)
+
+                return ORJSONResponse(_extraction_payload(result, file.filename))
+            finally:
+                tmp_path.unlink(missing_ok=True)
+
+        except FileNotFoundError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Extraction failed: {str(e)}")
+
+    @router.post(
+        "/api/v1/extract/stream",
+        responses={
+            200: {"content": {"application/x-ndjson": {}}},
+            400: {"model": ErrorResponse},
+            500: {"model": ErrorResponse},
+        },
+    )
+    async def extract_text_stream(
+        file: UploadFile = File(..., description="PDF file to extract text from"),
+        quality: QualityLevel = Query(
+            default="balanced",
+            description="Quality preference: fast, balanced, accurate",
+        ),
+        model: str | None = Query(
+            default=None,
+            description="OCR model override (same values as /api/v1/extract)",
+        ),
+    ) -> StreamingResponse:
+        """
+        Extract text from a PDF file, streaming pages as NDJSON.
+
+        Each page is sent as one JSON line (`page_number`, `text`, `confidence`,
+        `method`, `word_count`, ...) as soon as it is done, in completion order.
+        The last line carries `"done": true` and the /api/v1/extract summary
+        fields without `text`, or `"success": false` and `error` if extraction
+        failed part-way.
+        """
+        if not is_pdf_filename(file.filename):
+            raise HTTPException(status_code=400, detail="Only PDF files are supported")
+
+        try:
+            tmp_path, cache_key, processor = await prepare_upload(file, quality, model)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Extraction failed: {str(e)}")
+
+        file_name = file.filename
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[PageOCRResult | None] = asyncio.Queue()
+
+        def on_page(page: PageOCRResult) -> None:
+            loop.call_soon_threadsafe(queue.put_nowait, page)
+
+        async def lines() -> AsyncIterator[bytes]:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                tmp_path.unlink(missing_ok=True)
+                for page in cached.pages:
+                    yield _ndjson(page)
+                result = cached
+            else:
+                task = asyncio.ensure_future(
+                    asyncio.to_thread(
+                        processor.extract,
+                        tmp_path,
+                        quality=quality,
+                        model=model,
+                        page_callback=on_page,
+                    )
+                )
+                # Pages queued by the worker thread are delivered before this
+                # sentinel; the file is kept until extraction ends even if the
+                # client disconnects
+                task.add_done_callback(lambda _: queue.put_nowait(None))
+                task.add_done_callback(lambda _: tmp_path.unlink(missing_ok=True))
+
+                while (page := await queue.get()) is not None:
+                    yield _ndjson(page)
+                try:
+                    result = task.result()
+                except Exception as e:
+                    yield _ndjson({"done": True, "success": False, "error": str(e)})
+                    return
+                if not result.success:
+                    yield _ndjson(
+                        {
+                            "done": True,
+                            "success": False,
+                            "error": result.error or "Extraction failed",
+                        }
+                    )
+                    return
+                if not result.page_errors:
+                    cache.put(cache_key, result)
+
+            summary = _extraction_payload(result, file_name)
+            del summary["text"]
+            yield _ndjson({**summary, "done": True})
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    return router
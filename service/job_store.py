@@ -0,0 +1,213 @@
+"""
+Async Job Storage
+=================
+
+Job model and the job store interface, with the in-memory store used for
+development and single-instance deployments.
+"""
+
+import copy
+import heapq
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+JOB_EXPIRY_HOURS = 24
+# Async uploads and results share one directory, files are named by job ID
+JOB_UPLOAD_DIR = Path(tempfile.gettempdir()) / "textextract"
+
+
+class JobStatus(str, Enum):
+    """Status of an async extraction job."""
+
+    PENDING = "pending"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class Job:
+    """Internal job representation."""
+
+    __slots__ = (
+        "job_id",
+        "file_name",
+        "file_path",
+        "quality",
+        "model",
+        "callback_url",
+        "status",
+        "progress",
+        "created_at",
+        "started_at",
+        "completed_at",
+        "processing_time_ms",
+        "result_path",
+        "error",
+        "content_hash",
+    )
+
+    def __init__(
+        self,
+        job_id: str,
+        file_name: str,
+        file_path: Path,
+        quality: str,
+        model: str | None = None,
+        callback_url: str | None = None,
+        content_hash: str | None = None,
+    ):
+        self.job_id = job_id
+        self.file_name = file_name
+        self.file_path = file_path
+        self.quality = quality
+        self.model = model
+        self.callback_url = callback_url
+        self.status = JobStatus.PENDING
+        self.progress = 0
+        self.created_at = datetime.utcnow()
+        self.started_at: datetime | None = None
+        self.completed_at: datetime | None = None
+        self.processing_time_ms: float | None = None
+        self.result_path: Path | None = None
+        self.error: str | None = None
+        # Upload digest + options, used to reuse results of identical uploads
+        self.content_hash = content_hash
+
+    @property
+    def result(self) -> dict[str, Any] | None:
+        """Extraction result, read lazily from ``result_path``."""
+        if self.result_path is None or not self.result_path.exists():
+            return None
+        return orjson.loads(self.result_path.read_bytes())
+
+    @result.setter
+    def result(self, value: dict[str, Any] | None) -> None:
+        """
+        Spill the result to a JSON file next to the upload (keeps RAM flat).
+
+        The file is encoded once here and served as-is by the result endpoint.
+        """
+        if value is None:
+            if self.result_path is not None:
+                self.result_path.unlink(missing_ok=True)
+            self.result_path = None
+            return
+        path = self.file_path.with_suffix(".result.json")
+        path.write_bytes(orjson.dumps(value))
+        self.result_path = path
+
+
+def apply_updates(job: Job, updates: dict[str, Any]) -> None:
+    """Set job attributes; the result is written first so COMPLETED implies a result."""
+    if "result" in updates:
+        job.result = updates.pop("result")
+    for key, value in updates.items():
+        if hasattr(job, key):
+            setattr(job, key, value)
+
+
+def _remove_job_files(job: Job) -> None:
+    """Delete a job's upload and result file."""
+    job.file_path.unlink(missing_ok=True)
+    if job.result_path is not None:
+        job.result_path.unlink(missing_ok=True)
+
+
+class JobStore(ABC):
+    """Abstract job storage. Extend with RedisJobStore for production."""
+
+    @abstractmethod
+    def create(self, job: Job) -> str: ...
+
+    @abstractmethod
+    def get(self, job_id: str) -> Job | None: ...
+
+    @abstractmethod
+    def update(self, job_id: str, **kwargs: Any) -> None: ...
+
+    @abstractmethod
+    def cleanup_expired(self) -> int: ...
+
+    @abstractmethod
+    def get_by_hash(self, content_hash: str) -> Job | None: ...
+
+
+class InMemoryJobStore(JobStore):
+    """
+    Simple in-memory job storage for development.
+
+    Thread-safe: jobs are updated from executor threads while request handlers
+    read them, so all access goes through one lock and ``get`` returns a
+    snapshot that never reflects a half-applied update.
+    """
+
+    def __init__(self) -> None:
+        self._jobs: dict[str, Job] = {}
+        # Min-heap of (created_at, job_id): cleanup pops only expired entries
+        self._expiry_heap: list[tuple[datetime, str]] = []
+        # content_hash -> job_id, for reusing results of identical uploads
+        self._hash_index: dict[str, str] = {}
+        self._lock = threading.RLock()
+
+    def create(self, job: Job) -> str:
+        with self._lock:
+            self._jobs[job.job_id] = job
+            heapq.heappush(self._expiry_heap, (job.created_at, job.job_id))
+            if job.content_hash:
+                self._hash_index[job.content_hash] = job.job_id
+        return job.job_id
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return copy.copy(job) if job is not None else None
+
+    def update(self, job_id: str, **kwargs: Any) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return
+        if "result" in kwargs:
+            # Write the (possibly large) result file before taking the lock
+            staged = copy.copy(job)
+            staged.result = kwargs.pop("result")
+            kwargs["result_path"] = staged.result_path
+        with self._lock:
+            apply_updates(job, kwargs)
+
+    def cleanup_expired(self) -> int:
+        """Remove jobs older than JOB_EXPIRY_HOURS (O(k log N) for k expired jobs)."""
+        cutoff = datetime.utcnow() - timedelta(hours=JOB_EXPIRY_HOURS)
+        expired: list[Job] = []
+        with self._lock:
+            heap = self._expiry_heap
+            while heap and heap[0][0] < cutoff:
+                created_at, jid = heapq.heappop(heap)
+                job = self._jobs.get(jid)
+                if job is None:
+                    continue
+                if job.created_at != created_at:
+                    # created_at changed after create(); re-queue at its real time
+                    heapq.heappush(heap, (job.created_at, jid))
+                    continue
+                job = self._jobs.pop(jid)
+                if job.content_hash and self._hash_index.get(job.content_hash) == jid:
+                    del self._hash_index[job.content_hash]
+                expired.append(job)
+
+        # File deletion happens outside the lock
+        for job in expired:
+            _remove_job_files(job)
+        return len(expired)
+
+    def get_by_hash(self, content_hash: str) -> Job | None:
+        with self._lock:
+            job_id = self._hash_index.get(content_hash)
+            return self.get(job_id) if job_id is not None else None
@@ -8,30 +8,55 @@ and optional webhook notifications.
 
 import asyncio
 import logging
-import tempfile
+import time
 import uuid
-from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
-from enum import Enum
+from concurrent.futures import Executor
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import requests as http_requests
+import fitz  # PyMuPDF
 from fastapi import APIRouter, File, HTTPException, Query, UploadFile
+from fastapi.responses import FileResponse
 from pydantic import BaseModel
 
-logger = logging.getLogger(__name__)
-
-JOB_EXPIRY_HOURS = 24
-
+from service.job_store import (
+    JOB_EXPIRY_HOURS,
+    JOB_UPLOAD_DIR,
+    InMemoryJobStore,
+    Job,
+    JobStatus,
+    JobStore,
+)
+from service.redis_store import RedisJobStore
+from service.responses import ORJSONResponse
+from service.uploads import is_pdf_filename, save_upload
+from service.webhooks import close_webhook_client, send_webhook, set_server_loop
+from text_extraction.backends.base import FITZ_LOCK
+from text_extraction.models import QualityLevel
+
+# Job storage and webhooks live in their own modules; re-exported here so
+# callers keep importing the async-jobs API from one place
+__all__ = [
+    "JOB_EXPIRY_HOURS",
+    "AsyncExtractionResponse",
+    "InMemoryJobStore",
+    "Job",
+    "JobResponse",
+    "JobStatus",
+    "JobStore",
+    "RedisJobStore",
+    "close_webhook_client",
+    "create_router",
+    "process_job",
+    "run_cleanup_loop",
+]
 
-class JobStatus(str, Enum):
-    """Status of an async extraction job."""
+logger = logging.getLogger(__name__)
 
-    PENDING = "pending"
-    PROCESSING = "processing"
-    COMPLETED = "completed"
-    FAILED = "failed"
+JOB_CLEANUP_INTERVAL_SECONDS = 900
+# Jobs with more pages than this run on the large-job executor (if configured)
+LARGE_JOB_PAGES = 50
 
 
 class JobResponse(BaseModel):
@@ -57,82 +82,19 @@ class AsyncExtractionResponse(BaseModel):
     result_url: str
 
 
-class Job:
-    """Internal job representation."""
-
-    def __init__(
-        self,
-        job_id: str,
-        file_name: str,
-        file_path: Path,
-        quality: str,
-        model: str | None = None,
-        callback_url: str | None = None,
-    ):
-        self.job_id = job_id
-        self.file_name = file_name
-        self.file_path = file_path
-        self.quality = quality
-        self.model = model
-        self.callback_url = callback_url
-        self.status = JobStatus.PENDING
-        self.progress = 0
-        self.created_at = datetime.utcnow()
-        self.started_at: datetime | None = None
-        self.completed_at: datetime | None = None
-        self.processing_time_ms: float | None = None
-        self.result: dict[str, Any] | None = None
-        self.error: str | None = None
-
-
-class JobStore(ABC):
-    """Abstract job storage. Extend with RedisJobStore for production."""
-
-    @abstractmethod
-    def create(self, job: Job) -> str: ...
-
-    @abstractmethod
-    def get(self, job_id: str) -> Job | None: ...
-
-    @abstractmethod
-    def update(self, job_id: str, **kwargs: Any) -> None: ...
-
-    @abstractmethod
-    def cleanup_expired(self) -> int: ...
-
-
-class InMemoryJobStore(JobStore):
-    """Simple in-memory job storage for development."""
-
-    def __init__(self) -> None:
-        self._jobs: dict[str, Job] = {}
-
-    def create(self, job: Job) -> str:
-        self._jobs[job.job_id] = job
-        return job.job_id
-
-    def get(self, job_id: str) -> Job | None:
-        return self._jobs.get(job_id)
-
-    def update(self, job_id: str, **kwargs: Any) -> None:
-        job = self._jobs.get(job_id)
-        if job is None:
-            return
-        for key, value in kwargs.items():
-            if hasattr(job, key):
-                setattr(job, key, value)
-
-    def cleanup_expired(self) -> int:
-        """Remove jobs older than JOB_EXPIRY_HOURS."""
-        cutoff = datetime.utcnow() - timedelta(hours=JOB_EXPIRY_HOURS)
-        expired = [
-            jid for jid, job in self._jobs.items() if job.created_at < cutoff
-        ]
-        for jid in expired:
-            job = self._jobs.pop(jid)
-            if job.file_path.exists():
-                job.file_path.unlink(missing_ok=True)
-        return len(expired)
+async def run_cleanup_loop(
+    store: JobStore, interval: float = JOB_CLEANUP_INTERVAL_SECONDS
+) -> None:
+    """Periodically remove expired jobs (run as an application background task)."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            removed = await asyncio.to_thread(store.cleanup_expired)
+        except Exception:
+            logger.exception("Expired job cleanup failed")
+            continue
+        if removed:
+            logger.info("Removed %d expired jobs", removed)
 
 
 def _serialize_result(result: Any) -> dict[str, Any]:
@@ -174,8 +136,22 @@ def _serialize_result(result: Any) -> dict[str, Any]:
     return result_dict
 
 
-def process_job(job: Job, store: JobStore, get_processor_fn: Any) -> None:
-    """Process an extraction job in the background."""
+def process_job(
+    job: Job,
+    store: JobStore,
+    get_processor_fn: Any,
+    loop: asyncio.AbstractEventLoop | None = None,
+) -> None:
+    """
+    Process an extraction job in the background.
+
+    If ``loop`` is given, the webhook is scheduled on it (non-blocking);
+    otherwise it is delivered before returning.
+
+    ``processing_time_ms`` is measured with the monotonic perf counter; the
+    wall-clock ``started_at``/``completed_at`` are only kept for display.
+    """
+    start_ns = time.perf_counter_ns()
     store.update(
         job.job_id,
         status=JobStatus.PROCESSING,
@@ -183,12 +159,20 @@ def process_job(job: Job, store: JobStore, get_processor_fn: Any) -> None:
         progress=10,
     )
 
+    def elapsed_ms() -> float:
+        return (time.perf_counter_ns() - start_ns) / 1e6
+
+    def report_progress(completed_pages: int, total_pages: int) -> None:
+        if total_pages:
+            store.update(job.job_id, progress=10 + completed_pages * 85 // total_pages)
+
     try:
         processor = get_processor_fn(model=job.model)
         result = processor.extract(
             job.file_path,
             quality=job.quality,
             model=job.model,
+            progress_callback=report_progress,
         )
 
         if result.success:
@@ -197,8 +181,9 @@ def process_job(job: Job, store: JobStore, get_processor_fn: Any) -> None:
                 status=JobStatus.COMPLETED,
                 completed_at=datetime.utcnow(),
                 progress=100,
-                processing_time_ms=result.processing_time_ms,
-                result=_serialize_result(result),
+                processing_time_ms=elapsed_ms(),
+                # Uploads are stored as <job_id>.pdf; report the client's name
+                result={**_serialize_result(result), "file_name": job.file_name},
             )
         else:
             store.update(
@@ -206,6 +191,7 @@ def process_job(job: Job, store: JobStore, get_processor_fn: Any) -> None:
                 status=JobStatus.FAILED,
                 completed_at=datetime.utcnow(),
                 progress=100,
+                processing_time_ms=elapsed_ms(),
                 error=result.error or "Extraction failed",
             )
 
@@ -216,6 +202,7 @@ def process_job(job: Job, store: JobStore, get_processor_fn: Any) -> None:
             status=JobStatus.FAILED,
             completed_at=datetime.utcnow(),
             progress=100,
+            processing_time_ms=elapsed_ms(),
             error=str(e),
         )
 
@@ -225,67 +212,110 @@ def process_job(job: Job, store: JobStore, get_processor_fn: Any) -> None:
 
     # Send webhook notification if configured
     if job.callback_url:
-        _send_webhook(job, store)
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(send_webhook(job, store), loop)
+        else:
+            asyncio.run(send_webhook(job, store))
 
 
-def _send_webhook(job: Job, store: JobStore) -> None:
-    """Send webhook notification for completed/failed job."""
-    updated_job = store.get(job.job_id)
-    if updated_job is None or not updated_job.callback_url:
-        return
+# Strong references to webhook tasks started from request handlers
+_webhook_tasks: set[asyncio.Task] = set()
 
-    payload = {
-        "job_id": updated_job.job_id,
-        "status": updated_job.status.value,
-        "file_name": updated_job.file_name,
-    }
 
+def _count_pages(pdf_path: Path) -> int:
+    """Return the page count of a PDF, or 0 if it cannot be opened."""
     try:
-        http_requests.post(updated_job.callback_url, json=payload, timeout=10)
-        logger.info("Webhook sent for job %s to %s", job.job_id, job.callback_url)
-    except Exception as e:
-        logger.warning("Webhook failed for job %s: %s", job.job_id, e)
-
-
-def create_router(store: JobStore, get_processor_fn: Any) -> APIRouter:
-    """Create the async jobs APIRouter."""
+        with FITZ_LOCK, fitz.open(pdf_path) as doc:
+            return doc.page_count
+    except Exception:
+        return 0
+
+
+def create_router(
+    store: JobStore,
+    get_processor_fn: Any,
+    executor: Executor | None = None,
+    large_executor: Executor | None = None,
+    upload_dir: Path = JOB_UPLOAD_DIR,
+) -> APIRouter:
+    """
+    Create the async jobs APIRouter.
+
+    Jobs run on ``executor`` (default: the event loop's default executor).
+    If ``large_executor`` is given, PDFs with more than LARGE_JOB_PAGES pages
+    run there instead, so a few huge documents cannot occupy every worker
+    needed by small ones.
+
+    Uploads are written to ``upload_dir`` (created once, here) as
+    ``<job_id>.pdf`` instead of a fresh temp directory per job.
+    """
     router = APIRouter(tags=["Async Jobs"])
+    upload_dir.mkdir(parents=True, exist_ok=True)
 
     @router.post(
         "/api/v1/extract/async",
-        response_model=AsyncExtractionResponse,
+        response_class=ORJSONResponse,
+        responses={202: {"model": AsyncExtractionResponse}},
         status_code=202,
     )
     async def extract_async(
         file: UploadFile = File(..., description="PDF file to extract text from"),
-        quality: str = Query(
+        quality: QualityLevel = Query(
             default="balanced",
             description="Quality: fast, balanced, accurate",
-            pattern="^(fast|balanced|accurate)$",
         ),
         model: str | None = Query(default=None, description="OCR model override"),
         callback_url: str | None = Query(
             default=None, description="Webhook URL for completion notification"
         ),
-    ) -> AsyncExtractionResponse:
+    ) -> ORJSONResponse:
         """
         Start an async text extraction job.
 
         Returns a job ID immediately. Poll the status URL for progress.
         For small PDFs (<5 pages), prefer the synchronous `/api/v1/extract`.
+
+        Re-uploading an identical PDF with the same options while its job is
+        retained returns the completed job (HTTP 200, `X-Cache: HIT`).
         """
-        if not file.filename or not file.filename.lower().endswith(".pdf"):
+        if not is_pdf_filename(file.filename):
             raise HTTPException(status_code=400, detail="Only PDF files are supported")
 
-        store.cleanup_expired()
-
         # Save file to persistent temp location (not auto-deleted)
-        tmp_dir = Path(tempfile.mkdtemp(prefix="textextract_"))
-        tmp_path = tmp_dir / (file.filename or "upload.pdf")
-        content = await file.read()
-        tmp_path.write_bytes(content)
+        job_id = uuid.uuid4().hex
+        tmp_path = upload_dir / f"{job_id}.pdf"
+        digest = await save_upload(file, tmp_path)
+
+        loop = asyncio.get_running_loop()
+        set_server_loop(loop)
+
+        # Identical upload with the same options already extracted: reuse it
+        content_hash = f"{digest}:{quality}:{model or ''}"
+        cached = store.get_by_hash(content_hash)
+        if (
+            cached is not None
+            and cached.status == JobStatus.COMPLETED
+            and cached.result_path is not None
+            and cached.result_path.exists()
+        ):
+            await asyncio.to_thread(tmp_path.unlink, True)
+            if callback_url:
+                task = asyncio.create_task(
+                    send_webhook(cached, store, callback_url=callback_url)
+                )
+                _webhook_tasks.add(task)
+                task.add_done_callback(_webhook_tasks.discard)
+            logger.info("Async job %s reused for %s", cached.job_id, file.filename)
+            return ORJSONResponse(
+                {
+                    "job_id": cached.job_id,
+                    "status": JobStatus.COMPLETED.value,
+                    "status_url": f"/api/v1/jobs/{cached.job_id}",
+                    "result_url": f"/api/v1/jobs/{cached.job_id}/result",
+                },
+                headers={"X-Cache": "HIT"},
+            )
 
-        job_id = str(uuid.uuid4())
         job = Job(
             job_id=job_id,
             file_name=file.filename or "upload.pdf",
@@ -293,42 +323,54 @@ def create_router(store: JobStore, get_processor_fn: Any) -> APIRouter:
             quality=quality,
             model=model,
             callback_url=callback_url,
+            content_hash=content_hash,
         )
         store.create(job)
 
-        loop = asyncio.get_event_loop()
-        loop.run_in_executor(None, process_job, job, store, get_processor_fn)
+        job_executor = executor
+        if large_executor is not None:
+            page_count = await asyncio.to_thread(_count_pages, tmp_path)
+            if page_count > LARGE_JOB_PAGES:
+                job_executor = large_executor
+        loop.run_in_executor(job_executor, process_job, job, store, get_processor_fn, loop)
 
         logger.info("Async job %s created for %s", job_id, file.filename)
 
-        return AsyncExtractionResponse(
-            job_id=job_id,
-            status=JobStatus.PENDING,
-            status_url=f"/api/v1/jobs/{job_id}",
-            result_url=f"/api/v1/jobs/{job_id}/result",
+        return ORJSONResponse(
+            {
+                "job_id": job_id,
+                "status": JobStatus.PENDING.value,
+                "status_url": f"/api/v1/jobs/{job_id}",
+                "result_url": f"/api/v1/jobs/{job_id}/result",
+            },
+            status_code=202,
         )
 
-    @router.get("/api/v1/jobs/{job_id}", response_model=JobResponse)
-    async def get_job_status(job_id: str) -> JobResponse:
+    @router.get(
+        "/api/v1/jobs/{job_id}",
+        response_class=ORJSONResponse,
+        responses={200: {"model": JobResponse}},
+    )
+    async def get_job_status(job_id: str) -> ORJSONResponse:
         """Get status and progress of an async extraction job."""
         job = store.get(job_id)
         if job is None:
             raise HTTPException(status_code=404, detail="Job not found")
 
-        return JobResponse(
-            job_id=job.job_id,
-            status=job.status,
-            file_name=job.file_name,
-            progress=job.progress,
-            created_at=job.created_at.isoformat(),
-            started_at=job.started_at.isoformat() if job.started_at else None,
-            completed_at=job.completed_at.isoformat() if job.completed_at else None,
-            processing_time_ms=job.processing_time_ms,
-            error=job.error,
-        )
+        return ORJSONResponse({
+            "job_id": job.job_id,
+            "status": job.status.value,
+            "file_name": job.file_name,
+            "progress": job.progress,
+            "created_at": job.created_at.isoformat(),
+            "started_at": job.started_at.isoformat() if job.started_at else None,
+            "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+            "processing_time_ms": job.processing_time_ms,
+            "error": job.error,
+        })
 
     @router.get("/api/v1/jobs/{job_id}/result")
-    async def get_job_result(job_id: str) -> dict[str, Any]:
+    async def get_job_result(job_id: str) -> FileResponse:
         """Get extraction result for a completed job. Returns 409 if still processing."""
         job = store.get(job_id)
         if job is None:
@@ -345,9 +387,9 @@ def create_router(store: JobStore, get_processor_fn: Any) -> APIRouter:
                 status_code=500, detail=job.error or "Extraction failed"
             )
 
-        if job.result is None:
+        if job.result_path is None or not job.result_path.exists():
             raise HTTPException(status_code=500, detail="Result not available")
 
-        return job.result
+        return FileResponse(job.result_path, media_type="application/json")
 
     return router
@@ -4,17 +4,25 @@ Text Extraction Service - FastAPI Application
 Minimal REST API for PDF text extraction and classification.
 """
 
+import asyncio
+import contextlib
+import hashlib
+import importlib
 import logging
 import os
-import tempfile
+import threading
 import time
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
 import requests as http_requests
 from dotenv import load_dotenv
-from fastapi import FastAPI, File, HTTPException, Query, UploadFile
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, File, HTTPException, UploadFile
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
+from starlette.formparsers import MultiPartParser
+from urllib3.util.retry import Retry
 
 load_dotenv()
 logging.basicConfig(
@@ -28,9 +36,42 @@ from text_extraction import (
     ProcessorConfig,
     TwoPassProcessor,
 )
-from text_extraction.backends import GeminiBackend, LangdockBackend, TesseractBackend
+from text_extraction.backends import BaseOCRBackend
+
+from service import extract, jobs
+from service.cache import LRUCache
+from service.extract import ErrorResponse
+from service.jobs import (
+    InMemoryJobStore,
+    JobStore,
+    RedisJobStore,
+    close_webhook_client,
+    run_cleanup_loop,
+)
+from service.responses import ORJSONResponse
+from service.uploads import UPLOAD_SPOOL_MAX_SIZE, is_pdf_filename
+
+if TYPE_CHECKING:
+    # Imported on first use instead. This only defers google-genai,
+    # pytesseract and PIL with WARMUP_ENABLED=false (warmup imports them and
+    # builds every processor at startup) and for library-only imports
+    from text_extraction.backends import GeminiBackend, LangdockBackend, TesseractBackend
+
+logger = logging.getLogger(__name__)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up backends, run the expired-job sweep; release resources on shutdown."""
+    if WARMUP_ENABLED:
+        await asyncio.get_running_loop().run_in_executor(_extract_pool, _warmup)
+    cleanup_task = asyncio.create_task(run_cleanup_loop(_job_store))
+    yield
+    cleanup_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await cleanup_task
+    await close_webhook_client()
 
-from service.jobs import InMemoryJobStore, create_router
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -39,21 +80,98 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
+    # Endpoints return plain dicts; serialize them with orjson, no model validation
+    default_response_class=ORJSONResponse,
 )
 
+# Extracted text compresses well (~4-6x); small bodies aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+MultiPartParser.spool_max_size = UPLOAD_SPOOL_MAX_SIZE
+
+# Processes for classifying large PDFs; the library defaults to serial
+DETECTOR_WORKERS = int(os.getenv("DETECTOR_WORKERS", str((os.cpu_count() or 1) // 2)))
+
 # Initialize detector, OCR backends, and job store
-detector = PDFTypeDetector()
-_job_store = InMemoryJobStore()
+detector = PDFTypeDetector(n_workers=DETECTOR_WORKERS)
+_job_store: JobStore = (
+    RedisJobStore(os.environ["REDIS_URL"]) if os.getenv("REDIS_URL") else InMemoryJobStore()
+)
+
+# Dedicated pool for async extraction jobs, so long-running jobs cannot starve
+# the default executor used for other blocking calls (workers are joined at
+# interpreter exit by concurrent.futures)
+EXTRACT_WORKERS = int(os.getenv("EXTRACT_WORKERS", str(min(32, (os.cpu_count() or 1) + 4))))
+_extract_pool = ThreadPoolExecutor(max_workers=EXTRACT_WORKERS, thread_name_prefix="extract")
+# Separate, smaller pool for documents above LARGE_JOB_PAGES pages
+EXTRACT_LARGE_WORKERS = int(os.getenv("EXTRACT_LARGE_WORKERS", str(os.cpu_count() or 1)))
+_extract_large_pool = ThreadPoolExecutor(
+    max_workers=EXTRACT_LARGE_WORKERS, thread_name_prefix="extract-large"
+)
+
+# Build processors and open outbound connections at startup instead of on the
+# first request (set WARMUP_ENABLED=false to skip, e.g. for local development)
+WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "true").lower() in ("1", "true", "yes")
+WARMUP_MODELS = (None, "gemini-2.5-flash", "tesseract")
+# Heavy modules that backends otherwise import lazily on their first page
+WARMUP_IMPORTS = ("fitz", "PIL.Image", "google.genai")
 
 # Initialize OCR backends (lazy - check availability on use)
 # Note: get_processor is defined below, router registered after function definition
-_langdock_backend: LangdockBackend | None = None
-_gemini_backend: GeminiBackend | None = None
-_tesseract_backend: TesseractBackend | None = None
+_langdock_backend: "LangdockBackend | None" = None
+_gemini_backend: "GeminiBackend | None" = None
+_tesseract_backend: "TesseractBackend | None" = None
 _langdock_processor: TwoPassProcessor | None = None
 _gemini_processor: TwoPassProcessor | None = None
 _tesseract_processor: TwoPassProcessor | None = None
 
+# quality=fast never OCRs, so it doesn't need any backend constructed
+_direct_processor = TwoPassProcessor(
+    primary_backend=None,
+    fallback_backend=None,
+    config=ProcessorConfig(include_page_markers=True, detector_workers=DETECTOR_WORKERS),
+)
+
+# Serializes lazy backend/processor creation across request and job threads,
+# so a burst of cold-start requests builds each backend only once
+_init_lock = threading.Lock()
+
+# Backend availability as reported by /health, re-probed at most this often
+BACKEND_STATUS_TTL_SECONDS = 60.0
+_backend_status_cache: dict[str, tuple[float, bool]] = {}
+
+# Results for identical uploads (by SHA-256) are served from memory; retries
+# and re-submitted documents skip classification/OCR entirely
+CLASSIFY_CACHE_SIZE = 256
+EXTRACT_CACHE_SIZE = 64
+_classify_cache = LRUCache(CLASSIFY_CACHE_SIZE)
+_extract_cache = LRUCache(EXTRACT_CACHE_SIZE)
+
+LANGDOCK_MODELS_URL = "https://api.langdock.com/assistant/v1/models"
+# The model list rarely changes; serve it from memory for this long
+MODELS_CACHE_TTL_SECONDS = 300.0
+_models_cache: tuple[float, list[dict[str, str]]] | None = None
+
+
+def _create_http_session() -> http_requests.Session:
+    """Create a keep-alive session for outbound API calls (retries idempotent GETs)."""
+    session = http_requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset({"GET"}),
+    )
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=20, pool_maxsize=100, max_retries=retry),
+    )
+    return session
+
+
+_http = _create_http_session()
+
 
 def _is_gemini_model(model: str | None) -> bool:
     """Check if the requested model should be routed to the Gemini backend."""
@@ -65,6 +183,27 @@ def _is_tesseract_model(model: str | None) -> bool:
     return bool(model and model == "tesseract")
 
 
+def _backend_available(name: str, backend: BaseOCRBackend) -> bool:
+    """Return backend.is_available(), cached for BACKEND_STATUS_TTL_SECONDS."""
+    now = time.monotonic()
+    cached = _backend_status_cache.get(name)
+    if cached is not None and now - cached[0] < BACKEND_STATUS_TTL_SECONDS:
+        return cached[1]
+    available = backend.is_available()
+    _backend_status_cache[name] = (now, available)
+    return available
+
+
+def _classify_upload(data: bytes, name: str) -> PDFClassificationResult:
+    """Classify upload bytes, reusing the result for identical content."""
+    digest = hashlib.sha256(data).hexdigest()
+    result = _classify_cache.get(digest)
+    if result is None:
+        result = detector.classify_pdf_stream(data, name)
+        _classify_cache.put(digest, result)
+    return result
+
+
 def get_processor(model: str | None = None) -> TwoPassProcessor:
     """
     Get or create the TwoPassProcessor for the given model.
@@ -81,86 +220,141 @@ def get_processor(model: str | None = None) -> TwoPassProcessor:
 
 def _get_default_processor() -> TwoPassProcessor:
     """Get Langdock-based processor (default)."""
-    global _langdock_processor, _langdock_backend, _tesseract_backend
-
-    if _langdock_processor is None:
-        if _langdock_backend is None:
-            _langdock_backend = LangdockBackend()
-        if _tesseract_backend is None:
-            _tesseract_backend = TesseractBackend()
-
-        primary = _langdock_backend if _langdock_backend.is_available() else None
-        fallback = _tesseract_backend if _tesseract_backend.is_available() else None
+    from text_extraction.backends import LangdockBackend, TesseractBackend
 
-        if primary is None and fallback is not None:
-            primary = fallback
-            fallback = None
+    global _langdock_processor, _langdock_backend, _tesseract_backend
 
-        _langdock_processor = TwoPassProcessor(
-            primary_backend=primary,
-            fallback_backend=fallback,
-            config=ProcessorConfig(
-                fallback_on_error=True,
-                include_page_markers=True,
-            ),
-        )
+    if _langdock_processor is not None:
+        return _langdock_processor
+
+    with _init_lock:
+        if _langdock_processor is None:
+            if _langdock_backend is None:
+                _langdock_backend = LangdockBackend()
+            if _tesseract_backend is None:
+                _tesseract_backend = TesseractBackend()
+
+            primary = _langdock_backend if _langdock_backend.is_available() else None
+            fallback = _tesseract_backend if _tesseract_backend.is_available() else None
+
+            if primary is None and fallback is not None:
+                primary = fallback
+                fallback = None
+
+            _langdock_processor = TwoPassProcessor(
+                primary_backend=primary,
+                fallback_backend=fallback,
+                config=ProcessorConfig(
+                    fallback_on_error=True,
+                    include_page_markers=True,
+                    detector_workers=DETECTOR_WORKERS,
+                ),
+            )
 
     return _langdock_processor
 
 
 def _get_gemini_processor() -> TwoPassProcessor:
     """Get Gemini-based processor."""
-    global _gemini_processor, _gemini_backend, _tesseract_backend
+    from text_extraction.backends import GeminiBackend, TesseractBackend
 
-    if _gemini_processor is None:
-        if _gemini_backend is None:
-            _gemini_backend = GeminiBackend()
-        if _tesseract_backend is None:
-            _tesseract_backend = TesseractBackend()
-
-        primary = _gemini_backend if _gemini_backend.is_available() else None
-        fallback = _tesseract_backend if _tesseract_backend.is_available() else None
-
-        if primary is None and fallback is not None:
-            primary = fallback
-            fallback = None
+    global _gemini_processor, _gemini_backend, _tesseract_backend
 
-        _gemini_processor = TwoPassProcessor(
-            primary_backend=primary,
-            fallback_backend=fallback,
-            config=ProcessorConfig(
-                fallback_on_error=True,
-                include_page_markers=True,
-            ),
-        )
+    if _gemini_processor is not None:
+        return _gemini_processor
+
+    with _init_lock:
+        if _gemini_processor is None:
+            if _gemini_backend is None:
+                _gemini_backend = GeminiBackend()
+            if _tesseract_backend is None:
+                _tesseract_backend = TesseractBackend()
+
+            primary = _gemini_backend if _gemini_backend.is_available() else None
+            fallback = _tesseract_backend if _tesseract_backend.is_available() else None
+
+            if primary is None and fallback is not None:
+                primary = fallback
+                fallback = None
+
+            _gemini_processor = TwoPassProcessor(
+                primary_backend=primary,
+                fallback_backend=fallback,
+                config=ProcessorConfig(
+                    fallback_on_error=True,
+                    include_page_markers=True,
+                    detector_workers=DETECTOR_WORKERS,
+                ),
+            )
 
     return _gemini_processor
 
 
 def _get_tesseract_processor() -> TwoPassProcessor:
     """Get Tesseract-only processor (free, local, fast)."""
+    from text_extraction.backends import TesseractBackend
+
     global _tesseract_processor, _tesseract_backend
 
-    if _tesseract_processor is None:
-        if _tesseract_backend is None:
-            _tesseract_backend = TesseractBackend()
+    if _tesseract_processor is not None:
+        return _tesseract_processor
 
-        primary = _tesseract_backend if _tesseract_backend.is_available() else None
+    with _init_lock:
+        if _tesseract_processor is None:
+            if _tesseract_backend is None:
+                _tesseract_backend = TesseractBackend()
 
-        _tesseract_processor = TwoPassProcessor(
-            primary_backend=primary,
-            fallback_backend=None,
-            config=ProcessorConfig(
-                fallback_on_error=False,
-                include_page_markers=True,
-            ),
-        )
+            primary = _tesseract_backend if _tesseract_backend.is_available() else None
+
+            _tesseract_processor = TwoPassProcessor(
+                primary_backend=primary,
+                fallback_backend=None,
+                config=ProcessorConfig(
+                    fallback_on_error=False,
+                    include_page_markers=True,
+                    detector_workers=DETECTOR_WORKERS,
+                ),
+            )
 
     return _tesseract_processor
 
 
-# Register async jobs router
-app.include_router(create_router(store=_job_store, get_processor_fn=get_processor))
+def _warmup() -> None:
+    """Import heavy modules, create all processors and a warm TLS connection (best effort)."""
+    start = time.perf_counter()
+    for module in WARMUP_IMPORTS:
+        try:
+            importlib.import_module(module)
+        except ImportError as e:
+            logger.warning(f"Warmup import of {module} failed: {e}")
+    for model in WARMUP_MODELS:
+        try:
+            get_processor(model)
+        except Exception as e:
+            logger.warning(f"Warmup of processor for {model or 'default'} failed: {e}")
+    try:
+        _http.head(LANGDOCK_MODELS_URL, timeout=2)
+    except http_requests.RequestException as e:
+        logger.warning(f"Warmup connection to Langdock failed: {e}")
+    logger.info(f"Warmup finished in {(time.perf_counter() - start) * 1000:.0f}ms")
+
+
+# Register synchronous extraction and async jobs routers
+app.include_router(
+    extract.create_router(
+        get_processor_fn=get_processor,
+        direct_processor=_direct_processor,
+        cache=_extract_cache,
+    )
+)
+app.include_router(
+    jobs.create_router(
+        store=_job_store,
+        get_processor_fn=get_processor,
+        executor=_extract_pool,
+        large_executor=_extract_large_pool,
+    )
+)
 
 
 # ============================================================================
@@ -168,26 +362,6 @@ app.include_router(create_router(store=_job_store, get_processor_fn=get_processo
 # ============================================================================
 
 
-class BackendStatusResponse(BaseModel):
-    """OCR backend status in extraction response."""
-
-    primary_backend: str
-    primary_available: bool
-    fallback_backend: str | None = None
-    fallback_available: bool = False
-    attempted_pages: int = 0
-    successful_pages: int = 0
-    failed_pages: int = 0
-
-
-class PageErrorResponse(BaseModel):
-    """Error from a specific page during OCR extraction."""
-
-    page_number: int
-    backend: str
-    error: str
-
-
 class HealthResponse(BaseModel):
     """Health check response."""
 
@@ -211,30 +385,6 @@ class ClassificationResponse(BaseModel):
     processing_time_ms: float
 
 
-class ExtractionResponse(BaseModel):
-    """Text extraction response."""
-
-    success: bool
-    file_name: str
-    pdf_type: str
-    total_pages: int
-    text: str
-    word_count: int
-    confidence: float
-    processing_time_ms: float
-    extraction_method: str
-    backend_status: BackendStatusResponse | None = None
-    page_errors: list[PageErrorResponse] = []
-
-
-class ErrorResponse(BaseModel):
-    """Error response."""
-
-    success: bool = False
-    error: str
-    detail: str | None = None
-
-
 # ============================================================================
 # Global state
 # ============================================================================
@@ -247,30 +397,37 @@ _start_time = time.time()
 # ============================================================================
 
 
-@app.get("/health", response_model=HealthResponse, tags=["System"])
+@app.get(
+    "/health",
+    responses={200: {"model": HealthResponse}},
+    tags=["System"],
+)
 async def health_check():
     """Health check endpoint for container orchestration."""
+    from text_extraction.backends import GeminiBackend, LangdockBackend, TesseractBackend
+
     global _langdock_backend, _gemini_backend, _tesseract_backend
 
-    if _langdock_backend is None:
-        _langdock_backend = LangdockBackend()
-    if _gemini_backend is None:
-        _gemini_backend = GeminiBackend()
-    if _tesseract_backend is None:
-        _tesseract_backend = TesseractBackend()
+    with _init_lock:
+        if _langdock_backend is None:
+            _langdock_backend = LangdockBackend()
+        if _gemini_backend is None:
+            _gemini_backend = GeminiBackend()
+        if _tesseract_backend is None:
+            _tesseract_backend = TesseractBackend()
 
     backends = {
-        "langdock": _langdock_backend.is_available(),
-        "gemini": _gemini_backend.is_available(),
-        "tesseract": _tesseract_backend.is_available(),
+        "langdock": _backend_available("langdock", _langdock_backend),
+        "gemini": _backend_available("gemini", _gemini_backend),
+        "tesseract": _backend_available("tesseract", _tesseract_backend),
     }
 
-    return HealthResponse(
-        status="healthy",
-        version="0.1.0",
-        uptime_seconds=time.time() - _start_time,
-        backends=backends,
-    )
+    return ORJSONResponse({
+        "status": "healthy",
+        "version": "0.1.0",
+        "uptime_seconds": time.time() - _start_time,
+        "backends": backends,
+    })
 
 
 @app.get("/", tags=["System"])
@@ -296,15 +453,19 @@ async def list_models():
     if not api_key:
         raise HTTPException(status_code=503, detail="Langdock API not configured")
 
-    try:
-        headers = {"Authorization": f"Bearer {api_key}"}
-        resp = http_requests.get(
-            "https://api.langdock.com/assistant/v1/models",
-            headers=headers,
-            timeout=10,
-        )
-        resp.raise_for_status()
-        data = resp.json()
+    global _models_cache
+
+    now = time.monotonic()
+    if _models_cache is not None and now - _models_cache[0] < MODELS_CACHE_TTL_SECONDS:
+        eu_models = _models_cache[1]
+    else:
+        try:
+            headers = {"Authorization": f"Bearer {api_key}"}
+            resp = _http.get(LANGDOCK_MODELS_URL, headers=headers, timeout=10)
+            resp.raise_for_status()
+            data = resp.json()
+        except http_requests.RequestException as e:
+            raise HTTPException(status_code=502, detail=f"Failed to fetch models: {e}")
 
         # Deduplicate and filter to EU region only
         seen = set()
@@ -313,22 +474,27 @@ async def list_models():
             if m.get("region") == "eu" and m["id"] not in seen:
                 seen.add(m["id"])
                 eu_models.append({"id": m["id"], "region": m["region"]})
+        eu_models.sort(key=lambda x: x["id"])
+        _models_cache = (now, eu_models)
 
-        default_model = os.getenv(
-            "LANGDOCK_OCR_MODEL", LangdockBackend.DEFAULT_MODEL
-        )
-        return {
-            "default": default_model,
-            "models": sorted(eu_models, key=lambda x: x["id"]),
-        }
-    except http_requests.RequestException as e:
-        raise HTTPException(status_code=502, detail=f"Failed to fetch models: {e}")
+    from text_extraction.backends import LangdockBackend
+
+    default_model = os.getenv(
+        "LANGDOCK_OCR_MODEL", LangdockBackend.DEFAULT_MODEL
+    )
+    return {
+        "default": default_model,
+        "models": eu_models,
+    }
 
 
 @app.post(
     "/api/v1/classify",
-    response_model=ClassificationResponse,
-    responses={400: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
+    responses={
+        200: {"model": ClassificationResponse},
+        400: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+    },
     tags=["Extraction"],
 )
 async def classify_pdf(
@@ -340,161 +506,35 @@ async def classify_pdf(
     Returns whether the PDF is PURE_TEXT, PURE_IMAGE, or HYBRID,
     along with page-level analysis.
     """
-    if not file.filename or not file.filename.lower().endswith(".pdf"):
+    if not is_pdf_filename(file.filename):
         raise HTTPException(status_code=400, detail="Only PDF files are supported")
 
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
-        # Save uploaded file to temp location
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-            content = await file.read()
-            tmp.write(content)
-            tmp_path = Path(tmp.name)
-
-        try:
-            # Classify PDF
-            result: PDFClassificationResult = detector.classify_pdf(tmp_path)
-
-            processing_time = (time.time() - start_time) * 1000
-
-            return ClassificationResponse(
-                success=True,
-                file_name=file.filename,
-                pdf_type=result.pdf_type.value,
-                total_pages=result.total_pages,
-                text_pages=result.text_pages,
-                image_pages=result.image_pages,
-                hybrid_pages=result.hybrid_pages,
-                confidence=result.confidence,
-                processing_time_ms=processing_time,
-            )
-        finally:
-            # Cleanup temp file
-            tmp_path.unlink(missing_ok=True)
-
-    except FileNotFoundError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Classification failed: {str(e)}")
-
-
-@app.post(
-    "/api/v1/extract",
-    response_model=ExtractionResponse,
-    responses={400: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
-    tags=["Extraction"],
-)
-async def extract_text(
-    file: UploadFile = File(..., description="PDF file to extract text from"),
-    quality: str = Query(
-        default="balanced",
-        description="Quality preference: fast, balanced, accurate",
-        pattern="^(fast|balanced|accurate)$",
-    ),
-    model: str | None = Query(
-        default=None,
-        description=(
-            "OCR model override. "
-            "Default: claude-sonnet-4-5@20250929. "
-            "Available: claude-sonnet-4-5@20250929, claude-haiku-4-5@20251001, "
-            "claude-opus-4-5@20251101, claude-opus-4-6@default, "
-            "gemini-2.5-flash, gemini-2.5-pro, "
-            "gpt-5-mini-eu, gpt-5.1, gpt-5.2, gpt-5.2-pro, "
-            "tesseract (free, local, ~2s/page)"
-        ),
-    ),
-):
-    """
-    Extract text from a PDF file.
-
-    **Quality options:**
-    - **fast**: Direct extraction only, no OCR
-    - **balanced**: OCR for image pages only (default)
-    - **accurate**: Full OCR verification for all pages
-
-    **Available OCR models** (EU region, only used when OCR is triggered):
-
-    | Model | Provider | Notes |
-    |-------|----------|-------|
-    | `claude-sonnet-4-5@20250929` | Anthropic | **Default** - Best quality/cost ratio |
-    | `claude-haiku-4-5@20251001` | Anthropic | Fastest, lowest cost |
-    | `claude-opus-4-5@20251101` | Anthropic | Highest quality |
-    | `claude-opus-4-6@default` | Anthropic | Latest Opus |
-    | `gemini-2.5-flash` | Google | Fast, good quality |
-    | `gemini-2.5-pro` | Google | High quality |
-    | `gpt-5-mini-eu` | OpenAI | Fast, EU-hosted |
-    | `gpt-5.1` | OpenAI | Good quality |
-    | `gpt-5.2` | OpenAI | Latest GPT |
-    | `gpt-5.2-pro` | OpenAI | Highest OpenAI quality |
-    | `tesseract` | Local | Free, ~2s/page, no API key needed |
-
-    Use **GET /api/v1/models** for the live list from the API.
-    """
-    if not file.filename or not file.filename.lower().endswith(".pdf"):
-        raise HTTPException(status_code=400, detail="Only PDF files are supported")
+        # Classify straight from the upload buffer (no temp file needed);
+        # hashing and PyMuPDF work run off the event loop
+        data = await file.read()
+        result: PDFClassificationResult = await asyncio.to_thread(
+            _classify_upload, data, file.filename
+        )
 
-    try:
-        # Save uploaded file to temp location
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-            content = await file.read()
-            tmp.write(content)
-            tmp_path = Path(tmp.name)
+        processing_time = (time.perf_counter() - start_time) * 1000
 
-        try:
-            # Use TwoPassProcessor for extraction (model-based routing)
-            processor = get_processor(model=model)
-            result = processor.extract(tmp_path, quality=quality, model=model)
-
-            if not result.success:
-                raise HTTPException(
-                    status_code=500,
-                    detail=result.error or "Extraction failed"
-                )
-
-            backend_status = None
-            if result.backend_status:
-                bs = result.backend_status
-                backend_status = BackendStatusResponse(
-                    primary_backend=bs.primary_backend,
-                    primary_available=bs.primary_available,
-                    fallback_backend=bs.fallback_backend,
-                    fallback_available=bs.fallback_available,
-                    attempted_pages=bs.attempted_pages,
-                    successful_pages=bs.successful_pages,
-                    failed_pages=bs.failed_pages,
-                )
-
-            page_errors = [
-                PageErrorResponse(
-                    page_number=pe.page_number,
-                    backend=pe.backend,
-                    error=pe.error,
-                )
-                for pe in result.page_errors
-            ]
-
-            return ExtractionResponse(
-                success=True,
-                file_name=file.filename,
-                pdf_type=result.pdf_type,
-                total_pages=result.total_pages,
-                text=result.text,
-                word_count=result.word_count,
-                confidence=result.confidence,
-                processing_time_ms=result.processing_time_ms,
-                extraction_method=result.extraction_method,
-                backend_status=backend_status,
-                page_errors=page_errors,
-            )
-        finally:
-            # Cleanup temp file
-            tmp_path.unlink(missing_ok=True)
+        return ORJSONResponse({
+            "success": True,
+            "file_name": file.filename,
+            "pdf_type": result.pdf_type.value,
+            "total_pages": result.total_pages,
+            "text_pages": result.text_pages,
+            "image_pages": result.image_pages,
+            "hybrid_pages": result.hybrid_pages,
+            "confidence": result.confidence,
+            "processing_time_ms": processing_time,
+        })
 
-    except FileNotFoundError as e:
-        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Extraction failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Classification failed: {str(e)}")
 
 
 # ============================================================================
@@ -505,7 +545,7 @@ async def extract_text(
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
     """Custom HTTP exception handler."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"success": False, "error": exc.detail},
     )
@@ -514,7 +554,7 @@ async def http_exception_handler(request, exc):
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
     """General exception handler."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"success": False, "error": "Internal server error", "detail": str(exc)},
     )
@@ -0,0 +1,152 @@
+"""
+Redis Job Store
+===============
+
+Redis-backed job storage, so several service instances can share jobs.
+"""
+
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from service.job_store import (
+    JOB_EXPIRY_HOURS,
+    JOB_UPLOAD_DIR,
+    Job,
+    JobStatus,
+    JobStore,
+    apply_updates,
+)
+
+
+def _job_to_dict(job: Job) -> dict[str, Any]:
+    """Serialize job metadata (not the result payload) for RedisJobStore."""
+    return {
+        "job_id": job.job_id,
+        "file_name": job.file_name,
+        "file_path": str(job.file_path),
+        "quality": job.quality,
+        "model": job.model,
+        "callback_url": job.callback_url,
+        "status": job.status.value,
+        "progress": job.progress,
+        "created_at": job.created_at.isoformat(),
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+        "processing_time_ms": job.processing_time_ms,
+        "result_path": str(job.result_path) if job.result_path else None,
+        "error": job.error,
+        "content_hash": job.content_hash,
+    }
+
+
+def _job_from_dict(data: dict[str, Any]) -> Job:
+    """Rebuild a Job from _job_to_dict() output."""
+    job = Job(
+        job_id=data["job_id"],
+        file_name=data["file_name"],
+        file_path=Path(data["file_path"]),
+        quality=data["quality"],
+        model=data["model"],
+        callback_url=data["callback_url"],
+        content_hash=data.get("content_hash"),
+    )
+    job.status = JobStatus(data["status"])
+    job.progress = data["progress"]
+    job.created_at = datetime.fromisoformat(data["created_at"])
+    if data["started_at"]:
+        job.started_at = datetime.fromisoformat(data["started_at"])
+    if data["completed_at"]:
+        job.completed_at = datetime.fromisoformat(data["completed_at"])
+    job.processing_time_ms = data["processing_time_ms"]
+    if data["result_path"]:
+        job.result_path = Path(data["result_path"])
+    job.error = data["error"]
+    return job
+
+
+class RedisJobStore(JobStore):
+    """
+    Redis-backed job storage for production.
+
+    Job metadata is stored as JSON with a TTL of JOB_EXPIRY_HOURS, so expired
+    jobs are evicted by Redis itself. Result payloads stay in the job's result
+    file, which must be on storage shared by all service instances.
+
+    Redis cannot delete those files when it evicts a job, so cleanup_expired()
+    removes result files and orphaned uploads in upload_dir by age instead.
+    """
+
+    KEY_PREFIX = "textextract:job:"
+    HASH_KEY_PREFIX = "textextract:hash:"
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        client: Any = None,
+        upload_dir: Path = JOB_UPLOAD_DIR,
+    ) -> None:
+        if client is None:
+            import redis
+
+            client = redis.Redis.from_url(url)
+        self._redis = client
+        self._ttl_seconds = JOB_EXPIRY_HOURS * 3600
+        self._upload_dir = upload_dir
+
+    def _key(self, job_id: str) -> str:
+        return f"{self.KEY_PREFIX}{job_id}"
+
+    def create(self, job: Job) -> str:
+        self._redis.setex(
+            self._key(job.job_id), self._ttl_seconds, orjson.dumps(_job_to_dict(job))
+        )
+        if job.content_hash:
+            self._redis.setex(
+                f"{self.HASH_KEY_PREFIX}{job.content_hash}", self._ttl_seconds, job.job_id
+            )
+        return job.job_id
+
+    def get(self, job_id: str) -> Job | None:
+        data = self._redis.get(self._key(job_id))
+        if data is None:
+            return None
+        return _job_from_dict(orjson.loads(data))
+
+    def update(self, job_id: str, **kwargs: Any) -> None:
+        job = self.get(job_id)
+        if job is None:
+            return
+        apply_updates(job, kwargs)
+        self._redis.set(self._key(job_id), orjson.dumps(_job_to_dict(job)), keepttl=True)
+
+    def cleanup_expired(self) -> int:
+        """
+        Delete job files older than JOB_EXPIRY_HOURS (by mtime).
+
+        Redis evicts the job metadata itself via TTL; this removes the result
+        files and uploads left behind in upload_dir once their job is gone.
+        """
+        cutoff = time.time() - self._ttl_seconds
+        removed = 0
+        for pattern in ("*.result.json", "*.pdf"):
+            for path in self._upload_dir.glob(pattern):
+                try:
+                    if path.stat().st_mtime < cutoff:
+                        path.unlink()
+                        removed += 1
+                except FileNotFoundError:
+                    # Removed concurrently by another instance sharing the dir
+                    continue
+        return removed
+
+    def get_by_hash(self, content_hash: str) -> Job | None:
+        job_id = self._redis.get(f"{self.HASH_KEY_PREFIX}{content_hash}")
+        if job_id is None:
+            return None
+        if isinstance(job_id, bytes):
+            job_id = job_id.decode()
+        return self.get(job_id)
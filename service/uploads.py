@@ -0,0 +1,63 @@
+"""
+Upload Handling
+===============
+
+Helpers for persisting uploaded PDFs to disk without buffering them in memory.
+"""
+
+import asyncio
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import BinaryIO
+
+from fastapi import UploadFile
+
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+# Multipart parts up to this size stay in memory while the request is parsed
+# (Starlette's default is 1 MiB), so typical invoices never touch the disk twice
+UPLOAD_SPOOL_MAX_SIZE = 8 << 20  # 8 MiB
+
+
+def _default_upload_tmp_dir() -> str | None:
+    """/dev/shm if it is usable (tmpfs, so uploads stay in RAM), else the system default."""
+    shm = "/dev/shm"
+    return shm if os.path.isdir(shm) and os.access(shm, os.W_OK) else None
+
+
+# Request-scoped upload files live here; set UPLOAD_TMP_DIR to override
+UPLOAD_TMP_DIR = os.getenv("UPLOAD_TMP_DIR") or _default_upload_tmp_dir()
+
+
+def is_pdf_filename(filename: str | None) -> bool:
+    """True if the upload's filename has a .pdf extension (any case)."""
+    return bool(filename) and filename[-4:].lower() == ".pdf"
+
+
+def new_upload_path(suffix: str = ".pdf") -> Path:
+    """Create an empty temp file in UPLOAD_TMP_DIR and return its path (caller deletes)."""
+    fd, name = tempfile.mkstemp(suffix=suffix, dir=UPLOAD_TMP_DIR)
+    os.close(fd)
+    return Path(name)
+
+
+def _copy_upload(src: BinaryIO, dest: Path) -> str:
+    """Copy an upload's spooled file to ``dest`` in fixed-size chunks, hashing as it goes."""
+    hasher = hashlib.sha256()
+    src.seek(0)
+    with open(dest, "wb") as out:
+        while chunk := src.read(UPLOAD_CHUNK_SIZE):
+            hasher.update(chunk)
+            out.write(chunk)
+    return hasher.hexdigest()
+
+
+async def save_upload(file: UploadFile, dest: Path) -> str:
+    """
+    Stream an uploaded file to ``dest`` in a worker thread.
+
+    Returns:
+        SHA-256 hex digest of the content (for duplicate detection)
+    """
+    return await asyncio.to_thread(_copy_upload, file.file, dest)
@@ -0,0 +1,188 @@
+"""
+Job Webhooks
+============
+
+Completion notifications for async jobs: a shared HTTP client, retries on
+transport errors, coalescing of duplicate notifications and a per-host
+circuit breaker.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import threading
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from service.job_store import Job, JobStore
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_TIMEOUT_SECONDS = 10
+WEBHOOK_MAX_ATTEMPTS = 5
+# Consecutive failures per callback host before webhooks to it are skipped
+WEBHOOK_BREAKER_THRESHOLD = 5
+WEBHOOK_BREAKER_RESET_SECONDS = 300
+
+# Event loop serving the async jobs router (captured on first request)
+_server_loop: asyncio.AbstractEventLoop | None = None
+
+
+def set_server_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Record the server event loop; webhooks scheduled on it use the shared client."""
+    global _server_loop
+
+    _server_loop = loop
+
+
+class _WebhookCircuitBreaker:
+    """Skips webhooks to hosts that keep failing, until a cool-down has passed."""
+
+    def __init__(self, threshold: int, reset_seconds: float) -> None:
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self._failures: dict[str, int] = {}
+        self._opened_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, host: str) -> bool:
+        with self._lock:
+            opened_at = self._opened_at.get(host)
+            if opened_at is None:
+                return True
+            if time.monotonic() - opened_at >= self.reset_seconds:
+                # Half-open: let one attempt through, re-open on failure
+                del self._opened_at[host]
+                self._failures[host] = self.threshold - 1
+                return True
+            return False
+
+    def record(self, host: str, success: bool) -> None:
+        with self._lock:
+            if success:
+                self._failures.pop(host, None)
+                return
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            if failures >= self.threshold:
+                self._opened_at[host] = time.monotonic()
+
+
+_webhook_breaker = _WebhookCircuitBreaker(
+    WEBHOOK_BREAKER_THRESHOLD, WEBHOOK_BREAKER_RESET_SECONDS
+)
+
+# Shared client, created on (and bound to) the server event loop
+_webhook_client: httpx.AsyncClient | None = None
+
+# Notifications for callbacks that complete together share connections; with
+# the optional ``h2`` package they are multiplexed over one HTTP/2 connection
+WEBHOOK_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# (url, job_id, status) of notifications currently being delivered on the
+# server loop; identical notifications arriving meanwhile are coalesced
+_inflight_webhooks: set[tuple[str, str, str]] = set()
+
+
+def _get_webhook_client() -> httpx.AsyncClient:
+    """Get or create the shared webhook client (call from the server loop)."""
+    global _webhook_client
+
+    if _webhook_client is None or _webhook_client.is_closed:
+        _webhook_client = httpx.AsyncClient(
+            timeout=WEBHOOK_TIMEOUT_SECONDS,
+            limits=httpx.Limits(max_connections=100),
+            http2=WEBHOOK_HTTP2,
+        )
+    return _webhook_client
+
+
+async def close_webhook_client() -> None:
+    """Close the shared webhook client (on application shutdown)."""
+    global _webhook_client
+
+    if _webhook_client is not None:
+        await _webhook_client.aclose()
+        _webhook_client = None
+
+
+@retry(
+    stop=stop_after_attempt(WEBHOOK_MAX_ATTEMPTS),
+    wait=wait_exponential(multiplier=1, max=60),
+    retry=retry_if_exception_type(httpx.TransportError),
+    reraise=True,
+)
+async def _post_webhook(
+    client: httpx.AsyncClient, url: str, payload: dict[str, Any]
+) -> httpx.Response:
+    """POST the webhook payload, retrying connection/transport errors."""
+    return await client.post(url, json=payload)
+
+
+async def send_webhook(
+    job: Job,
+    store: JobStore,
+    client: httpx.AsyncClient | None = None,
+    callback_url: str | None = None,
+) -> None:
+    """
+    Send webhook notification for completed/failed job.
+
+    Posts to ``callback_url`` if given (e.g. a deduplicated upload), otherwise
+    to the job's own callback URL. Uses ``client`` if given, the shared client
+    when scheduled on the server loop, or a one-off client when run outside of it.
+    On the shared client, a notification identical to one still in flight is
+    dropped instead of being delivered twice.
+    """
+    updated_job = store.get(job.job_id)
+    if updated_job is None:
+        return
+
+    url = callback_url or updated_job.callback_url
+    if not url:
+        return
+    host = urlsplit(url).netloc
+    if not _webhook_breaker.allow(host):
+        logger.warning("Webhook skipped for job %s: circuit open for %s", job.job_id, host)
+        return
+
+    payload = {
+        "job_id": updated_job.job_id,
+        "status": updated_job.status.value,
+        "file_name": updated_job.file_name,
+    }
+
+    inflight_key = (url, updated_job.job_id, updated_job.status.value)
+    try:
+        if client is not None:
+            response = await _post_webhook(client, url, payload)
+        elif _server_loop is asyncio.get_running_loop():
+            if inflight_key in _inflight_webhooks:
+                logger.info("Webhook for job %s already in flight to %s", job.job_id, url)
+                return
+            _inflight_webhooks.add(inflight_key)
+            try:
+                response = await _post_webhook(_get_webhook_client(), url, payload)
+            finally:
+                _inflight_webhooks.discard(inflight_key)
+        else:
+            async with httpx.AsyncClient(timeout=WEBHOOK_TIMEOUT_SECONDS) as one_off:
+                response = await _post_webhook(one_off, url, payload)
+    except Exception as e:
+        _webhook_breaker.record(host, success=False)
+        logger.warning("Webhook failed for job %s: %s", job.job_id, e)
+        return
+
+    _webhook_breaker.record(host, success=response.status_code < 500)
+    logger.info(
+        "Webhook sent for job %s to %s (HTTP %s)", job.job_id, url, response.status_code
+    )
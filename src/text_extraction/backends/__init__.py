@@ -28,6 +28,8 @@ Usage:
         result = tesseract.extract_text(Path("scan.pdf"), page_number=1)
 """
 
+from typing import TYPE_CHECKING, Any
+
 from .base import (
     BaseOCRBackend,
     DocumentOCRResult,
@@ -35,9 +37,24 @@ from .base import (
     OCRResult,
     PageOCRResult,
 )
-from .gemini import GeminiBackend, GeminiRetryableError
-from .langdock import LangdockBackend
-from .tesseract import TesseractBackend
+
+if TYPE_CHECKING:
+    from .gemini import GeminiBackend
+    from .gemini_retry import GeminiRetryableError
+    from .langdock import LangdockBackend
+    from .langdock_retry import LangdockRateLimitError, TransientAPIError
+    from .tesseract import TesseractBackend
+
+# Backends pull in heavy optional deps (google-genai, pytesseract, PIL), so each
+# module is imported on first attribute access only (PEP 562)
+_LAZY_IMPORTS = {
+    "GeminiBackend": ".gemini",
+    "GeminiRetryableError": ".gemini_retry",
+    "LangdockBackend": ".langdock",
+    "LangdockRateLimitError": ".langdock_retry",
+    "TransientAPIError": ".langdock_retry",
+    "TesseractBackend": ".tesseract",
+}
 
 __all__ = [
     "BaseOCRBackend",
@@ -48,5 +65,22 @@ __all__ = [
     "GeminiBackend",
     "GeminiRetryableError",
     "LangdockBackend",
+    "LangdockRateLimitError",
+    "TransientAPIError",
     "TesseractBackend",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # cache so __getattr__ isn't hit again
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -5,11 +5,23 @@ Base OCR Backend
 Abstract base class for OCR backend implementations.
 """
 
+import asyncio
+import threading
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import List, Optional, Dict, Any
 from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# PyMuPDF is not thread-safe: MuPDF's context (resource store, error state)
+# is shared by every document in the process, so separate documents are not
+# independent either. Rule: every PyMuPDF call made where other threads may
+# use PyMuPDF (open, page access, render, close, store_shrink) holds this
+# lock. Hold it per page rather than across a whole document, so threads
+# working on other documents can interleave. Worker processes have their own
+# MuPDF and do not need it. Reentrant, so helpers may take it again.
+FITZ_LOCK = threading.RLock()
 
 
 class ExtractionMethod(Enum):
@@ -20,7 +32,7 @@ class ExtractionMethod(Enum):
     CLOUD_VISION = "cloud_vision"  # Google Cloud Vision
 
 
-@dataclass
+@dataclass(slots=True)
 class OCRResult:
     """Result from OCR extraction."""
     text: str
@@ -36,7 +48,7 @@ class OCRResult:
             self.word_count = len(self.text.split())
 
 
-@dataclass
+@dataclass(slots=True)
 class PageOCRResult:
     """OCR result for a single page."""
     page_number: int
@@ -47,7 +59,7 @@ class PageOCRResult:
     processing_time_ms: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentOCRResult:
     """Complete OCR result for a document."""
     success: bool
@@ -62,7 +74,7 @@ class DocumentOCRResult:
     @property
     def full_text(self) -> str:
         """Concatenate text from all pages."""
-        return "\n\n".join(page.text for page in self.pages if page.text)
+        return "\n\n".join([page.text for page in self.pages if page.text])
 
 
 class BaseOCRBackend(ABC):
@@ -75,6 +87,7 @@ class BaseOCRBackend(ABC):
 
     Optional overrides:
     - extract_document(): Process multi-page documents
+    - extract_document_async(): Process pages of a document concurrently
     - get_supported_formats(): Return supported file formats
     """
 
@@ -138,7 +151,7 @@ class BaseOCRBackend(ABC):
             DocumentOCRResult with all page results
         """
         import time
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         results: List[PageOCRResult] = []
         total_word_count = 0
@@ -149,23 +162,24 @@ class BaseOCRBackend(ABC):
                 # Get page count from file
                 pages = self._get_page_numbers(file_path)
 
-            for page_num in pages:
-                page_start = time.time()
-                result = self.extract_text(file_path, page_number=page_num, **kwargs)
-                page_time = (time.time() - page_start) * 1000
-
-                page_result = PageOCRResult(
-                    page_number=page_num,
-                    text=result.text,
-                    confidence=result.confidence,
-                    method=result.method,
-                    word_count=result.word_count,
-                    processing_time_ms=page_time
-                )
-                results.append(page_result)
-                total_word_count += result.word_count
-
-            total_time = (time.time() - start_time) * 1000
+            with self._document_session(file_path):
+                for page_num in pages:
+                    page_start = time.perf_counter()
+                    result = self.extract_text(file_path, page_number=page_num, **kwargs)
+                    page_time = (time.perf_counter() - page_start) * 1000
+
+                    page_result = PageOCRResult(
+                        page_number=page_num,
+                        text=result.text,
+                        confidence=result.confidence,
+                        method=result.method,
+                        word_count=result.word_count,
+                        processing_time_ms=page_time
+                    )
+                    results.append(page_result)
+                    total_word_count += result.word_count
+
+            total_time = (time.perf_counter() - start_time) * 1000
 
             return DocumentOCRResult(
                 success=True,
@@ -184,16 +198,117 @@ class BaseOCRBackend(ABC):
                 pages=[],
                 total_pages=0,
                 error=str(e),
-                processing_time_ms=(time.time() - start_time) * 1000
+                processing_time_ms=(time.perf_counter() - start_time) * 1000
+            )
+
+    async def extract_text_async(
+        self,
+        file_path: Path,
+        page_number: Optional[int] = None,
+        **kwargs: Any
+    ) -> OCRResult:
+        """
+        Async variant of extract_text().
+
+        Runs extract_text() in a worker thread by default; backends with a
+        native async client or their own throttling override this.
+        """
+        return await asyncio.to_thread(
+            self.extract_text, file_path, page_number=page_number, **kwargs
+        )
+
+    async def extract_document_async(
+        self,
+        file_path: Path,
+        pages: Optional[List[int]] = None,
+        concurrency: int = 8,
+        **kwargs: Any
+    ) -> DocumentOCRResult:
+        """
+        Extract text from multiple pages concurrently.
+
+        Runs extract_text_async() for up to ``concurrency`` pages at a time,
+        so network-bound backends overlap their API calls instead of paying
+        one round-trip per page in sequence.
+
+        Args:
+            file_path: Path to document
+            pages: List of page numbers (1-indexed), None for all
+            concurrency: Maximum pages processed at the same time
+            **kwargs: Backend-specific options
+
+        Returns:
+            DocumentOCRResult with the successful pages in page order;
+            success is False (with per-page errors) if any page failed
+        """
+        import time
+        start_time = time.perf_counter()
+
+        if pages is None:
+            pages = await asyncio.to_thread(self._get_page_numbers, file_path)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run_page(page_num: int) -> PageOCRResult:
+            async with semaphore:
+                page_start = time.perf_counter()
+                result = await self.extract_text_async(
+                    file_path, page_number=page_num, **kwargs
+                )
+                return PageOCRResult(
+                    page_number=page_num,
+                    text=result.text,
+                    confidence=result.confidence,
+                    method=result.method,
+                    word_count=result.word_count,
+                    processing_time_ms=(time.perf_counter() - page_start) * 1000
+                )
+
+        with self._document_session(file_path):
+            outcomes = await asyncio.gather(
+                *(run_page(page_num) for page_num in pages), return_exceptions=True
             )
 
+        results = [o for o in outcomes if isinstance(o, PageOCRResult)]
+        errors = [
+            f"page {page_num}: {o}"
+            for page_num, o in zip(pages, outcomes)
+            if isinstance(o, BaseException)
+        ]
+
+        return DocumentOCRResult(
+            success=not errors,
+            file_name=file_path.name,
+            pages=results,
+            total_pages=len(results),
+            total_word_count=sum(r.word_count for r in results),
+            processing_time_ms=(time.perf_counter() - start_time) * 1000,
+            error="; ".join(errors) or None,
+            metadata={"backend": self.name}
+        )
+
+    def _document_session(self, file_path: Path) -> AbstractContextManager:
+        """
+        Keep a PDF open while its pages are extracted (see PDFSession).
+
+        Non-PDF inputs and PDFs that fail to open get a no-op context; the
+        per-page calls then report the error as before.
+        """
+        if Path(file_path).suffix.lower() != ".pdf":
+            return nullcontext()
+        from .rendering import PDFSession
+
+        try:
+            return PDFSession(file_path).open()
+        except Exception:
+            return nullcontext()
+
     def _get_page_numbers(self, file_path: Path) -> List[int]:
         """Get list of page numbers for a document."""
         try:
             import fitz
-            doc = fitz.open(file_path)
-            page_count = len(doc)
-            doc.close()
+            with FITZ_LOCK, fitz.open(file_path) as doc:
+                page_count = len(doc)
             return list(range(1, page_count + 1))
         except Exception:
             # For images, return single page
@@ -3,34 +3,53 @@ Gemini OCR Backend
 ==================
 
 LLM-based OCR using Google Gemini API with native multimodal support.
-Uses PIL Images directly - no base64 encoding needed.
+Pages are sent as raw JPEG bytes - no base64 encoding needed.
 """
 
+import asyncio
+import dataclasses
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
 from typing import Any
 
-import fitz
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
-
-from .base import BaseOCRBackend, ExtractionMethod, OCRResult
+from tenacity import AsyncRetrying, retry
+
+from .base import (
+    BaseOCRBackend,
+    DocumentOCRResult,
+    ExtractionMethod,
+    OCRResult,
+    PageOCRResult,
+)
+from .gemini_retry import RETRY_POLICY, GeminiRetryableError, check_client_error
+from .rendering import dedupe_renders, render_pages_jpeg
+
+# Typed as Any so the None fallback below type-checks
+genai: Any
+genai_errors: Any
+genai_types: Any
+try:
+    from google import genai
+    from google.genai import errors as genai_errors
+    from google.genai import types as genai_types
+except ImportError:  # gemini extra not installed; _get_client() raises instead
+    genai = genai_errors = genai_types = None
+
+__all__ = ["GeminiBackend", "GeminiRetryableError"]
 
 logger = logging.getLogger(__name__)
 
 
-class GeminiRetryableError(RuntimeError):
-    """Raised for Gemini API errors that are worth retrying (429, RESOURCE_EXHAUSTED)."""
-
-
 class GeminiBackend(BaseOCRBackend):
     """
     OCR backend using Google Gemini API with vision-capable models.
 
     Uses the google-genai SDK for native multimodal content generation.
-    Accepts PIL Images directly without base64 encoding.
+    PDF pages are rendered to JPEG and sent as inline image parts.
 
     Environment variables:
         GEMINI_API_KEY: API key for Google Gemini
@@ -38,6 +57,19 @@ class GeminiBackend(BaseOCRBackend):
     """
 
     DEFAULT_MODEL = "gemini-2.5-flash"
+    # Concurrent API calls per document in extract_document()
+    DOCUMENT_CONCURRENCY = 4
+    # Page render resolution (2x the PDF's 72 DPI)
+    RENDER_DPI = 144
+    # JPEG is several times smaller than PNG for scans (less upload, fewer tokens)
+    JPEG_QUALITY = 85
+    # Image files Gemini accepts as-is; other formats are converted to JPEG
+    IMAGE_MIME_TYPES = {
+        ".png": "image/png",
+        ".jpg": "image/jpeg",
+        ".jpeg": "image/jpeg",
+        ".webp": "image/webp",
+    }
 
     OCR_PROMPT = """Extrahiere den gesamten Text aus diesem Dokument.
 
@@ -69,7 +101,7 @@ Text:"""
         super().__init__(name="Gemini")
 
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
-        self.model = model or os.getenv("GEMINI_OCR_MODEL", self.DEFAULT_MODEL)
+        self.model: str = model or os.getenv("GEMINI_OCR_MODEL") or self.DEFAULT_MODEL
         self.temperature = temperature
         self.timeout = timeout
         self._client: Any = None
@@ -77,8 +109,8 @@ Text:"""
     def _get_client(self) -> Any:
         """Lazy-initialize the genai client."""
         if self._client is None:
-            from google import genai
-
+            if genai is None:
+                raise ImportError("google-genai is not installed (pip install text-extraction[gemini])")
             self._client = genai.Client(api_key=self.api_key)
         return self._client
 
@@ -106,27 +138,160 @@ Text:"""
         if not self.is_available():
             raise RuntimeError("Gemini API key not configured")
 
-        from google.genai import types
+        start_time = time.perf_counter()
+
+        # Convert PDF page to JPEG bytes
+        if file_path.suffix.lower() == ".pdf":
+            if page_number is None:
+                page_number = 1
+            image, mime_type = self._pdf_page_to_jpeg(file_path, page_number), "image/jpeg"
+            if image is None:
+                return self._blank_result(page_number, start_time, **kwargs)
+        else:
+            image, mime_type = self._read_image_file(file_path)
+
+        return self._ocr_image(image, mime_type, page_number, start_time, **kwargs)
+
+    def extract_document(
+        self,
+        file_path: Path,
+        pages: list[int] | None = None,
+        **kwargs: Any,
+    ) -> DocumentOCRResult:
+        """
+        Extract text from several PDF pages.
+
+        Opens the PDF once to render all pages, then runs up to
+        DOCUMENT_CONCURRENCY API calls at a time. Blank pages are skipped and
+        pages that render identically (repeated letterheads, separator
+        sheets) are sent only once. Non-PDF files use the default per-page
+        implementation.
+        """
+        if file_path.suffix.lower() != ".pdf":
+            return super().extract_document(file_path, pages, **kwargs)
 
-        start_time = time.time()
+        start_time = time.perf_counter()
+        try:
+            if not self.is_available():
+                raise RuntimeError("Gemini API key not configured")
+            if pages is None:
+                pages = self._get_page_numbers(file_path)
+
+            images = render_pages_jpeg(file_path, pages, self.RENDER_DPI, self.JPEG_QUALITY)
+            unique, call_index = dedupe_renders(images)
+            unique_pages = [(pages[i], image) for i, image in unique]
+
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(self.DOCUMENT_CONCURRENCY, len(unique_pages)))
+            ) as pool:
+                ocr_results = list(
+                    pool.map(
+                        lambda page: self._ocr_image(
+                            page[1], "image/jpeg", page[0], time.perf_counter(), **kwargs
+                        ),
+                        unique_pages,
+                    )
+                )
+
+            results = []
+            for page_number, index in zip(pages, call_index):
+                if index is None:
+                    results.append(self._blank_result(page_number, None, **kwargs))
+                elif ocr_results[index].page_number == page_number:
+                    results.append(ocr_results[index])
+                else:
+                    results.append(
+                        dataclasses.replace(ocr_results[index], page_number=page_number)
+                    )
+
+            page_results = [
+                PageOCRResult(
+                    page_number=page_number,
+                    text=r.text,
+                    confidence=r.confidence,
+                    method=r.method,
+                    word_count=r.word_count,
+                    processing_time_ms=r.metadata["processing_time_ms"],
+                )
+                for page_number, r in zip(pages, results)
+            ]
+            return DocumentOCRResult(
+                success=True,
+                file_name=file_path.name,
+                pages=page_results,
+                total_pages=len(page_results),
+                total_word_count=sum(r.word_count for r in page_results),
+                processing_time_ms=(time.perf_counter() - start_time) * 1000,
+                metadata={"backend": self.name},
+            )
+        except Exception as e:
+            return DocumentOCRResult(
+                success=False,
+                file_name=file_path.name,
+                pages=[],
+                total_pages=0,
+                error=str(e),
+                processing_time_ms=(time.perf_counter() - start_time) * 1000,
+            )
+
+    def _ocr_image(
+        self,
+        image: bytes,
+        mime_type: str,
+        page_number: int | None,
+        start_time: float,
+        **kwargs: Any,
+    ) -> OCRResult:
+        """Run Gemini OCR on encoded page image bytes."""
+        prompt = kwargs.get("prompt", self.OCR_PROMPT)
+        model = kwargs.get("model") or self.model
+
+        # Call Gemini API with the image bytes inline (with retry for rate limits)
+        image_part = self._image_part(image, mime_type)
+        response = self._call_api(model, image_part, prompt)
+
+        return self._build_result(response.text or "", model, page_number, start_time)
+
+    async def extract_text_async(
+        self,
+        file_path: Path,
+        page_number: int | None = None,
+        **kwargs: Any,
+    ) -> OCRResult:
+        """
+        Async variant of extract_text().
+
+        Rendering runs in a worker thread and the API call (including
+        rate-limit backoff) is awaited, so no thread is blocked while waiting
+        on Gemini.
+        """
+        if not self.is_available():
+            raise RuntimeError("Gemini API key not configured")
+
+        start_time = time.perf_counter()
         prompt = kwargs.get("prompt", self.OCR_PROMPT)
         model = kwargs.get("model") or self.model
 
-        # Convert PDF page to PIL Image
         if file_path.suffix.lower() == ".pdf":
             if page_number is None:
                 page_number = 1
-            image = self._pdf_page_to_image(file_path, page_number)
+            jpeg = await asyncio.to_thread(self._pdf_page_to_jpeg, file_path, page_number)
+            if jpeg is None:
+                return self._blank_result(page_number, start_time, **kwargs)
+            image, mime_type = jpeg, "image/jpeg"
         else:
-            from PIL import Image
+            image, mime_type = await asyncio.to_thread(self._read_image_file, file_path)
 
-            image = Image.open(file_path)
+        image_part = self._image_part(image, mime_type)
+        response = await self._call_api_async(model, image_part, prompt)
 
-        # Call Gemini API with PIL Image directly (with retry for rate limits)
-        response = self._call_api(model, image, prompt, types)
+        return self._build_result(response.text or "", model, page_number, start_time)
 
-        text = response.text or ""
-        processing_time = (time.time() - start_time) * 1000
+    def _build_result(
+        self, text: str, model: str, page_number: int | None, start_time: float
+    ) -> OCRResult:
+        """Wrap Gemini response text in an OCRResult and log the call."""
+        processing_time = (time.perf_counter() - start_time) * 1000
 
         logger.info(
             "Gemini OCR completed: model=%s, page=%s, words=%d, time=%.0fms",
@@ -148,55 +313,83 @@ Text:"""
             },
         )
 
-    @retry(
-        retry=retry_if_exception_type(GeminiRetryableError),
-        stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=2, min=5, max=60),
-        before_sleep=lambda retry_state: logger.warning(
-            "Gemini API rate limited, retrying in %.0fs (attempt %d/5)",
-            retry_state.next_action.sleep,  # type: ignore[union-attr]
-            retry_state.attempt_number,
-        ),
-        reraise=True,
-    )
-    def _call_api(self, model: str, image: Any, prompt: str, types: Any) -> Any:
-        """Call Gemini API with retry logic for rate limits."""
-        from google.genai import errors as genai_errors
+    def _blank_result(
+        self, page_number: int | None, start_time: float | None, **kwargs: Any
+    ) -> OCRResult:
+        """
+        Result for a blank (single-colour) page, produced without an API call.
+
+        ``start_time=None`` records no time, for pages whose render cost is
+        already counted in the document total.
+        """
+        processing_time = 0.0 if start_time is None else (time.perf_counter() - start_time) * 1000
+        return OCRResult(
+            text="",
+            confidence=1.0,
+            method=ExtractionMethod.LLM_OCR,
+            page_number=page_number,
+            metadata={
+                "model": kwargs.get("model") or self.model,
+                "backend": "gemini",
+                "processing_time_ms": processing_time,
+                "blank_page": True,
+            },
+        )
+
+    def _image_part(self, image: bytes, mime_type: str) -> Any:
+        """Wrap image bytes as an inline Part (ImportError if the SDK is missing)."""
+        self._get_client()
+        return genai_types.Part.from_bytes(data=image, mime_type=mime_type)
+
+    def _generate_config(self) -> Any:
+        """GenerateContentConfig for OCR requests."""
+        return genai_types.GenerateContentConfig(
+            temperature=self.temperature,
+            http_options=genai_types.HttpOptions(timeout=self.timeout * 1000),
+        )
 
+    @retry(**RETRY_POLICY)
+    def _call_api(self, model: str, image: Any, prompt: str) -> Any:
+        """Call Gemini API with retry logic for rate limits."""
         client = self._get_client()
         try:
             return client.models.generate_content(
                 model=model,
                 contents=[image, prompt],
-                config=types.GenerateContentConfig(
-                    temperature=self.temperature,
-                    http_options=types.HttpOptions(timeout=self.timeout * 1000),
-                ),
+                config=self._generate_config(),
             )
         except genai_errors.ClientError as exc:
-            if "429" in str(exc) or "RESOURCE_EXHAUSTED" in str(exc):
-                raise GeminiRetryableError(str(exc)) from exc
+            check_client_error(exc)
             raise  # Non-retryable client error
 
-    def _pdf_page_to_image(self, pdf_path: Path, page_number: int) -> Any:
-        """
-        Convert a PDF page to a PIL Image.
-
-        Args:
-            pdf_path: Path to PDF file
-            page_number: Page number (1-indexed)
+    async def _call_api_async(self, model: str, image: Any, prompt: str) -> Any:
+        """Async Gemini API call; rate-limit backoff sleeps without blocking a thread."""
+        client = self._get_client()
+        async for attempt in AsyncRetrying(**RETRY_POLICY):
+            with attempt:
+                try:
+                    return await client.aio.models.generate_content(
+                        model=model,
+                        contents=[image, prompt],
+                        config=self._generate_config(),
+                    )
+                except genai_errors.ClientError as exc:
+                    check_client_error(exc)
+                    raise  # Non-retryable client error
+
+    def _pdf_page_to_jpeg(self, pdf_path: Path, page_number: int) -> bytes | None:
+        """Render a PDF page (1-indexed) to JPEG bytes, or None for a blank page."""
+        return render_pages_jpeg(pdf_path, [page_number], self.RENDER_DPI, self.JPEG_QUALITY)[0]
+
+    def _read_image_file(self, file_path: Path) -> tuple[bytes, str]:
+        """Return (bytes, mime type) for an image file, converting to JPEG if needed."""
+        mime_type = self.IMAGE_MIME_TYPES.get(file_path.suffix.lower())
+        if mime_type is not None:
+            return file_path.read_bytes(), mime_type
 
-        Returns:
-            PIL.Image.Image
-        """
         from PIL import Image
 
-        doc = fitz.open(pdf_path)
-        try:
-            page = doc[page_number - 1]
-            mat = fitz.Matrix(2.0, 2.0)
-            pix = page.get_pixmap(matrix=mat)
-            png_bytes = pix.tobytes("png")
-            return Image.open(BytesIO(png_bytes))
-        finally:
-            doc.close()
+        buf = BytesIO()
+        with Image.open(file_path) as image:
+            image.convert("RGB").save(buf, format="JPEG", quality=self.JPEG_QUALITY)
+        return buf.getvalue(), "image/jpeg"
@@ -0,0 +1,54 @@
+"""
+Gemini Retry Policy
+===================
+
+Tenacity retry settings for Gemini API rate limits, shared by the sync and
+async calls in GeminiBackend.
+"""
+
+import logging
+from typing import Any
+
+from tenacity import (
+    retry_if_exception_type,
+    stop_after_attempt,
+    stop_after_delay,
+    wait_random_exponential,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class GeminiRetryableError(RuntimeError):
+    """Raised for Gemini API errors that are worth retrying (429, RESOURCE_EXHAUSTED)."""
+
+
+# Rate-limit retries stop at whichever comes first, so a throttled page gives
+# up its worker thread after ~30s instead of up to ~2 minutes
+RETRY_MAX_ATTEMPTS = 3
+RETRY_BUDGET_SECONDS = 30
+
+
+def _log_retry(retry_state: Any) -> None:
+    logger.warning(
+        "Gemini API rate limited, retrying in %.0fs (attempt %d/%d)",
+        retry_state.next_action.sleep,
+        retry_state.attempt_number,
+        RETRY_MAX_ATTEMPTS,
+    )
+
+
+# Jittered so workers that hit the rate limit together do not retry in lockstep
+RETRY_POLICY: dict[str, Any] = {
+    "retry": retry_if_exception_type(GeminiRetryableError),
+    "stop": stop_after_attempt(RETRY_MAX_ATTEMPTS) | stop_after_delay(RETRY_BUDGET_SECONDS),
+    "wait": wait_random_exponential(multiplier=2, min=5, max=60),
+    "before_sleep": _log_retry,
+    "reraise": True,
+}
+
+
+def check_client_error(exc: Exception) -> None:
+    """Raise GeminiRetryableError for rate-limit errors (429, RESOURCE_EXHAUSTED)."""
+    if "429" in str(exc) or "RESOURCE_EXHAUSTED" in str(exc):
+        raise GeminiRetryableError(str(exc)) from exc
@@ -6,17 +6,29 @@ LLM-based OCR using Langdock API (Claude, GPT-4o).
 Best quality OCR, especially for complex documents.
 """
 
-import os
+import asyncio
 import base64
+import mimetypes
+import os
 import time
-import tempfile
+from io import BytesIO
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Any, Dict, List, Optional
 
 import requests
-import fitz  # PyMuPDF
+from requests.adapters import HTTPAdapter
+from tenacity import Retrying
+from urllib3.util.retry import Retry
 
-from .base import BaseOCRBackend, OCRResult, ExtractionMethod
+from .base import BaseOCRBackend, DocumentOCRResult, ExtractionMethod, OCRResult
+from .langdock_retry import (
+    TRANSIENT_RETRY,
+    TRANSIENT_STATUS_CODES,
+    LangdockRateLimitError,
+    RateLimiter,
+    TransientAPIError,
+)
+from .rendering import render_page_image
 
 
 class LangdockBackend(BaseOCRBackend):
@@ -31,11 +43,22 @@ class LangdockBackend(BaseOCRBackend):
         LANGDOCK_UPLOAD_URL: Upload endpoint (default: https://api.langdock.com/attachment/v1/upload)
         LANGDOCK_ASSISTANT_URL: Chat completions endpoint
         LANGDOCK_OCR_MODEL: Model to use (default: claude-sonnet-4-5)
+        LANGDOCK_MAX_CONCURRENCY: Pages in flight in async extraction (default: 8)
+        LANGDOCK_RPS: Max requests started per second, retries included
+            (default: 0, unlimited)
+        OCR_MAX_SIDE: Downscale rendered pages whose longest side exceeds
+            this many pixels (default: 2200)
     """
 
     DEFAULT_UPLOAD_URL = "https://api.langdock.com/attachment/v1/upload"
     DEFAULT_ASSISTANT_URL = "https://api.langdock.com/assistant/v1/chat/completions"
     DEFAULT_MODEL = "claude-sonnet-4-5@20250929"
+    # Keep-alive connections per host; sized for concurrent page workers
+    POOL_SIZE = 32
+    # JPEG encodes several times faster than PNG and is smaller for scans
+    JPEG_QUALITY = 85
+    # Larger pages are downscaled: no gain in OCR quality, more upload/tokens
+    DEFAULT_MAX_SIDE = 2200
 
     OCR_PROMPT = """Extrahiere den gesamten Text aus diesem Dokument.
 
@@ -56,6 +79,10 @@ Text:"""
         assistant_url: Optional[str] = None,
         temperature: float = 0.0,
         timeout: int = 120,
+        max_concurrency: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+        dpi: int = 144,
+        max_side: Optional[int] = None,
     ):
         """
         Initialize Langdock backend.
@@ -67,15 +94,71 @@ Text:"""
             assistant_url: Chat completions endpoint URL
             temperature: Model temperature (0.0 for deterministic)
             timeout: Request timeout in seconds
+            max_concurrency: Pages OCR'd at the same time by the async methods
+            requests_per_second: Rate limit for API requests (0 = none)
+            dpi: DPI for PDF to image conversion (144 = 2x zoom)
+            max_side: Longest uploaded page side in pixels (or OCR_MAX_SIDE
+                env var, 0 = no limit)
         """
         super().__init__(name="Langdock")
 
         self.api_key = api_key or os.getenv("LANGDOCK_API_KEY")
         self.model = model or os.getenv("LANGDOCK_OCR_MODEL", self.DEFAULT_MODEL)
-        self.upload_url = upload_url or os.getenv("LANGDOCK_UPLOAD_URL", self.DEFAULT_UPLOAD_URL)
-        self.assistant_url = assistant_url or os.getenv("LANGDOCK_ASSISTANT_URL", self.DEFAULT_ASSISTANT_URL)
+        self.upload_url: str = (
+            upload_url or os.getenv("LANGDOCK_UPLOAD_URL") or self.DEFAULT_UPLOAD_URL
+        )
+        self.assistant_url: str = (
+            assistant_url or os.getenv("LANGDOCK_ASSISTANT_URL") or self.DEFAULT_ASSISTANT_URL
+        )
         self.temperature = temperature
         self.timeout = timeout
+        self.dpi = dpi
+        self.max_side = max_side if max_side is not None else int(
+            os.getenv("OCR_MAX_SIDE", str(self.DEFAULT_MAX_SIDE))
+        )
+        self.max_concurrency = max_concurrency or int(
+            os.getenv("LANGDOCK_MAX_CONCURRENCY", "8")
+        )
+        if requests_per_second is None:
+            requests_per_second = float(os.getenv("LANGDOCK_RPS", "0"))
+        self._rate_limiter = RateLimiter(requests_per_second)
+        self._session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """
+        Session reusing TCP/TLS connections across the upload and chat calls
+        of every page.
+
+        The adapter only retries failed connects (the request never reached
+        the server). Read timeouts are not replayed, since the completion may
+        already have run, and HTTP status retries are left to _post() so
+        Retry-After is capped and error bodies are classified.
+        """
+        session = requests.Session()
+        if self.api_key:
+            session.headers["Authorization"] = f"Bearer {self.api_key}"
+        retry = Retry(
+            total=3,
+            connect=3,
+            read=0,
+            status=0,
+            respect_retry_after_header=False,
+            backoff_factor=0.5,
+            allowed_methods=frozenset({"POST"}),
+        )
+        session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=self.POOL_SIZE,
+                pool_maxsize=self.POOL_SIZE,
+                max_retries=retry,
+            ),
+        )
+        return session
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._session.close()
 
     def is_available(self) -> bool:
         """Check if Langdock API is configured."""
@@ -101,7 +184,7 @@ Text:"""
         if not self.is_available():
             raise RuntimeError("Langdock API key not configured")
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         prompt = kwargs.get("prompt", self.OCR_PROMPT)
         timeout = kwargs.get("timeout", self.timeout)
 
@@ -110,15 +193,18 @@ Text:"""
             if page_number is None:
                 page_number = 1
             image_data = self._pdf_page_to_image(file_path, page_number)
+            upload_name, mime_type = f"{file_path.name}.jpg", "image/jpeg"
         else:
             # Direct image file
             with open(file_path, "rb") as f:
                 image_data = f.read()
+            upload_name = file_path.name
+            mime_type = mimetypes.guess_type(file_path.name)[0] or "image/png"
 
         # Upload image and get text
-        text = self._ocr_with_langdock(image_data, file_path.name, prompt, timeout)
+        text = self._ocr_with_langdock(image_data, upload_name, prompt, timeout, mime_type)
 
-        processing_time = (time.time() - start_time) * 1000
+        processing_time = (time.perf_counter() - start_time) * 1000
 
         return OCRResult(
             text=text,
@@ -131,71 +217,70 @@ Text:"""
             }
         )
 
-    def _pdf_page_to_image(self, pdf_path: Path, page_number: int) -> bytes:
-        """Convert a PDF page to PNG image bytes."""
-        doc = fitz.open(pdf_path)
-        try:
-            # page_number is 1-indexed, fitz uses 0-indexed
-            page = doc[page_number - 1]
+    async def extract_text_async(
+        self,
+        file_path: Path,
+        page_number: Optional[int] = None,
+        **kwargs: Any
+    ) -> OCRResult:
+        """
+        Async variant of extract_text() for concurrent page fan-out.
 
-            # Render at 2x resolution for better OCR
-            mat = fitz.Matrix(2.0, 2.0)
-            pix = page.get_pixmap(matrix=mat)
+        Rate limiting and transient-failure retries happen per request
+        inside extract_text(), on the worker thread.
+        """
+        return await asyncio.to_thread(
+            self.extract_text, file_path, page_number=page_number, **kwargs
+        )
 
-            return pix.tobytes("png")
-        finally:
-            doc.close()
+    async def extract_document_async(
+        self,
+        file_path: Path,
+        pages: Optional[List[int]] = None,
+        concurrency: Optional[int] = None,
+        **kwargs: Any
+    ) -> DocumentOCRResult:
+        """OCR pages concurrently, up to ``concurrency`` (default: self.max_concurrency)."""
+        return await super().extract_document_async(
+            file_path, pages, concurrency=concurrency or self.max_concurrency, **kwargs
+        )
+
+    def _pdf_page_to_image(self, pdf_path: Path, page_number: int) -> bytes:
+        """Convert a PDF page to JPEG image bytes."""
+        image = render_page_image(pdf_path, page_number, self.dpi, self.max_side)
+        buffer = BytesIO()
+        image.save(
+            buffer, format="JPEG", quality=self.JPEG_QUALITY, optimize=False, progressive=False
+        )
+        return buffer.getvalue()
 
     def _ocr_with_langdock(
         self,
         image_data: bytes,
         filename: str,
         prompt: str,
-        timeout: int
+        timeout: int,
+        mime_type: str = "image/jpeg",
     ) -> str:
         """
         Send image to Langdock for OCR.
 
         Args:
-            image_data: PNG image bytes
-            filename: Original filename for reference
+            image_data: Encoded image bytes
+            filename: Upload file name
             prompt: OCR extraction prompt
             timeout: Request timeout
+            mime_type: MIME type of image_data
 
         Returns:
             Extracted text
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-        }
-
-        # Step 1: Upload image
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            tmp.write(image_data)
-            tmp_path = tmp.name
-
-        try:
-            with open(tmp_path, "rb") as f:
-                files = {"file": (f"{filename}.png", f, "image/png")}
-                upload_response = requests.post(
-                    self.upload_url,
-                    headers=headers,
-                    files=files,
-                    timeout=timeout
-                )
-
-            if upload_response.status_code != 200:
-                raise RuntimeError(
-                    f"Upload failed: {upload_response.status_code} - {upload_response.text}"
-                )
-
-            attachment_id = upload_response.json()["attachmentId"]
-        finally:
-            os.unlink(tmp_path)
+        # Step 1: Upload image (multipart built straight from the bytes)
+        files = {"file": (filename, image_data, mime_type)}
+        upload_response = self._post(self.upload_url, "Upload", files=files, timeout=timeout)
+        attachment_id = upload_response.json()["attachmentId"]
 
         # Step 2: Send to LLM for OCR
-        headers["Content-Type"] = "application/json"
-
         payload = {
             "assistant": {
                 "name": "OCR-Assistent",
@@ -212,20 +297,55 @@ Text:"""
             ]
         }
 
-        response = requests.post(
-            self.assistant_url,
-            headers=headers,
-            json=payload,
-            timeout=timeout
-        )
-
-        if response.status_code != 200:
-            raise RuntimeError(
-                f"OCR failed: {response.status_code} - {response.text}"
-            )
+        response = self._post(self.assistant_url, "OCR", json=payload, timeout=timeout)
 
         return self._extract_text_from_response(response.json())
 
+    def _post(self, url: str, action: str, **kwargs: Any) -> requests.Response:
+        """
+        POST through the session, retrying transient failures (TRANSIENT_RETRY).
+
+        Every attempt waits for its own rate limiter slot, so retries count
+        against LANGDOCK_RPS too.
+        """
+        for attempt in Retrying(**TRANSIENT_RETRY):
+            with attempt:
+                self._rate_limiter.acquire()
+                response = self._session.post(url, **kwargs)
+                self._raise_for_status(response, action)
+        return response
+
+    @staticmethod
+    def _raise_for_status(response: requests.Response, action: str) -> None:
+        """
+        Raise for non-200 responses.
+
+        Rate/quota limits raise LangdockRateLimitError, other 5xx and
+        overload responses TransientAPIError (both retried), anything else
+        RuntimeError.
+        """
+        if response.status_code == 200:
+            return
+        message = f"{action} failed: {response.status_code} - {response.text}"
+        body = response.text.lower()
+        retry_after = LangdockBackend._retry_after(response)
+        if response.status_code == 429 or "rate limit" in body or "quota" in body:
+            raise LangdockRateLimitError(message, retry_after)
+        if response.status_code in TRANSIENT_STATUS_CODES or "overloaded" in body:
+            raise TransientAPIError(message, retry_after)
+        raise RuntimeError(message)
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> Optional[float]:
+        """Seconds from a numeric Retry-After header, or None."""
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return None
+
     def _extract_text_from_response(self, response: Dict[str, Any]) -> str:
         """Extract text content from Langdock API response."""
         if "result" not in response:
@@ -0,0 +1,78 @@
+"""
+Langdock Retry Policy
+=====================
+
+Transient-error classification, tenacity retry settings and request rate
+limiting for the Langdock upload and chat calls in LangdockBackend.
+"""
+
+import threading
+import time
+from typing import Any
+
+from tenacity import retry_if_exception_type, stop_after_attempt, wait_random_exponential
+
+
+class TransientAPIError(RuntimeError):
+    """Raised for Langdock failures worth retrying (429, 5xx, overload)."""
+
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class LangdockRateLimitError(TransientAPIError):
+    """Raised when Langdock rejects a request for rate or quota limits."""
+
+
+TRANSIENT_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Upper bound on a server-requested Retry-After wait, in seconds
+MAX_RETRY_AFTER = 60
+
+_backoff = wait_random_exponential(min=1, max=30)
+
+
+def _wait_transient(retry_state: Any) -> float:
+    """Wait as long as the server's Retry-After asks, else jittered exponential."""
+    retry_after: float | None = getattr(
+        retry_state.outcome.exception(), "retry_after", None
+    )
+    if retry_after is not None:
+        return min(retry_after, MAX_RETRY_AFTER)
+    return float(_backoff(retry_state))
+
+
+# Each upload/chat call is retried on transient failures instead of failing
+# the page (and with it the batch)
+TRANSIENT_RETRY: dict[str, Any] = {
+    "retry": retry_if_exception_type(TransientAPIError),
+    "stop": stop_after_attempt(5),
+    "wait": _wait_transient,
+    "reraise": True,
+}
+
+
+class RateLimiter:
+    """
+    Spaces request starts at least ``1 / requests_per_second`` apart.
+
+    Slots are reserved under a thread lock and waited for outside it, so one
+    limiter can be shared by all worker threads of a backend. Every request
+    attempt (upload, chat and their retries) takes a slot.
+    """
+
+    def __init__(self, requests_per_second: float):
+        self.min_interval = 1 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until this caller's request slot starts."""
+        if not self.min_interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.min_interval
+        if start > now:
+            time.sleep(start - now)
@@ -0,0 +1,237 @@
+"""
+Page Rendering
+==============
+
+Shared PDF page rasterisation for the image-based OCR backends.
+
+Rendering a page with MuPDF is the most expensive step per page after OCR
+itself. When the primary backend fails and the fallback runs on the same
+page, both go through render_page() so the bitmap is produced only once.
+
+Batch callers wrap a document in a PDFSession so its pages are rendered
+from one open handle instead of re-opening and re-parsing the PDF per page.
+render_pages_jpeg() and dedupe_renders() serve backends that upload encoded
+pages, skipping blank and repeated ones.
+"""
+
+import hashlib
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import fitz  # PyMuPDF
+
+from .base import FITZ_LOCK
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+# A 300 DPI A4 page is ~26 MB of RGB samples, so keep this small: the cache
+# only needs to bridge a primary/fallback attempt on the same page
+RENDER_CACHE_SIZE = int(os.getenv("RENDER_CACHE_SIZE", "8"))
+
+# Documents held open by active sessions, by resolved path (guarded by FITZ_LOCK)
+_session_documents: dict[str, fitz.Document] = {}
+
+
+class PDFSession:
+    """
+    Keep one fitz.Document open for a batch of pages.
+
+    While the session is active, render_page() and open_document() for the
+    same file use its handle. Nested sessions for the same file share the
+    outer handle; only the outermost one closes it.
+
+    Usage:
+        with PDFSession(pdf_path) as session:
+            for page_number in range(1, len(session.doc) + 1):
+                backend.extract_text(pdf_path, page_number=page_number)
+    """
+
+    def __init__(self, pdf_path: Path | str):
+        self.path = str(Path(pdf_path).resolve())
+        self.doc: fitz.Document | None = None
+        self._owner = False
+
+    def open(self) -> "PDFSession":
+        """Open (or join) the session; calling it again is a no-op."""
+        with FITZ_LOCK:
+            if self.doc is None:
+                self.doc = _session_documents.get(self.path)
+                if self.doc is None:
+                    self.doc = fitz.open(self.path)
+                    _session_documents[self.path] = self.doc
+                    self._owner = True
+        return self
+
+    def close(self) -> None:
+        """Leave the session, closing the document if this session opened it."""
+        with FITZ_LOCK:
+            if self._owner and self.doc is not None:
+                _session_documents.pop(self.path, None)
+                self.doc.close()
+                # MuPDF keeps decoded fonts/images after a document closes;
+                # drop them so long-running workers keep a stable resident set
+                fitz.TOOLS.store_shrink(100)
+            self.doc = None
+            self._owner = False
+
+    def __enter__(self) -> "PDFSession":
+        return self.open()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+@contextmanager
+def open_document(pdf_path: Path | str) -> Iterator[fitz.Document]:
+    """
+    Yield the session's document for pdf_path, or open it for this block.
+
+    Opening and closing take FITZ_LOCK; callers hold it around each use of
+    the document (e.g. per page).
+    """
+    with FITZ_LOCK:
+        doc = _session_documents.get(str(Path(pdf_path).resolve()))
+        owned = doc is None
+        if doc is None:
+            doc = fitz.open(pdf_path)
+    try:
+        yield doc
+    finally:
+        if owned:
+            # MuPDF's store is left alone here: shrinking it per page would
+            # throw away fonts/images the next page of the same document
+            # needs. PDFSession.close() shrinks it once the document is done.
+            with FITZ_LOCK:
+                doc.close()
+
+
+def render_page(pdf_path: Path | str, page_number: int, dpi: int) -> tuple[bytes, int, int]:
+    """
+    Render a PDF page to raw RGB samples.
+
+    Results are cached by path, file size, mtime, page and DPI, so a file
+    rewritten in place is rendered again.
+
+    Args:
+        pdf_path: Path to the PDF file
+        page_number: Page number (1-indexed)
+        dpi: Render resolution
+
+    Returns:
+        Tuple of (RGB bytes, width, height)
+    """
+    path = Path(pdf_path)
+    stat = path.stat()
+    return _render_page_cached(
+        str(path.resolve()), stat.st_size, stat.st_mtime_ns, page_number, dpi
+    )
+
+
+def render_page_image(
+    pdf_path: Path | str, page_number: int, dpi: int, max_side: int = 0
+) -> "Image.Image":
+    """
+    Render a PDF page to a PIL image, downscaled so its longest side is at
+    most max_side pixels (0 = no limit).
+
+    OCR quality saturates well below the size of a large page at 300 DPI,
+    while OCR CPU and LLM upload/token cost grow with the pixel count.
+    """
+    from PIL import Image
+
+    samples, width, height = render_page(pdf_path, page_number, dpi)
+    image = Image.frombytes("RGB", (width, height), samples)
+    scale = max_side / max(width, height) if max_side > 0 else 1.0
+    if scale < 1.0:
+        image.thumbnail(
+            (round(width * scale), round(height * scale)), Image.Resampling.LANCZOS
+        )
+    return image
+
+
+def render_pages_jpeg(
+    pdf_path: Path | str, page_numbers: list[int], dpi: int, quality: int
+) -> list[bytes | None]:
+    """
+    Render several PDF pages to JPEG bytes, opening the document once.
+
+    Args:
+        pdf_path: Path to the PDF file
+        page_numbers: Page numbers (1-indexed)
+        dpi: Render resolution
+        quality: JPEG quality (0-100)
+
+    Returns:
+        JPEG-encoded page images in the order of page_numbers, with None
+        for blank (single-colour) pages
+    """
+    zoom = dpi / 72
+    mat = fitz.Matrix(zoom, zoom)
+    images: list[bytes | None] = []
+    with open_document(pdf_path) as doc:
+        for page_number in page_numbers:
+            # Locked per page, so other documents' pages render in between
+            with FITZ_LOCK:
+                pix = doc[page_number - 1].get_pixmap(matrix=mat)
+                image = None if is_blank(pix) else pix.tobytes("jpeg", jpg_quality=quality)
+            images.append(image)
+    return images
+
+
+def dedupe_renders(
+    images: list[bytes | None],
+) -> tuple[list[tuple[int, bytes]], list[int | None]]:
+    """
+    Group identical page renders so each distinct image is processed once.
+
+    Args:
+        images: Encoded page images, None for blank pages
+
+    Returns:
+        Tuple of (unique, index): the (position, image) of the first
+        occurrence of each distinct image, and for every input its index
+        into unique (None for blank pages)
+    """
+    first_seen: dict[bytes, int] = {}
+    unique: list[tuple[int, bytes]] = []
+    index: list[int | None] = []
+    for position, image in enumerate(images):
+        if image is None:
+            index.append(None)
+            continue
+        digest = hashlib.blake2b(image, digest_size=16).digest()
+        if digest not in first_seen:
+            first_seen[digest] = len(unique)
+            unique.append((position, image))
+        index.append(first_seen[digest])
+    return unique, index
+
+
+def is_blank(pix: fitz.Pixmap) -> bool:
+    """True if every pixel has the same colour (one C-level bytes compare)."""
+    samples = pix.samples
+    return bool(samples == samples[: pix.n] * (len(samples) // pix.n))
+
+
+def cache_clear() -> None:
+    """Drop all cached renders; memory is otherwise bounded by RENDER_CACHE_SIZE."""
+    _render_page_cached.cache_clear()
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _render_page_cached(
+    path: str, size: int, mtime_ns: int, page_number: int, dpi: int
+) -> tuple[bytes, int, int]:
+    with FITZ_LOCK, open_document(path) as doc:
+        # page_number is 1-indexed, fitz uses 0-indexed
+        page = doc[page_number - 1]
+
+        # Calculate zoom factor for desired DPI (PDF default is 72 DPI)
+        zoom = dpi / 72
+        pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+        return pix.samples, pix.width, pix.height
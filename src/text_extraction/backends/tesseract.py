@@ -8,13 +8,62 @@ Local OCR using Tesseract. Free, offline, good for simple documents.
 import os
 import time
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Optional, List
 
-import fitz  # PyMuPDF
 from PIL import Image
 import pytesseract
 
-from .base import BaseOCRBackend, OCRResult, ExtractionMethod
+from .base import BaseOCRBackend, DocumentOCRResult, OCRResult, ExtractionMethod
+from .rendering import render_page_image
+
+# Typed as Any so the None fallback type-checks; numpy ships with the
+# tesseract extra but may be absent from a bare install
+np: Any
+try:
+    import numpy as np  # type: ignore[import-not-found, no-redef, unused-ignore]
+except ImportError:  # optional, only speeds up confidence aggregation
+    np = None
+
+
+def _text_from_data(data: dict) -> str:
+    """
+    Rebuild page text from image_to_data's word boxes.
+
+    Words on the same line are joined with spaces, lines with newlines and
+    paragraphs with a blank line, like image_to_string.
+    """
+    parts: list[str] = []
+    last_line = None
+    for row in zip(
+        data["page_num"], data["block_num"], data["par_num"], data["line_num"], data["text"]
+    ):
+        line, word = row[:4], str(row[4]).strip()
+        if not word:
+            continue
+        if last_line is not None:
+            if line[:3] != last_line[:3]:
+                parts.append("\n\n")
+            elif line != last_line:
+                parts.append("\n")
+            else:
+                parts.append(" ")
+        parts.append(word)
+        last_line = line
+    return "".join(parts)
+
+
+def _mean_confidence(conf: list) -> float:
+    """
+    Mean word confidence (0-1) from image_to_data's ``conf`` column.
+
+    Boxes that are not words carry -1 and are skipped; 0.5 if no words.
+    """
+    if np is not None:
+        values = np.asarray(conf, dtype=np.float32)
+        valid = values[values >= 0]
+        return float(valid.mean()) / 100 if valid.size else 0.5
+    valid = [c for c in map(float, conf) if c >= 0]
+    return sum(valid) / len(valid) / 100 if valid else 0.5
 
 
 class TesseractBackend(BaseOCRBackend):
@@ -29,13 +78,22 @@ class TesseractBackend(BaseOCRBackend):
     Environment variables:
         TESSERACT_PATH: Path to tesseract binary (default: /usr/bin/tesseract)
         TESSERACT_LANG: Languages to use (default: deu+eng)
+        OCR_CONCURRENCY: Parallel Tesseract processes for multi-page async
+            extraction (default: CPU count)
+        OCR_MAX_SIDE: Downscale rendered pages whose longest side exceeds
+            this many pixels (default: 4000)
     """
 
+    # Above A4/Letter at 300 DPI, so only oversized pages are downscaled
+    DEFAULT_MAX_SIDE = 4000
+
     def __init__(
         self,
         tesseract_path: Optional[str] = None,
         lang: Optional[str] = None,
         dpi: int = 300,
+        concurrency: Optional[int] = None,
+        max_side: Optional[int] = None,
     ):
         """
         Initialize Tesseract backend.
@@ -44,6 +102,9 @@ class TesseractBackend(BaseOCRBackend):
             tesseract_path: Path to tesseract binary
             lang: OCR languages (e.g., "deu+eng")
             dpi: DPI for PDF to image conversion
+            concurrency: Pages OCR'd at the same time by the async methods
+            max_side: Longest rendered page side in pixels (or OCR_MAX_SIDE
+                env var, 0 = no limit)
         """
         super().__init__(name="Tesseract")
 
@@ -52,17 +113,27 @@ class TesseractBackend(BaseOCRBackend):
         )
         self.lang = lang or os.getenv("TESSERACT_LANG", "deu+eng")
         self.dpi = dpi
+        self.max_side = max_side if max_side is not None else int(
+            os.getenv("OCR_MAX_SIDE", str(self.DEFAULT_MAX_SIDE))
+        )
+        # Each page is a separate tesseract subprocess, so pages scale across cores
+        self.concurrency = concurrency or int(
+            os.getenv("OCR_CONCURRENCY", str(os.cpu_count() or 1))
+        )
+        self._available: Optional[bool] = None
 
         # Configure pytesseract
         pytesseract.pytesseract.tesseract_cmd = self.tesseract_path
 
     def is_available(self) -> bool:
-        """Check if Tesseract is installed and accessible."""
-        try:
-            pytesseract.get_tesseract_version()
-            return True
-        except Exception:
-            return False
+        """Check if Tesseract is installed and accessible (probed once)."""
+        if self._available is None:
+            try:
+                pytesseract.get_tesseract_version()
+                self._available = True
+            except Exception:
+                self._available = False
+        return self._available
 
     def extract_text(
         self,
@@ -84,7 +155,7 @@ class TesseractBackend(BaseOCRBackend):
         if not self.is_available():
             raise RuntimeError("Tesseract is not available")
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         lang = kwargs.get("lang", self.lang)
         dpi = kwargs.get("dpi", self.dpi)
         config = kwargs.get("config", "")
@@ -97,26 +168,14 @@ class TesseractBackend(BaseOCRBackend):
         else:
             image = Image.open(file_path)
 
-        # Run Tesseract OCR
-        text = pytesseract.image_to_string(
-            image,
-            lang=lang,
-            config=config
+        # Run Tesseract OCR once; text and confidence both come from the word boxes
+        data = pytesseract.image_to_data(
+            image, lang=lang, config=config, output_type=pytesseract.Output.DICT
         )
+        text = _text_from_data(data)
+        confidence = _mean_confidence(data["conf"])
 
-        # Get confidence if available
-        try:
-            data = pytesseract.image_to_data(
-                image, lang=lang, output_type=pytesseract.Output.DICT
-            )
-            confidences = [
-                int(c) for c in data["conf"] if c != "-1" and str(c).isdigit()
-            ]
-            confidence = sum(confidences) / len(confidences) / 100 if confidences else 0.5
-        except Exception:
-            confidence = 0.5
-
-        processing_time = (time.time() - start_time) * 1000
+        processing_time = (time.perf_counter() - start_time) * 1000
 
         return OCRResult(
             text=text.strip(),
@@ -130,6 +189,23 @@ class TesseractBackend(BaseOCRBackend):
             }
         )
 
+    async def extract_document_async(
+        self,
+        file_path: Path,
+        pages: Optional[List[int]] = None,
+        concurrency: Optional[int] = None,
+        **kwargs: Any
+    ) -> DocumentOCRResult:
+        """
+        OCR pages concurrently, up to ``concurrency`` (default: self.concurrency).
+
+        The tesseract subprocesses run outside the GIL, so overlapping them
+        scales with the number of cores.
+        """
+        return await super().extract_document_async(
+            file_path, pages, concurrency=concurrency or self.concurrency, **kwargs
+        )
+
     def _pdf_page_to_pil(
         self,
         pdf_path: Path,
@@ -137,21 +213,7 @@ class TesseractBackend(BaseOCRBackend):
         dpi: int = 300
     ) -> Image.Image:
         """Convert a PDF page to PIL Image."""
-        doc = fitz.open(pdf_path)
-        try:
-            # page_number is 1-indexed, fitz uses 0-indexed
-            page = doc[page_number - 1]
-
-            # Calculate zoom factor for desired DPI (PDF default is 72 DPI)
-            zoom = dpi / 72
-            mat = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat)
-
-            # Convert to PIL Image
-            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-            return img
-        finally:
-            doc.close()
+        return render_page_image(pdf_path, page_number, dpi, self.max_side)
 
     def get_available_languages(self) -> List[str]:
         """Get list of installed Tesseract languages."""
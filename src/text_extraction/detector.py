@@ -6,7 +6,8 @@ Block-Type Based PDF Classification using PyMuPDF's native block detection.
 
 This module provides precise PDF classification (Pure Text, Pure Image, Hybrid)
 based on PyMuPDF's block['type'] property, which is more reliable than
-line-counting heuristics.
+line-counting heuristics. Result types and the document-level summary live
+in detector_result, the worker pool and result cache in detector_parallel.
 
 Motivation:
 - Hybrid PDFs are currently treated as Pure Image (expensive OCR for all pages)
@@ -30,68 +31,30 @@ Author: Claude Code (Issue #4 Phase 0)
 Date: 2025-10-24
 """
 
-from pathlib import Path
-from dataclasses import dataclass, field
-from typing import List, Dict, Tuple
-from enum import Enum
 import logging
+from pathlib import Path
+from typing import BinaryIO, List, Tuple
+
 import fitz  # PyMuPDF
 
+from .backends.base import FITZ_LOCK
+from .detector_parallel import (
+    PARALLEL_MIN_PAGES,
+    classify_file_cached,
+    count_blocks,
+    count_blocks_parallel,
+)
+from .detector_result import (
+    PageAnalysis,
+    PDFClassificationResult,
+    PDFType,
+    summarize_pages,
+)
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
-class PDFType(Enum):
-    """PDF classification based on content structure."""
-    PURE_TEXT = "pure_text"    # All pages have readable text blocks
-    PURE_IMAGE = "pure_image"  # All pages are scanned/image-based
-    HYBRID = "hybrid"          # Mixed: some text pages, some image pages
-    UNKNOWN = "unknown"        # Classification failed or empty PDF
-
-
-@dataclass
-class PageAnalysis:
-    """Analysis result for a single page."""
-    page_number: int  # 1-indexed
-    text_blocks: int
-    image_blocks: int
-    total_blocks: int
-    is_text_dominant: bool  # True if text_blocks > image_blocks
-    is_image_dominant: bool  # True if image_blocks > text_blocks
-    has_mixed_content: bool  # True if both text and image blocks present
-
-
-@dataclass
-class PDFClassificationResult:
-    """Complete PDF classification result."""
-    pdf_type: PDFType
-    total_pages: int
-    text_pages: List[int] = field(default_factory=list)   # Pages with text
-    image_pages: List[int] = field(default_factory=list)  # Pages with images
-    hybrid_pages: List[int] = field(default_factory=list) # Pages with both
-
-    # Statistics
-    total_text_blocks: int = 0
-    total_image_blocks: int = 0
-    page_analyses: List[PageAnalysis] = field(default_factory=list)
-
-    # Confidence score (0.0-1.0)
-    confidence: float = 1.0
-
-    def __str__(self) -> str:
-        """Human-readable representation."""
-        return (
-            f"PDFType: {self.pdf_type.value}\n"
-            f"Pages: {self.total_pages} "
-            f"(Text: {len(self.text_pages)}, "
-            f"Image: {len(self.image_pages)}, "
-            f"Hybrid: {len(self.hybrid_pages)})\n"
-            f"Blocks: {self.total_text_blocks} text, "
-            f"{self.total_image_blocks} image\n"
-            f"Confidence: {self.confidence:.2f}"
-        )
-
-
 class PDFTypeDetector:
     """
     PDF Type Detector using PyMuPDF block['type'] detection.
@@ -108,7 +71,10 @@ class PDFTypeDetector:
     def __init__(
         self,
         text_block_threshold: int = 2,
-        image_block_threshold: int = 1
+        image_block_threshold: int = 1,
+        n_workers: int = 0,
+        early_exit: bool = False,
+        early_exit_pages: int = 5
     ):
         """
         Initialize PDF Type Detector.
@@ -116,9 +82,19 @@ class PDFTypeDetector:
         Args:
             text_block_threshold: Min text blocks for "text page" (default: 2)
             image_block_threshold: Min image blocks for "image page" (default: 1)
+            n_workers: Processes used to classify large PDFs from a path
+                (default: 0, serial; values > 1 need an ``if __name__ ==
+                "__main__"`` guard in the calling script, see detector_parallel)
+            early_exit: Stop after the first early_exit_pages pages if they
+                are all text or all image pages, assuming the rest match
+                (default: False, every page is analysed)
+            early_exit_pages: Leading pages that must agree for an early exit
         """
         self.text_block_threshold = text_block_threshold
         self.image_block_threshold = image_block_threshold
+        self.n_workers = n_workers
+        self.early_exit = early_exit
+        self.early_exit_pages = early_exit_pages
 
         logger.info(
             f"PDFTypeDetector initialized: "
@@ -141,36 +117,8 @@ class PDFTypeDetector:
         Returns:
             PageAnalysis with block counts and classification
         """
-        text_blocks = 0
-        image_blocks = 0
-
-        # Get page blocks in dict format
-        blocks = page.get_text("dict")["blocks"]
-
-        for block in blocks:
-            block_type = block.get("type", -1)
-
-            if block_type == 0:  # Text block
-                text_blocks += 1
-            elif block_type == 1:  # Image block
-                image_blocks += 1
-
-        total_blocks = text_blocks + image_blocks
-
-        # Classify page
-        is_text_dominant = text_blocks >= self.text_block_threshold
-        is_image_dominant = image_blocks >= self.image_block_threshold
-        has_mixed_content = is_text_dominant and is_image_dominant
-
-        return PageAnalysis(
-            page_number=page_number,
-            text_blocks=text_blocks,
-            image_blocks=image_blocks,
-            total_blocks=total_blocks,
-            is_text_dominant=is_text_dominant,
-            is_image_dominant=is_image_dominant,
-            has_mixed_content=has_mixed_content
-        )
+        text_blocks, image_blocks = self._count_blocks(page)
+        return self._build_analysis(page_number, text_blocks, image_blocks)
 
     def classify_pdf(self, pdf_path: Path | str) -> PDFClassificationResult:
         """
@@ -191,138 +139,178 @@ class PDFTypeDetector:
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
+        # Size and mtime are part of the key, so a rewritten file is re-classified
+        stat = pdf_path.stat()
+        return classify_file_cached(
+            str(pdf_path.resolve()),
+            stat.st_size,
+            stat.st_mtime_ns,
+            self.text_block_threshold,
+            self.image_block_threshold,
+            self.n_workers,
+            self.early_exit,
+            self.early_exit_pages,
+        )
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached classify_pdf() results (shared by all detectors)."""
+        classify_file_cached.cache_clear()
+
+    def _classify_file(self, pdf_path: Path) -> PDFClassificationResult:
+        """Classify a PDF on disk (uncached)."""
         logger.info(f"Classifying PDF: {pdf_path.name}")
 
         try:
-            doc = fitz.open(pdf_path)
-            total_pages = len(doc)
-
-            if total_pages == 0:
-                logger.warning(f"Empty PDF: {pdf_path.name}")
-                doc.close()
-                return PDFClassificationResult(
-                    pdf_type=PDFType.UNKNOWN,
-                    total_pages=0,
-                    confidence=0.0
-                )
-
-            # Analyze each page
-            page_analyses = []
-            text_pages = []
-            image_pages = []
-            hybrid_pages = []
-            total_text_blocks = 0
-            total_image_blocks = 0
-
-            for page_num in range(total_pages):
-                page = doc[page_num]
-                analysis = self.analyze_page(page, page_num + 1)
-
-                page_analyses.append(analysis)
-                total_text_blocks += analysis.text_blocks
-                total_image_blocks += analysis.image_blocks
-
-                # Categorize page
-                if analysis.has_mixed_content:
-                    hybrid_pages.append(page_num + 1)
-                elif analysis.is_text_dominant:
-                    text_pages.append(page_num + 1)
-                elif analysis.is_image_dominant:
-                    image_pages.append(page_num + 1)
-                else:
-                    # Page has insufficient blocks - treat as image (scanned)
-                    image_pages.append(page_num + 1)
-
-            doc.close()
-
-            # Classify PDF based on page composition
-            pdf_type = self._classify_pdf_type(
-                total_pages=total_pages,
-                text_page_count=len(text_pages),
-                image_page_count=len(image_pages),
-                hybrid_page_count=len(hybrid_pages)
-            )
+            with FITZ_LOCK:
+                doc = fitz.open(pdf_path)
+            try:
+                with FITZ_LOCK:
+                    block_counts = self._count_blocks_sampled(doc) if self.early_exit else None
+                    total_pages = len(doc)
+                if (
+                    block_counts is None
+                    and self.n_workers > 1
+                    and total_pages >= PARALLEL_MIN_PAGES
+                ):
+                    # Workers have their own MuPDF, so the lock is free meanwhile
+                    block_counts = self._count_blocks_parallel(pdf_path, total_pages)
+                with FITZ_LOCK:
+                    return self._classify_document(doc, pdf_path.name, block_counts)
+            finally:
+                with FITZ_LOCK:
+                    doc.close()
+                    # Free the closed document's decoded fonts/images from MuPDF's store
+                    fitz.TOOLS.store_shrink(100)
+        except Exception as e:
+            logger.error(f"Error classifying PDF {pdf_path.name}: {e}")
+            raise
 
-            # Calculate confidence
-            confidence = self._calculate_confidence(
-                total_text_blocks=total_text_blocks,
-                total_image_blocks=total_image_blocks,
-                total_pages=total_pages
-            )
+    def classify_pdf_stream(
+        self,
+        data: bytes | BinaryIO,
+        name: str = "stream"
+    ) -> PDFClassificationResult:
+        """
+        Classify an in-memory PDF (e.g. an upload) without a temp file.
 
-            result = PDFClassificationResult(
-                pdf_type=pdf_type,
-                total_pages=total_pages,
-                text_pages=text_pages,
-                image_pages=image_pages,
-                hybrid_pages=hybrid_pages,
-                total_text_blocks=total_text_blocks,
-                total_image_blocks=total_image_blocks,
-                page_analyses=page_analyses,
-                confidence=confidence
-            )
+        Args:
+            data: PDF content as bytes or a binary file object
+            name: Name used in log messages
 
-            logger.info(
-                f"PDF classified: {pdf_path.name} → {pdf_type.value} "
-                f"({len(text_pages)} text, {len(image_pages)} image, "
-                f"{len(hybrid_pages)} hybrid pages)"
-            )
+        Returns:
+            PDFClassificationResult with classification and statistics
+
+        Raises:
+            Exception: If PDF cannot be opened or processed
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            data = data.read()
 
-            return result
+        logger.info(f"Classifying PDF: {name}")
 
+        try:
+            with FITZ_LOCK:
+                try:
+                    with fitz.open(stream=data, filetype="pdf") as doc:
+                        block_counts = (
+                            self._count_blocks_sampled(doc) if self.early_exit else None
+                        )
+                        return self._classify_document(doc, name, block_counts)
+                finally:
+                    fitz.TOOLS.store_shrink(100)
         except Exception as e:
-            logger.error(f"Error classifying PDF {pdf_path.name}: {e}")
+            logger.error(f"Error classifying PDF {name}: {e}")
             raise
 
-    def _classify_pdf_type(
+    def _classify_document(
         self,
-        total_pages: int,
-        text_page_count: int,
-        image_page_count: int,
-        hybrid_page_count: int
-    ) -> PDFType:
+        doc: fitz.Document,
+        name: str,
+        block_counts: List[Tuple[int, int]] | None = None
+    ) -> PDFClassificationResult:
         """
-        Classify PDF type based on page composition.
+        Classify an open document (shared by classify_pdf and classify_pdf_stream).
 
-        Logic:
-        - PURE_TEXT: All pages are text-dominant
-        - PURE_IMAGE: All pages are image-dominant
-        - HYBRID: Mixed pages
+        block_counts may cover only the leading pages (early exit); the
+        remaining pages then take the category of those pages.
         """
-        if text_page_count == total_pages:
-            return PDFType.PURE_TEXT
+        # Single pass over the document collecting block counts (unless they
+        # were gathered in parallel); classification then runs on plain integers.
+        if block_counts is None:
+            block_counts = [self._count_blocks(page) for page in doc]
 
-        if image_page_count == total_pages:
-            return PDFType.PURE_IMAGE
+        total_pages = len(doc)
+        if total_pages == 0:
+            logger.warning(f"Empty PDF: {name}")
+            return PDFClassificationResult(
+                pdf_type=PDFType.UNKNOWN,
+                total_pages=0,
+                confidence=0.0
+            )
 
-        # Any mix of page types = HYBRID
-        return PDFType.HYBRID
+        page_analyses = [
+            self._build_analysis(page_num, text_blocks, image_blocks)
+            for page_num, (text_blocks, image_blocks) in enumerate(block_counts, start=1)
+        ]
+        return summarize_pages(page_analyses, total_pages, name)
 
-    def _calculate_confidence(
-        self,
-        total_text_blocks: int,
-        total_image_blocks: int,
-        total_pages: int
-    ) -> float:
+    def _count_blocks_sampled(self, doc: fitz.Document) -> List[Tuple[int, int]] | None:
         """
-        Calculate classification confidence score.
+        Block counts for the leading early_exit_pages pages if they all agree.
 
-        High confidence: Clear dominance of one block type
-        Low confidence: Roughly equal text/image blocks
+        Returns None (count every page) when the document is no longer than
+        the sample or the sampled pages are not all text or all image pages.
         """
-        if total_pages == 0:
-            return 0.0
-
-        total_blocks = total_text_blocks + total_image_blocks
+        sample_size = max(1, self.early_exit_pages)
+        if len(doc) <= sample_size:
+            return None
+
+        block_counts = []
+        categories = set()
+        for page_index in range(sample_size):
+            counts = self._count_blocks(doc[page_index])
+            analysis = self._build_analysis(page_index + 1, *counts)
+            if analysis.has_mixed_content:
+                return None
+            categories.add(analysis.is_text_dominant)
+            if len(categories) > 1:
+                return None
+            block_counts.append(counts)
+        return block_counts
+
+    def _count_blocks_parallel(
+        self,
+        pdf_path: Path,
+        total_pages: int
+    ) -> List[Tuple[int, int]]:
+        """Count blocks over contiguous page ranges, one range per worker process."""
+        return count_blocks_parallel(pdf_path, total_pages, self.n_workers)
 
-        if total_blocks == 0:
-            return 0.5  # No blocks found - uncertain
+    @staticmethod
+    def _count_blocks(page: fitz.Page) -> Tuple[int, int]:
+        """Count (text, image) blocks on a page via the block type."""
+        return count_blocks(page)
 
-        # Calculate ratio of dominant type
-        max_blocks = max(total_text_blocks, total_image_blocks)
-        confidence = max_blocks / total_blocks
+    def _build_analysis(
+        self,
+        page_number: int,
+        text_blocks: int,
+        image_blocks: int
+    ) -> PageAnalysis:
+        """Build a PageAnalysis from block counts using the configured thresholds."""
+        is_text_dominant = text_blocks >= self.text_block_threshold
+        is_image_dominant = image_blocks >= self.image_block_threshold
 
-        return confidence
+        return PageAnalysis(
+            page_number=page_number,
+            text_blocks=text_blocks,
+            image_blocks=image_blocks,
+            total_blocks=text_blocks + image_blocks,
+            is_text_dominant=is_text_dominant,
+            is_image_dominant=is_image_dominant,
+            has_mixed_content=is_text_dominant and is_image_dominant
+        )
 
 
 # Helper function for quick classification
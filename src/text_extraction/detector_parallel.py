@@ -0,0 +1,146 @@
+"""
+PDF Type Detector - Workers and Cache
+=====================================
+
+Process pool and result cache behind PDFTypeDetector.
+
+Large PDFs are classified across worker processes: each worker counts the
+blocks of a contiguous page range with count_blocks_range(), which lives at
+module level (and does not import the detector) so the "spawn" pool can
+pickle it. Parallel mode is opt-in (n_workers > 1): a "spawn" pool
+re-imports the caller's __main__ module, which crashes scripts that do not
+guard their entry point with ``if __name__ == "__main__"``.
+
+classify_pdf() results for files on disk are cached by path,
+size, mtime and detector settings.
+"""
+
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import fitz  # PyMuPDF
+
+from .backends.base import FITZ_LOCK
+
+if TYPE_CHECKING:
+    from .detector_result import PDFClassificationResult
+
+logger = logging.getLogger(__name__)
+
+# PDFs with at least this many pages are classified across worker processes
+# (when n_workers > 1); below that, process start-up costs more than it saves
+PARALLEL_MIN_PAGES = 8
+
+# Worker pools shared by all detectors, keyed by worker count. "spawn" avoids
+# forking a multi-threaded server process.
+_process_pools: dict[int, ProcessPoolExecutor] = {}
+_process_pools_lock = threading.Lock()
+
+# Results of classify_pdf() for recently seen files. The detector settings
+# are part of the key, so equally configured detectors share entries (and
+# short-lived detectors are not kept alive by the cache) while different
+# thresholds are respected. Callers must treat cached results as read-only.
+CLASSIFY_CACHE_SIZE = 512
+
+
+def get_process_pool(n_workers: int) -> ProcessPoolExecutor:
+    """Return the shared pool with n_workers processes, starting it on first use."""
+    with _process_pools_lock:
+        pool = _process_pools.get(n_workers)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _process_pools[n_workers] = pool
+        return pool
+
+
+def count_blocks(page: fitz.Page) -> tuple[int, int]:
+    """Count (text, image) blocks on a page via the block type."""
+    # "blocks" yields flat (x0, y0, x1, y1, text, block_no, block_type)
+    # tuples instead of the full line/span tree (and embedded image data)
+    # that "dict" builds; the dict flags keep block segmentation and image
+    # blocks identical.
+    blocks = page.get_text("blocks", flags=fitz.TEXTFLAGS_DICT)
+    text_blocks = sum(1 for block in blocks if block[6] == 0)
+    image_blocks = sum(1 for block in blocks if block[6] == 1)
+
+    return text_blocks, image_blocks
+
+
+def count_blocks_range(pdf_path: str, start: int, end: int) -> list[tuple[int, int]]:
+    """
+    (text, image) block counts for pages [start, end); runs in a worker process.
+
+    Each worker has its own MuPDF, so FITZ_LOCK is not needed here.
+    """
+    try:
+        with fitz.open(pdf_path) as doc:
+            return [count_blocks(doc[i]) for i in range(start, end)]
+    finally:
+        # Long-lived pool worker: don't let MuPDF's store grow across documents
+        fitz.TOOLS.store_shrink(100)
+
+
+def discard_process_pool(n_workers: int, pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next call starts a fresh one."""
+    with _process_pools_lock:
+        # Another thread may already have replaced it
+        if _process_pools.get(n_workers) is pool:
+            del _process_pools[n_workers]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def count_blocks_parallel(
+    pdf_path: Path, total_pages: int, n_workers: int
+) -> list[tuple[int, int]]:
+    """
+    Count blocks over contiguous page ranges, one range per worker process.
+
+    If the pool is broken (a worker died, e.g. OOM-killed), it is discarded
+    and the pages are counted serially in this process instead.
+    """
+    chunk = -(-total_pages // n_workers)  # ceil division
+    pool = get_process_pool(n_workers)
+    try:
+        futures = [
+            pool.submit(count_blocks_range, str(pdf_path), start, min(start + chunk, total_pages))
+            for start in range(0, total_pages, chunk)
+        ]
+        return [counts for future in futures for counts in future.result()]
+    except BrokenProcessPool:
+        logger.warning(f"Classification worker pool broke, counting {pdf_path.name} serially")
+        discard_process_pool(n_workers, pool)
+        with FITZ_LOCK, fitz.open(pdf_path) as doc:
+            return [count_blocks(page) for page in doc]
+
+
+@lru_cache(maxsize=CLASSIFY_CACHE_SIZE)
+def classify_file_cached(
+    path: str,
+    size: int,
+    mtime_ns: int,
+    text_block_threshold: int,
+    image_block_threshold: int,
+    n_workers: int,
+    early_exit: bool,
+    early_exit_pages: int,
+) -> "PDFClassificationResult":
+    """Classify the PDF at path with a detector built from the given settings."""
+    from .detector import PDFTypeDetector
+
+    detector = PDFTypeDetector(
+        text_block_threshold=text_block_threshold,
+        image_block_threshold=image_block_threshold,
+        n_workers=n_workers,
+        early_exit=early_exit,
+        early_exit_pages=early_exit_pages,
+    )
+    return detector._classify_file(Path(path))
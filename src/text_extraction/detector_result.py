@@ -0,0 +1,189 @@
+"""
+PDF Type Detector - Results
+===========================
+
+Classification result types and the document-level summary that
+PDFTypeDetector builds from its per-page analyses.
+
+A page is text if it has at least text_block_threshold text blocks, hybrid
+if it also reaches image_block_threshold, and image otherwise (pages with
+too few blocks are treated as scanned). The document is PURE_TEXT or
+PURE_IMAGE when every page agrees, HYBRID otherwise.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from enum import Enum
+
+logger = logging.getLogger(__name__)
+
+
+class PDFType(Enum):
+    """PDF classification based on content structure."""
+    PURE_TEXT = "pure_text"    # All pages have readable text blocks
+    PURE_IMAGE = "pure_image"  # All pages are scanned/image-based
+    HYBRID = "hybrid"          # Mixed: some text pages, some image pages
+    UNKNOWN = "unknown"        # Classification failed or empty PDF
+
+
+@dataclass
+class PageAnalysis:
+    """Analysis result for a single page."""
+    page_number: int  # 1-indexed
+    text_blocks: int
+    image_blocks: int
+    total_blocks: int
+    is_text_dominant: bool  # True if text_blocks > image_blocks
+    is_image_dominant: bool  # True if image_blocks > text_blocks
+    has_mixed_content: bool  # True if both text and image blocks present
+
+
+@dataclass
+class PDFClassificationResult:
+    """Complete PDF classification result."""
+    pdf_type: PDFType
+    total_pages: int
+    text_pages: list[int] = field(default_factory=list)   # Pages with text
+    image_pages: list[int] = field(default_factory=list)  # Pages with images
+    hybrid_pages: list[int] = field(default_factory=list) # Pages with both
+
+    # Statistics
+    total_text_blocks: int = 0
+    total_image_blocks: int = 0
+    page_analyses: list[PageAnalysis] = field(default_factory=list)
+
+    # Confidence score (0.0-1.0)
+    confidence: float = 1.0
+
+    # True if only the leading pages were analysed (early exit); the rest
+    # are assumed to match them and have no PageAnalysis
+    sampled_only: bool = False
+
+    def __str__(self) -> str:
+        """Human-readable representation."""
+        return (
+            f"PDFType: {self.pdf_type.value}\n"
+            f"Pages: {self.total_pages} "
+            f"(Text: {len(self.text_pages)}, "
+            f"Image: {len(self.image_pages)}, "
+            f"Hybrid: {len(self.hybrid_pages)})\n"
+            f"Blocks: {self.total_text_blocks} text, "
+            f"{self.total_image_blocks} image\n"
+            f"Confidence: {self.confidence:.2f}"
+        )
+
+
+def summarize_pages(
+    page_analyses: list[PageAnalysis],
+    total_pages: int,
+    name: str
+) -> PDFClassificationResult:
+    """
+    Build the document-level result from per-page analyses.
+
+    page_analyses may cover only the leading pages (early exit); the
+    remaining pages then take the category of those pages.
+    """
+    sampled_only = len(page_analyses) < total_pages
+    total_text_blocks = sum(a.text_blocks for a in page_analyses)
+    total_image_blocks = sum(a.image_blocks for a in page_analyses)
+
+    # Categorize pages; pages with insufficient blocks are treated as
+    # image (scanned)
+    hybrid_pages = [a.page_number for a in page_analyses if a.has_mixed_content]
+    text_pages = [
+        a.page_number for a in page_analyses
+        if a.is_text_dominant and not a.has_mixed_content
+    ]
+    image_pages = [
+        a.page_number for a in page_analyses
+        if not a.is_text_dominant
+    ]
+    if sampled_only:
+        unsampled = range(len(page_analyses) + 1, total_pages + 1)
+        (text_pages if text_pages else image_pages).extend(unsampled)
+
+    # Classify PDF based on page composition
+    pdf_type = classify_pdf_type(
+        total_pages=total_pages,
+        text_page_count=len(text_pages),
+        image_page_count=len(image_pages),
+        hybrid_page_count=len(hybrid_pages)
+    )
+
+    # Calculate confidence; an early exit only vouches for the pages it read
+    if sampled_only:
+        confidence = len(page_analyses) / total_pages
+    else:
+        confidence = calculate_confidence(
+            total_text_blocks=total_text_blocks,
+            total_image_blocks=total_image_blocks,
+            total_pages=total_pages
+        )
+
+    logger.info(
+        f"PDF classified: {name} → {pdf_type.value} "
+        f"({len(text_pages)} text, {len(image_pages)} image, "
+        f"{len(hybrid_pages)} hybrid pages)"
+    )
+
+    return PDFClassificationResult(
+        pdf_type=pdf_type,
+        total_pages=total_pages,
+        text_pages=text_pages,
+        image_pages=image_pages,
+        hybrid_pages=hybrid_pages,
+        total_text_blocks=total_text_blocks,
+        total_image_blocks=total_image_blocks,
+        page_analyses=page_analyses,
+        confidence=confidence,
+        sampled_only=sampled_only
+    )
+
+
+def classify_pdf_type(
+    total_pages: int,
+    text_page_count: int,
+    image_page_count: int,
+    hybrid_page_count: int
+) -> PDFType:
+    """
+    Classify PDF type based on page composition.
+
+    Logic:
+    - PURE_TEXT: All pages are text-dominant
+    - PURE_IMAGE: All pages are image-dominant
+    - HYBRID: Mixed pages
+    """
+    if text_page_count == total_pages:
+        return PDFType.PURE_TEXT
+
+    if image_page_count == total_pages:
+        return PDFType.PURE_IMAGE
+
+    # Any mix of page types = HYBRID
+    return PDFType.HYBRID
+
+
+def calculate_confidence(
+    total_text_blocks: int,
+    total_image_blocks: int,
+    total_pages: int
+) -> float:
+    """
+    Calculate classification confidence score.
+
+    High confidence: Clear dominance of one block type
+    Low confidence: Roughly equal text/image blocks
+    """
+    if total_pages == 0:
+        return 0.0
+
+    total_blocks = total_text_blocks + total_image_blocks
+
+    if total_blocks == 0:
+        return 0.5  # No blocks found - uncertain
+
+    # Calculate ratio of dominant type
+    max_blocks = max(total_text_blocks, total_image_blocks)
+    return max_blocks / total_blocks
@@ -7,7 +7,7 @@ Shared data models for the text extraction service.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, Literal
 
 from text_extraction.backends.base import PageOCRResult
 
@@ -20,6 +20,10 @@ class Quality(Enum):
     ACCURATE = "accurate"  # OCR verification for all pages
 
 
+# Quality values as a type, for validating request parameters
+QualityLevel = Literal["fast", "balanced", "accurate"]
+
+
 @dataclass
 class ProcessorConfig:
     """Configuration for TwoPassProcessor."""
@@ -29,6 +33,9 @@ class ProcessorConfig:
     confidence_threshold: float = 0.8
     fallback_on_error: bool = True
     include_page_markers: bool = True
+    page_batch_size: int = 4  # OCR pages per worker task
+    max_page_workers: int = 4  # Concurrent OCR tasks per document
+    detector_workers: int = 0  # Processes for classifying large PDFs (0 = serial)
 
 
 @dataclass
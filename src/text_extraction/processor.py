@@ -16,14 +16,16 @@ Usage:
 """
 
 import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import fitz  # PyMuPDF
 
-logger = logging.getLogger(__name__)
-
 from text_extraction import PDFClassificationResult, PDFTypeDetector
+from text_extraction.backends import rendering
 from text_extraction.backends.base import (
+    FITZ_LOCK,
     BaseOCRBackend,
     ExtractionMethod,
     PageOCRResult,
@@ -35,6 +37,8 @@ from text_extraction.models import (
     ProcessorConfig,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class TwoPassProcessor:
     """Two-pass OCR processor for PDF text extraction with fallback support."""
@@ -56,13 +60,15 @@ class TwoPassProcessor:
         self.primary_backend = primary_backend
         self.fallback_backend = fallback_backend
         self.config = config or ProcessorConfig()
-        self.detector = PDFTypeDetector()
+        self.detector = PDFTypeDetector(n_workers=self.config.detector_workers)
 
     def extract(
         self,
         pdf_path: Path,
         quality: str = "balanced",
         model: str | None = None,
+        progress_callback: Callable[[int, int], None] | None = None,
+        page_callback: Callable[[PageOCRResult], None] | None = None,
     ) -> ExtractionResult:
         """
         Extract text from a PDF file using the two-pass strategy.
@@ -71,13 +77,16 @@ class TwoPassProcessor:
             pdf_path: Path to the PDF file
             quality: Extraction quality ("fast", "balanced", "accurate")
             model: Optional model override for OCR backend
+            progress_callback: Optional callback(completed_pages, total_pages)
+            page_callback: Optional callback(page_result), called as each page
+                completes (not necessarily in page order)
 
         Returns:
             ExtractionResult with extracted text and metadata
         """
         import time
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         pdf_path = Path(pdf_path)
 
         if not pdf_path.exists():
@@ -100,8 +109,9 @@ class TwoPassProcessor:
         # Build backend status
         backend_status = self._build_backend_status()
 
-        # Open document
-        doc = fitz.open(pdf_path)
+        # Open document once: direct text and every OCR render share this handle
+        session = rendering.PDFSession(pdf_path).open()
+        doc = session.doc
         try:
             # Process all pages
             page_results, page_errors = self._process_pages(
@@ -110,6 +120,8 @@ class TwoPassProcessor:
                 classification=classification,
                 quality=quality,
                 model=model,
+                progress_callback=progress_callback,
+                page_callback=page_callback,
             )
 
             # Update backend status with page counts
@@ -134,7 +146,7 @@ class TwoPassProcessor:
                 page_results=page_results,
             )
 
-            processing_time = (time.time() - start_time) * 1000
+            processing_time = (time.perf_counter() - start_time) * 1000
 
             return ExtractionResult(
                 success=True,
@@ -158,7 +170,7 @@ class TwoPassProcessor:
             )
 
         except Exception as e:
-            processing_time = (time.time() - start_time) * 1000
+            processing_time = (time.perf_counter() - start_time) * 1000
             return ExtractionResult(
                 success=False,
                 file_name=pdf_path.name,
@@ -172,7 +184,10 @@ class TwoPassProcessor:
                 error=str(e),
             )
         finally:
-            doc.close()
+            # Cached page renders are left to the LRU bound (RENDER_CACHE_SIZE):
+            # clearing them here would also drop renders of documents that
+            # other workers are still processing
+            session.close()
 
     def _process_pages(
         self,
@@ -181,69 +196,162 @@ class TwoPassProcessor:
         classification: PDFClassificationResult,
         quality: str,
         model: str | None = None,
+        progress_callback: Callable[[int, int], None] | None = None,
+        page_callback: Callable[[PageOCRResult], None] | None = None,
     ) -> tuple[list[PageOCRResult], list[PageError]]:
         """
         Process all pages of the document.
 
+        Pages that need OCR are split into batches of ``config.page_batch_size``
+        and run on up to ``config.max_page_workers`` threads, while direct pages
+        are extracted on the calling thread. Results are returned in page order.
+
         Args:
             doc: PyMuPDF document object
             pdf_path: Path to PDF file
             classification: PDF classification result
             quality: Extraction quality preference
             model: Optional model override for OCR backend
+            progress_callback: Optional callback(completed_pages, total_pages)
+            page_callback: Optional callback(page_result) per completed page
 
         Returns:
             Tuple of (page results, page errors)
         """
         import time
 
-        results: list[PageOCRResult] = []
-        page_errors: list[PageError] = []
-
-        for page_num in range(len(doc)):
-            page_start = time.time()
-            page = doc[page_num]
-            page_number = page_num + 1  # 1-indexed
-
-            # Determine if this page needs OCR
-            needs_ocr = self._page_needs_ocr(
+        with FITZ_LOCK:
+            total_pages = len(doc)
+        ocr_pages = [
+            page_number
+            for page_number in range(1, total_pages + 1)
+            if self.primary_backend
+            and self._page_needs_ocr(
                 page_number=page_number,
                 classification=classification,
                 quality=quality,
             )
+        ]
+        batch_size = max(1, self.config.page_batch_size)
+        batches = [
+            ocr_pages[i : i + batch_size] for i in range(0, len(ocr_pages), batch_size)
+        ]
 
-            # Extract text
-            text, method, backend_name, error = self._extract_page_text(
-                page=page,
-                pdf_path=pdf_path,
-                page_number=page_number,
-                needs_ocr=needs_ocr,
-                model=model,
+        results: list[PageOCRResult] = []
+        page_errors: list[PageError] = []
+        completed = 0
+
+        def report(pages_done: int) -> None:
+            nonlocal completed
+            completed += pages_done
+            if progress_callback is not None:
+                progress_callback(completed, total_pages)
+
+        def add(result: PageOCRResult) -> None:
+            results.append(result)
+            if page_callback is not None:
+                page_callback(result)
+
+        pool: ThreadPoolExecutor | None = None
+        futures = []
+        if batches:
+            pool = ThreadPoolExecutor(
+                max_workers=max(1, min(len(batches), self.config.max_page_workers))
             )
+            futures = [
+                pool.submit(self._ocr_page_batch, pdf_path, batch, model)
+                for batch in batches
+            ]
 
-            if error and needs_ocr:
-                page_errors.append(
-                    PageError(
-                        page_number=page_number,
-                        backend=backend_name,
-                        error=error,
+        try:
+            # Direct pages are extracted here while the OCR batches run
+            ocr_set = set(ocr_pages)
+            for page_number in range(1, total_pages + 1):
+                if page_number in ocr_set:
+                    continue
+                page_start = time.perf_counter()
+                with FITZ_LOCK:
+                    text = doc[page_number - 1].get_text()
+                add(
+                    self._page_result(
+                        page_number, text, ExtractionMethod.DIRECT, page_start
                     )
                 )
+            report(total_pages - len(ocr_set))
+
+            for future in as_completed(futures):
+                batch_results = future.result()
+                for page_number, text, method, backend_name, error, page_start in (
+                    batch_results
+                ):
+                    if not text.strip():
+                        # OCR failed or returned empty — fall back to direct text
+                        with FITZ_LOCK:
+                            text = doc[page_number - 1].get_text()
+                        method = ExtractionMethod.DIRECT
+                    if error:
+                        page_errors.append(
+                            PageError(
+                                page_number=page_number,
+                                backend=backend_name,
+                                error=error,
+                            )
+                        )
+                    add(self._page_result(page_number, text, method, page_start))
+                report(len(batch_results))
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
 
-            page_time = (time.time() - page_start) * 1000
+        results.sort(key=lambda r: r.page_number)
+        page_errors.sort(key=lambda e: e.page_number)
+        return results, page_errors
 
-            results.append(
-                PageOCRResult(
-                    page_number=page_number,
-                    text=text,
-                    confidence=1.0 if method == ExtractionMethod.DIRECT else 0.9,
-                    method=method,
-                    word_count=len(text.split()) if text else 0,
-                    processing_time_ms=page_time,
-                )
+    def _ocr_page_batch(
+        self,
+        pdf_path: Path,
+        page_numbers: list[int],
+        model: str | None = None,
+    ) -> list[tuple[int, str, ExtractionMethod, str, str | None, float]]:
+        """
+        OCR a batch of pages (runs on a worker thread).
+
+        Returns:
+            List of (page_number, text, method, backend_name, error, start_time)
+        """
+        import time
+
+        batch_results = []
+        for page_number in page_numbers:
+            page_start = time.perf_counter()
+            text, method, backend_name, error = self._extract_with_ocr(
+                pdf_path=pdf_path,
+                page_number=page_number,
+                model=model,
             )
+            batch_results.append(
+                (page_number, text, method, backend_name, error, page_start)
+            )
+        return batch_results
 
-        return results, page_errors
+    @staticmethod
+    def _page_result(
+        page_number: int,
+        text: str,
+        method: ExtractionMethod,
+        page_start: float,
+    ) -> PageOCRResult:
+        """Build a PageOCRResult, timing the page from ``page_start``."""
+        import time
+
+        return PageOCRResult(
+            page_number=page_number,
+            text=text,
+            confidence=1.0 if method == ExtractionMethod.DIRECT else 0.9,
+            method=method,
+            word_count=len(text.split()) if text else 0,
+            processing_time_ms=(time.perf_counter() - page_start) * 1000,
+        )
 
     def _page_needs_ocr(
         self,
@@ -275,43 +383,6 @@ class TwoPassProcessor:
 
         return False
 
-    def _extract_page_text(
-        self,
-        page: fitz.Page,
-        pdf_path: Path,
-        page_number: int,
-        needs_ocr: bool,
-        model: str | None = None,
-    ) -> tuple[str, ExtractionMethod, str, str | None]:
-        """
-        Extract text from a single page.
-
-        Args:
-            page: PyMuPDF page object
-            pdf_path: Path to PDF file
-            page_number: 1-indexed page number
-            needs_ocr: Whether to use OCR for this page
-            model: Optional model override for OCR backend
-
-        Returns:
-            Tuple of (text, method, backend_name, error_message)
-        """
-        if needs_ocr and self.primary_backend:
-            text, method, backend_name, error = self._extract_with_ocr(
-                pdf_path=pdf_path,
-                page_number=page_number,
-                model=model,
-            )
-            if text.strip():
-                return text, method, backend_name, None
-            # OCR failed or returned empty — fall through to direct with error
-            direct_text = page.get_text()
-            return direct_text, ExtractionMethod.DIRECT, "direct", error
-
-        # Direct extraction (no OCR needed or no backend)
-        text = page.get_text()
-        return text, ExtractionMethod.DIRECT, "direct", None
-
     def _extract_with_ocr(
         self,
         pdf_path: Path,
@@ -9,6 +9,9 @@ Test Coverage:
 - Default implementations
 """
 
+import subprocess
+import sys
+
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -220,6 +223,17 @@ class TestDocumentOCRResult:
         assert result.full_text == ""
 
 
+    @pytest.mark.unit
+    def test_result_dataclasses_use_slots(self):
+        """OCR result dataclasses use __slots__ (no per-instance __dict__)."""
+        page = PageOCRResult(1, "Text", 0.9, ExtractionMethod.DIRECT)
+        document = DocumentOCRResult(
+            success=True, file_name="test.pdf", pages=[page], total_pages=1
+        )
+
+        for obj in (OCRResult(text="Text"), page, document):
+            assert not hasattr(obj, "__dict__")
+
 # =============================================================================
 # Test: BaseOCRBackend Abstract Class
 # =============================================================================
@@ -376,6 +390,65 @@ class TestBaseOCRBackend:
             assert page.processing_time_ms >= 0
 
 
+    @pytest.mark.unit
+    async def test_backend_extract_document_async_all_pages(self, create_multipage_text_pdf):
+        """extract_document_async should return every page in page order."""
+        backend = ConcreteOCRBackend()
+        pdf_path = create_multipage_text_pdf("async.pdf", pages=4)
+
+        result = await backend.extract_document_async(pdf_path, concurrency=2)
+
+        assert result.success is True
+        assert [p.page_number for p in result.pages] == [1, 2, 3, 4]
+        assert result.total_word_count == 8
+
+    @pytest.mark.unit
+    async def test_backend_extract_document_async_limits_concurrency(
+        self, create_multipage_text_pdf
+    ):
+        """No more than `concurrency` pages should be extracted at once."""
+        import threading
+        import time
+
+        lock = threading.Lock()
+        active = {"now": 0, "max": 0}
+
+        class SlowBackend(ConcreteOCRBackend):
+            def extract_text(self, file_path, page_number=None, **kwargs):
+                with lock:
+                    active["now"] += 1
+                    active["max"] = max(active["max"], active["now"])
+                time.sleep(0.02)
+                with lock:
+                    active["now"] -= 1
+                return OCRResult(text=f"page {page_number}")
+
+        pdf_path = create_multipage_text_pdf("slow.pdf", pages=6)
+
+        result = await SlowBackend().extract_document_async(pdf_path, concurrency=2)
+
+        assert result.success is True
+        assert active["max"] <= 2
+
+    @pytest.mark.unit
+    async def test_backend_extract_document_async_partial_failure(
+        self, create_multipage_text_pdf
+    ):
+        """Failed pages are reported while successful pages are kept."""
+        class FlakyBackend(ConcreteOCRBackend):
+            def extract_text(self, file_path, page_number=None, **kwargs):
+                if page_number == 2:
+                    raise RuntimeError("Simulated page error")
+                return OCRResult(text="ok")
+
+        pdf_path = create_multipage_text_pdf("flaky.pdf", pages=3)
+
+        result = await FlakyBackend().extract_document_async(pdf_path)
+
+        assert result.success is False
+        assert [p.page_number for p in result.pages] == [1, 3]
+        assert "page 2: Simulated page error" in result.error
+
 # =============================================================================
 # Test: Backend Inheritance Pattern
 # =============================================================================
@@ -404,3 +477,37 @@ class TestBackendInheritance:
 
         with pytest.raises(TypeError):
             PartialBackend()
+
+
+# =============================================================================
+# Package Re-exports
+# =============================================================================
+
+class TestBackendsPackage:
+    """Tests for lazy backend exports in text_extraction.backends."""
+
+    @pytest.mark.unit
+    def test_backends_imported_on_first_access(self):
+        """Concrete backend modules load only when their name is accessed."""
+        code = (
+            "import sys, text_extraction.backends as b\n"
+            "assert 'text_extraction.backends.gemini' not in sys.modules\n"
+            "assert b.GeminiBackend.__module__ == 'text_extraction.backends.gemini'\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    @pytest.mark.unit
+    def test_all_names_resolve(self):
+        """Every name in __all__ is importable from the package."""
+        import text_extraction.backends as backends
+
+        for name in backends.__all__:
+            assert getattr(backends, name) is not None
+
+    @pytest.mark.unit
+    def test_unknown_name_raises(self):
+        """Unknown attributes raise AttributeError."""
+        import text_extraction.backends as backends
+
+        with pytest.raises(AttributeError):
+            backends.NoSuchBackend
@@ -6,7 +6,7 @@ Unit tests for the Google Gemini OCR backend.
 """
 
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -89,6 +89,23 @@ class TestGeminiBackendAvailability:
         backend = GeminiBackend(api_key="")
         assert backend.is_available() is False
 
+    def test_client_requires_genai_sdk(self):
+        """A missing google-genai install surfaces as ImportError on first use."""
+        backend = GeminiBackend(api_key="test-key")
+        with patch("text_extraction.backends.gemini.genai", None):
+            with pytest.raises(ImportError, match="google-genai"):
+                backend._get_client()
+
+    def test_extract_requires_genai_sdk(self, create_text_pdf):
+        """extract_text() raises ImportError, not AttributeError, without the SDK."""
+        backend = GeminiBackend(api_key="test-key")
+        with (
+            patch("text_extraction.backends.gemini.genai", None),
+            patch("text_extraction.backends.gemini.genai_types", None),
+        ):
+            with pytest.raises(ImportError, match="google-genai"):
+                backend.extract_text(create_text_pdf(), page_number=1)
+
 
 # =============================================================================
 # TestGeminiBackendExtraction
@@ -163,6 +180,45 @@ class TestGeminiBackendExtraction:
 
         assert result.page_number == 1
 
+    @patch("text_extraction.backends.gemini.GeminiBackend._get_client")
+    def test_pdf_page_sent_as_jpeg_bytes(self, mock_get_client, create_text_pdf):
+        """PDF pages are sent to the API as inline JPEG bytes."""
+        mock_response = MagicMock()
+        mock_response.text = "Text"
+
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = mock_response
+        mock_get_client.return_value = mock_client
+
+        backend = GeminiBackend(api_key="test-key")
+        backend.extract_text(create_text_pdf(), page_number=1)
+
+        image_part = mock_client.models.generate_content.call_args.kwargs["contents"][0]
+        assert image_part.inline_data.mime_type == "image/jpeg"
+        assert image_part.inline_data.data.startswith(b"\xff\xd8")
+
+    @patch("text_extraction.backends.gemini.GeminiBackend._get_client")
+    def test_png_file_sent_unchanged(self, mock_get_client, temp_dir):
+        """Supported image files are sent as-is with their MIME type."""
+        from PIL import Image
+
+        mock_response = MagicMock()
+        mock_response.text = "Text"
+
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = mock_response
+        mock_get_client.return_value = mock_client
+
+        image_path = temp_dir / "scan.png"
+        Image.new("RGB", (20, 20), "white").save(image_path)
+
+        backend = GeminiBackend(api_key="test-key")
+        backend.extract_text(image_path)
+
+        image_part = mock_client.models.generate_content.call_args.kwargs["contents"][0]
+        assert image_part.inline_data.mime_type == "image/png"
+        assert image_part.inline_data.data == image_path.read_bytes()
+
     @patch("text_extraction.backends.gemini.GeminiBackend._get_client")
     def test_extract_empty_response(self, mock_get_client, create_text_pdf):
         """Handles empty response text gracefully."""
@@ -180,6 +236,75 @@ class TestGeminiBackendExtraction:
         assert result.text == ""
 
 
+# =============================================================================
+# TestGeminiDocumentExtraction
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestGeminiDocumentExtraction:
+    """Test GeminiBackend.extract_document page rendering and fan-out."""
+
+    @patch("text_extraction.backends.gemini.GeminiBackend._get_client")
+    def test_document_opened_once(self, mock_get_client, create_multipage_text_pdf):
+        """All pages are rendered from a single fitz.open call."""
+        import fitz
+
+        mock_response = MagicMock()
+        mock_response.text = "Seite"
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = mock_response
+        mock_get_client.return_value = mock_client
+
+        backend = GeminiBackend(api_key="test-key")
+        pdf_path = create_multipage_text_pdf(pages=3)
+
+        with patch("text_extraction.backends.rendering.fitz.open", wraps=fitz.open) as mock_open:
+            result = backend.extract_document(pdf_path, pages=[1, 2, 3])
+
+        assert mock_open.call_count == 1
+        assert result.success is True
+        assert [p.page_number for p in result.pages] == [1, 2, 3]
+        assert mock_client.models.generate_content.call_count == 3
+
+    @patch("text_extraction.backends.gemini.GeminiBackend._get_client")
+    def test_duplicate_and_blank_pages_skipped(self, mock_get_client, temp_dir):
+        """Identical pages are OCR'd once and blank pages not at all."""
+        import fitz
+
+        mock_response = MagicMock()
+        mock_response.text = "Briefkopf"
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = mock_response
+        mock_get_client.return_value = mock_client
+
+        pdf_path = temp_dir / "letterhead.pdf"
+        doc = fitz.open()
+        for content in ("Briefkopf GmbH", "Briefkopf GmbH", None, "Rechnung 42"):
+            page = doc.new_page()
+            if content:
+                page.insert_text((72, 72), content, fontsize=12)
+        doc.save(str(pdf_path))
+        doc.close()
+
+        backend = GeminiBackend(api_key="test-key")
+        result = backend.extract_document(pdf_path)
+
+        assert mock_client.models.generate_content.call_count == 2
+        assert [p.page_number for p in result.pages] == [1, 2, 3, 4]
+        assert result.pages[1].text == result.pages[0].text
+        assert result.pages[2].text == ""
+
+    def test_document_without_key_fails(self, create_multipage_text_pdf):
+        """Missing API key yields an unsuccessful DocumentOCRResult."""
+        backend = GeminiBackend(api_key="")
+
+        result = backend.extract_document(create_multipage_text_pdf(pages=2))
+
+        assert result.success is False
+        assert "Gemini API key not configured" in result.error
+
+
 # =============================================================================
 # TestGeminiModelRouting
 # =============================================================================
@@ -308,6 +433,127 @@ class TestGeminiRetryBehavior:
         backend = GeminiBackend(api_key="test-key")
         pdf_path = create_text_pdf()
 
-        with patch.dict("sys.modules", {"google.genai.errors": mock_errors_module}):
+        with patch("text_extraction.backends.gemini.genai_errors", mock_errors_module):
             with pytest.raises(type(auth_error)):
                 backend.extract_text(pdf_path, page_number=1)
+        assert mock_client.models.generate_content.call_count == 1
+
+    def test_retry_wait_is_jittered(self):
+        """Backoff uses random exponential wait so workers don't retry in lockstep."""
+        from tenacity import wait_random_exponential
+
+        from text_extraction.backends.gemini_retry import RETRY_POLICY
+
+        assert isinstance(RETRY_POLICY["wait"], wait_random_exponential)
+
+    @patch("text_extraction.backends.gemini.GeminiBackend._get_client")
+    def test_rate_limit_gives_up_after_max_attempts(self, mock_get_client, create_text_pdf):
+        """Persistent 429s stop after RETRY_MAX_ATTEMPTS calls."""
+        from tenacity import wait_none
+
+        from text_extraction.backends import gemini, gemini_retry
+
+        rate_limited = type("ClientError", (Exception,), {"__str__": lambda self: "429"})
+        mock_client = MagicMock()
+        mock_client.models.generate_content.side_effect = rate_limited()
+        mock_get_client.return_value = mock_client
+        mock_errors_module = MagicMock()
+        mock_errors_module.ClientError = rate_limited
+
+        backend = GeminiBackend(api_key="test-key")
+        with (
+            patch.object(gemini, "genai_errors", mock_errors_module),
+            patch.object(GeminiBackend._call_api.retry, "wait", wait_none()),
+        ):
+            with pytest.raises(GeminiRetryableError):
+                backend.extract_text(create_text_pdf(), page_number=1)
+
+        assert mock_client.models.generate_content.call_count == gemini_retry.RETRY_MAX_ATTEMPTS
+
+    def test_retry_budget_caps_total_delay(self):
+        """The stop condition also ends retries once the time budget is spent."""
+        from text_extraction.backends.gemini_retry import RETRY_BUDGET_SECONDS, RETRY_POLICY
+
+        state = MagicMock(attempt_number=1, seconds_since_start=RETRY_BUDGET_SECONDS + 1)
+        assert RETRY_POLICY["stop"](state) is True
+
+
+# =============================================================================
+# TestGeminiAsyncExtraction
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestGeminiAsyncExtraction:
+    """Test the async API path (AsyncRetrying, awaited generate_content)."""
+
+    @staticmethod
+    def _client_error(message: str) -> Exception:
+        return type("ClientError", (Exception,), {"__str__": lambda self: message})()
+
+    @patch("text_extraction.backends.gemini.GeminiBackend._get_client")
+    async def test_extract_text_async(self, mock_get_client, create_text_pdf):
+        """Async extraction awaits the aio client and builds an OCRResult."""
+        mock_response = MagicMock()
+        mock_response.text = "Async text"
+        mock_client = MagicMock()
+        mock_client.aio.models.generate_content = AsyncMock(return_value=mock_response)
+        mock_get_client.return_value = mock_client
+
+        backend = GeminiBackend(api_key="test-key")
+        result = await backend.extract_text_async(create_text_pdf(), page_number=1)
+
+        assert result.text == "Async text"
+        assert result.method == ExtractionMethod.LLM_OCR
+        mock_client.aio.models.generate_content.assert_awaited_once()
+        mock_client.models.generate_content.assert_not_called()
+
+    @patch("text_extraction.backends.gemini.GeminiBackend._get_client")
+    async def test_async_rate_limit_retried(self, mock_get_client, create_text_pdf):
+        """429 on the async path is retried, then succeeds."""
+        from tenacity import wait_none
+
+        from text_extraction.backends import gemini, gemini_retry
+
+        mock_response = MagicMock()
+        mock_response.text = "ok"
+        rate_limited = self._client_error("429 Too Many Requests")
+        mock_client = MagicMock()
+        mock_client.aio.models.generate_content = AsyncMock(
+            side_effect=[rate_limited, mock_response]
+        )
+        mock_get_client.return_value = mock_client
+        mock_errors_module = MagicMock()
+        mock_errors_module.ClientError = type(rate_limited)
+
+        backend = GeminiBackend(api_key="test-key")
+        with (
+            patch.object(gemini, "genai_errors", mock_errors_module),
+            patch.dict(gemini_retry.RETRY_POLICY, {"wait": wait_none()}),
+        ):
+            result = await backend.extract_text_async(create_text_pdf(), page_number=1)
+
+        assert result.text == "ok"
+        assert mock_client.aio.models.generate_content.await_count == 2
+
+    @patch("text_extraction.backends.gemini.GeminiBackend._get_client")
+    async def test_async_auth_error_not_retried(self, mock_get_client, create_text_pdf):
+        """Non-rate-limit errors propagate from the async path on the first attempt."""
+        auth_error = self._client_error("401 Unauthorized")
+        mock_client = MagicMock()
+        mock_client.aio.models.generate_content = AsyncMock(side_effect=auth_error)
+        mock_get_client.return_value = mock_client
+        mock_errors_module = MagicMock()
+        mock_errors_module.ClientError = type(auth_error)
+
+        backend = GeminiBackend(api_key="test-key")
+        with patch("text_extraction.backends.gemini.genai_errors", mock_errors_module):
+            with pytest.raises(type(auth_error)):
+                await backend.extract_text_async(create_text_pdf(), page_number=1)
+        assert mock_client.aio.models.generate_content.await_count == 1
+
+    async def test_async_without_key_raises(self, create_text_pdf):
+        """Async extraction also requires an API key."""
+        backend = GeminiBackend(api_key="")
+        with pytest.raises(RuntimeError, match="API key"):
+            await backend.extract_text_async(create_text_pdf(), page_number=1)
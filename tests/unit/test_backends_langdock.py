@@ -0,0 +1,315 @@
+"""
+Tests for LangdockBackend
+=========================
+
+Unit tests for the Langdock OCR backend (HTTP calls are mocked).
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from tenacity import wait_none
+
+from text_extraction.backends import langdock_retry
+from text_extraction.backends.base import ExtractionMethod
+from text_extraction.backends.langdock import (
+    LangdockBackend,
+    LangdockRateLimitError,
+    TransientAPIError,
+)
+
+
+def _response(status_code: int = 200, json_data=None, headers=None) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = json_data
+    response.text = str(json_data)
+    response.headers = headers or {}
+    return response
+
+
+# =============================================================================
+# TestLangdockSession
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestLangdockSession:
+    """Test connection reuse through the shared requests.Session."""
+
+    def test_session_carries_auth_header(self):
+        """The API key is set once on the session, not per request."""
+        backend = LangdockBackend(api_key="secret")
+        assert backend._session.headers["Authorization"] == "Bearer secret"
+
+    def test_session_pool_size(self):
+        """HTTPS requests go through a pooled adapter sized POOL_SIZE."""
+        backend = LangdockBackend(api_key="secret")
+        adapter = backend._session.get_adapter("https://api.langdock.com/")
+        assert adapter._pool_maxsize == LangdockBackend.POOL_SIZE
+        # Only failed connects are retried by the adapter: status retries are
+        # left to _post() and read timeouts are never replayed
+        retries = adapter.max_retries
+        assert (retries.connect, retries.read, retries.status) == (3, 0, 0)
+        assert retries.respect_retry_after_header is False
+
+    def test_pages_reuse_session(self, create_multipage_text_pdf, sample_ocr_text_response):
+        """Upload and chat calls for every page go through the same session."""
+        backend = LangdockBackend(api_key="secret")
+        pdf_path = create_multipage_text_pdf(pages=2)
+
+        with patch.object(backend._session, "post") as mock_post:
+            mock_post.side_effect = [
+                _response(json_data={"attachmentId": "att-1"}),
+                _response(json_data=sample_ocr_text_response),
+                _response(json_data={"attachmentId": "att-2"}),
+                _response(json_data=sample_ocr_text_response),
+            ]
+            for page in (1, 2):
+                result = backend.extract_text(pdf_path, page_number=page)
+                assert result.method == ExtractionMethod.LLM_OCR
+
+        assert mock_post.call_count == 4
+        chat_call = mock_post.call_args_list[1]
+        assert chat_call.args[0] == backend.assistant_url
+        assert chat_call.kwargs["json"]["messages"][0]["attachmentIds"] == ["att-1"]
+
+    def test_upload_sent_from_memory(self, create_text_pdf, sample_ocr_text_response):
+        """The page image is posted as in-memory multipart, no temp file involved."""
+        backend = LangdockBackend(api_key="secret")
+
+        with (
+            patch.object(backend._session, "post") as mock_post,
+            patch("tempfile.NamedTemporaryFile") as mock_tmp,
+        ):
+            mock_post.side_effect = [
+                _response(json_data={"attachmentId": "att-1"}),
+                _response(json_data=sample_ocr_text_response),
+            ]
+            backend.extract_text(create_text_pdf(), page_number=1)
+
+        mock_tmp.assert_not_called()
+        name, data, mime_type = mock_post.call_args_list[0].kwargs["files"]["file"]
+        assert name == "text.pdf.jpg"
+        assert data.startswith(b"\xff\xd8")
+        assert mime_type == "image/jpeg"
+
+    def test_image_file_uploaded_as_is(self, temp_dir, sample_ocr_text_response):
+        """Direct image files keep their bytes, name and MIME type."""
+        from PIL import Image
+
+        image_path = temp_dir / "scan.png"
+        Image.new("RGB", (10, 10), "white").save(image_path)
+        backend = LangdockBackend(api_key="secret")
+
+        with patch.object(backend._session, "post") as mock_post:
+            mock_post.side_effect = [
+                _response(json_data={"attachmentId": "att-1"}),
+                _response(json_data=sample_ocr_text_response),
+            ]
+            backend.extract_text(image_path)
+
+        name, data, mime_type = mock_post.call_args_list[0].kwargs["files"]["file"]
+        assert name == "scan.png"
+        assert data == image_path.read_bytes()
+        assert mime_type == "image/png"
+
+    def test_upload_error_raises(self, create_text_pdf):
+        """A non-retryable upload error surfaces as RuntimeError after one try."""
+        backend = LangdockBackend(api_key="secret")
+
+        with patch.object(backend._session, "post", return_value=_response(400, {})) as mock_post:
+            with pytest.raises(RuntimeError, match="Upload failed: 400"):
+                backend.extract_text(create_text_pdf(), page_number=1)
+
+        mock_post.assert_called_once()
+
+    def test_close_closes_session(self):
+        """close() releases pooled connections."""
+        backend = LangdockBackend(api_key="secret")
+        with patch.object(backend._session, "close") as mock_close:
+            backend.close()
+        mock_close.assert_called_once()
+
+
+# =============================================================================
+# TestLangdockAsyncExtraction
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestLangdockAsyncExtraction:
+    """Test concurrent page fan-out with rate limiting and backoff."""
+
+    def test_rate_limit_status_classified(self):
+        """429 and quota messages raise LangdockRateLimitError, others RuntimeError."""
+        with pytest.raises(LangdockRateLimitError):
+            LangdockBackend._raise_for_status(_response(429, {}), "OCR")
+        with pytest.raises(LangdockRateLimitError):
+            LangdockBackend._raise_for_status(_response(400, {"error": "Quota exceeded"}), "OCR")
+        with pytest.raises(RuntimeError) as exc_info:
+            LangdockBackend._raise_for_status(_response(400, {}), "OCR")
+        assert not isinstance(exc_info.value, TransientAPIError)
+
+    def test_transient_status_classified(self):
+        """5xx and overload messages raise TransientAPIError with Retry-After."""
+        with pytest.raises(TransientAPIError) as exc_info:
+            LangdockBackend._raise_for_status(
+                _response(503, {}, headers={"Retry-After": "7"}), "OCR"
+            )
+        assert not isinstance(exc_info.value, LangdockRateLimitError)
+        assert exc_info.value.retry_after == 7.0
+        with pytest.raises(TransientAPIError):
+            LangdockBackend._raise_for_status(_response(400, {"error": "Overloaded"}), "OCR")
+
+    async def test_document_pages_run_concurrently(self, create_multipage_text_pdf):
+        """Up to max_concurrency pages are in flight at once."""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_ocr(*args, **kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.2)
+            with lock:
+                active -= 1
+            return "page text"
+
+        backend = LangdockBackend(api_key="secret", max_concurrency=3)
+        with patch.object(backend, "_ocr_with_langdock", side_effect=slow_ocr):
+            result = await backend.extract_document_async(create_multipage_text_pdf(pages=6))
+
+        assert result.success is True
+        assert [p.page_number for p in result.pages] == [1, 2, 3, 4, 5, 6]
+        assert peak == 3
+
+    async def test_rate_limited_page_retried(self, create_text_pdf, sample_ocr_text_response):
+        """A page rejected for rate limits is retried and then succeeds."""
+        backend = LangdockBackend(api_key="secret")
+
+        with (
+            patch.object(backend._session, "post") as mock_post,
+            patch.dict(langdock_retry.TRANSIENT_RETRY, {"wait": wait_none()}),
+        ):
+            mock_post.side_effect = [
+                _response(json_data={"attachmentId": "att-1"}),
+                _response(429, {"error": "rate limit"}),
+                _response(json_data=sample_ocr_text_response),
+            ]
+            result = await backend.extract_text_async(create_text_pdf(), page_number=1)
+
+        assert result.text
+        assert mock_post.call_count == 3
+        # Only the failed chat call is repeated, not the upload
+        assert mock_post.call_args_list[2].args[0] == backend.assistant_url
+
+    def test_rate_limiter_spaces_requests(self):
+        """Request starts from several threads are spaced by 1 / requests_per_second."""
+        limiter = langdock_retry.RateLimiter(requests_per_second=20)
+        starts = []
+        lock = threading.Lock()
+
+        def acquire():
+            limiter.acquire()
+            with lock:
+                starts.append(time.monotonic())
+
+        threads = [threading.Thread(target=acquire) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        starts.sort()
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert all(gap >= 0.04 for gap in gaps)
+
+    def test_rate_limiter_disabled_by_default(self):
+        """LANGDOCK_RPS=0 (default) never sleeps."""
+        limiter = langdock_retry.RateLimiter(requests_per_second=0)
+        with patch("time.sleep") as mock_sleep:
+            for _ in range(5):
+                limiter.acquire()
+        mock_sleep.assert_not_called()
+
+    def test_every_attempt_takes_a_rate_limit_slot(
+        self, create_text_pdf, sample_ocr_text_response
+    ):
+        """Upload, chat and each retry wait for their own limiter slot."""
+        backend = LangdockBackend(api_key="secret", requests_per_second=5)
+
+        with (
+            patch.object(backend._session, "post") as mock_post,
+            patch.object(backend._rate_limiter, "acquire") as mock_acquire,
+            patch.dict(langdock_retry.TRANSIENT_RETRY, {"wait": wait_none()}),
+        ):
+            mock_post.side_effect = [
+                _response(json_data={"attachmentId": "att-1"}),
+                _response(429, {}),
+                _response(429, {}),
+                _response(json_data=sample_ocr_text_response),
+            ]
+            backend.extract_text(create_text_pdf(), page_number=1)
+
+        assert mock_acquire.call_count == mock_post.call_count == 4
+
+
+# =============================================================================
+# TestLangdockRetry
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestLangdockRetry:
+    """Test retries of transient API failures."""
+
+    def test_transient_upload_retried(self, create_text_pdf, sample_ocr_text_response):
+        """A 503 on upload is retried and the page still succeeds."""
+        backend = LangdockBackend(api_key="secret")
+
+        with (
+            patch.object(backend._session, "post") as mock_post,
+            patch.dict(langdock_retry.TRANSIENT_RETRY, {"wait": wait_none()}),
+        ):
+            mock_post.side_effect = [
+                _response(503, {}),
+                _response(json_data={"attachmentId": "att-1"}),
+                _response(json_data=sample_ocr_text_response),
+            ]
+            result = backend.extract_text(create_text_pdf(), page_number=1)
+
+        assert result.text
+        assert mock_post.call_count == 3
+
+    def test_gives_up_after_five_attempts(self, create_text_pdf):
+        """Persistent transient failures raise after five attempts."""
+        backend = LangdockBackend(api_key="secret")
+
+        with (
+            patch.object(backend._session, "post", return_value=_response(502, {})) as mock_post,
+            patch.dict(langdock_retry.TRANSIENT_RETRY, {"wait": wait_none()}),
+        ):
+            with pytest.raises(TransientAPIError, match="Upload failed: 502"):
+                backend.extract_text(create_text_pdf(), page_number=1)
+
+        assert mock_post.call_count == 5
+
+    def test_wait_honours_retry_after(self):
+        """Retry-After sets the wait (capped); otherwise jittered backoff applies."""
+
+        def state(exc):
+            retry_state = MagicMock()
+            retry_state.attempt_number = 1
+            retry_state.outcome.exception.return_value = exc
+            return retry_state
+
+        assert langdock_retry._wait_transient(state(TransientAPIError("x", retry_after=7))) == 7
+        assert langdock_retry._wait_transient(
+            state(TransientAPIError("x", retry_after=600))
+        ) == langdock_retry.MAX_RETRY_AFTER
+        assert 0 <= langdock_retry._wait_transient(state(TransientAPIError("x"))) <= 30
@@ -0,0 +1,213 @@
+"""
+Tests for shared page rendering
+===============================
+
+Unit tests for the render_page() cache shared by the image-based backends.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from text_extraction.backends import rendering
+from text_extraction.backends.langdock import LangdockBackend
+from text_extraction.backends.tesseract import TesseractBackend
+
+
+@pytest.fixture(autouse=True)
+def _clear_render_cache():
+    rendering.cache_clear()
+    yield
+    rendering.cache_clear()
+
+
+# =============================================================================
+# TestRenderPage
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestRenderPage:
+    """Test render_page() output and caching."""
+
+    def test_returns_rgb_samples(self, create_text_pdf):
+        """Samples are width * height * 3 bytes of RGB."""
+        samples, width, height = rendering.render_page(create_text_pdf(), 1, dpi=72)
+        assert len(samples) == width * height * 3
+
+    def test_dpi_scales_size(self, create_text_pdf):
+        """Doubling the DPI doubles both dimensions."""
+        pdf_path = create_text_pdf()
+        _, w1, h1 = rendering.render_page(pdf_path, 1, dpi=72)
+        _, w2, h2 = rendering.render_page(pdf_path, 1, dpi=144)
+        assert (w2, h2) == (w1 * 2, h1 * 2)
+
+    def test_same_page_rendered_once(self, create_text_pdf):
+        """A repeated render of the same page and DPI is served from cache."""
+        pdf_path = create_text_pdf()
+
+        with patch.object(rendering.fitz, "open", wraps=rendering.fitz.open) as spy:
+            first = rendering.render_page(pdf_path, 1, dpi=72)
+            second = rendering.render_page(str(pdf_path), 1, dpi=72)
+
+        assert second is first
+        spy.assert_called_once()
+
+    def test_modified_file_rendered_again(self, create_text_pdf, create_image_pdf):
+        """A file rewritten in place is not served a stale render."""
+        pdf_path = create_text_pdf("changing.pdf")
+        first = rendering.render_page(pdf_path, 1, dpi=72)
+
+        os.replace(create_image_pdf("replacement.pdf"), pdf_path)
+
+        assert rendering.render_page(pdf_path, 1, dpi=72) is not first
+
+    def test_cache_clear(self, create_text_pdf):
+        """cache_clear() forces a fresh render."""
+        pdf_path = create_text_pdf()
+        first = rendering.render_page(pdf_path, 1, dpi=72)
+
+        rendering.cache_clear()
+
+        assert rendering.render_page(pdf_path, 1, dpi=72) is not first
+
+
+# =============================================================================
+# TestSharedRender
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestSharedRender:
+    """Test that Tesseract and Langdock share page renders."""
+
+    def test_fallback_reuses_render(self, create_text_pdf):
+        """Tesseract and Langdock at the same DPI render the page only once."""
+        pdf_path = create_text_pdf()
+        tesseract = TesseractBackend(dpi=144)
+        langdock = LangdockBackend(api_key="secret", dpi=144)
+
+        with patch.object(rendering.fitz, "open", wraps=rendering.fitz.open) as spy:
+            image = tesseract._pdf_page_to_pil(pdf_path, 1, 144)
+            jpeg = langdock._pdf_page_to_image(pdf_path, 1)
+
+        spy.assert_called_once()
+        assert jpeg.startswith(b"\xff\xd8")
+        assert image.mode == "RGB"
+
+
+# =============================================================================
+# TestMaxSide
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestMaxSide:
+    """Test downscaling of over-large rendered pages."""
+
+    def test_large_page_downscaled(self, create_text_pdf):
+        """The longest side is clamped to max_side, keeping the aspect ratio."""
+        pdf_path = create_text_pdf()
+        _, width, height = rendering.render_page(pdf_path, 1, dpi=144)
+
+        image = rendering.render_page_image(pdf_path, 1, dpi=144, max_side=500)
+
+        assert 490 < max(image.size) <= 500
+        assert image.width / image.height == pytest.approx(width / height, rel=0.01)
+
+    def test_small_page_untouched(self, create_text_pdf):
+        """Pages already within max_side keep their rendered size."""
+        pdf_path = create_text_pdf()
+        _, width, height = rendering.render_page(pdf_path, 1, dpi=72)
+
+        image = rendering.render_page_image(pdf_path, 1, dpi=72, max_side=5000)
+
+        assert image.size == (width, height)
+
+    def test_max_side_from_env(self):
+        """OCR_MAX_SIDE overrides both backends' defaults."""
+        with patch.dict(os.environ, {"OCR_MAX_SIDE": "1234"}):
+            assert TesseractBackend().max_side == 1234
+            assert LangdockBackend(api_key="secret").max_side == 1234
+
+    def test_backend_defaults(self):
+        """LLM OCR uploads are capped lower than Tesseract input."""
+        with patch.dict(os.environ):
+            os.environ.pop("OCR_MAX_SIDE", None)
+            assert LangdockBackend(api_key="secret").max_side == 2200
+            assert TesseractBackend().max_side == 4000
+
+    def test_tesseract_page_capped(self, create_text_pdf):
+        """TesseractBackend renders are clamped to its max_side."""
+        backend = TesseractBackend(max_side=800)
+        image = backend._pdf_page_to_pil(create_text_pdf(), 1, 300)
+        assert 790 < max(image.size) <= 800
+
+
+# =============================================================================
+# TestPDFSession
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestPDFSession:
+    """Test the shared document handle for batch rendering."""
+
+    def test_pages_rendered_from_one_handle(self, create_multipage_text_pdf):
+        """Inside a session, rendering N pages opens the PDF once."""
+        pdf_path = create_multipage_text_pdf(pages=4)
+
+        with patch.object(rendering.fitz, "open", wraps=rendering.fitz.open) as spy:
+            with rendering.PDFSession(pdf_path):
+                for page_number in range(1, 5):
+                    rendering.render_page(pdf_path, page_number, dpi=72)
+
+        spy.assert_called_once()
+
+    def test_nested_session_shares_handle(self, create_text_pdf):
+        """An inner session joins the outer one and leaves it open."""
+        pdf_path = create_text_pdf()
+
+        with rendering.PDFSession(pdf_path) as outer:
+            with rendering.PDFSession(pdf_path) as inner:
+                assert inner.doc is outer.doc
+            assert not outer.doc.is_closed
+            rendering.render_page(pdf_path, 1, dpi=72)
+
+    def test_close_releases_document(self, create_text_pdf):
+        """Closing the session closes the document and shrinks MuPDF's store."""
+        pdf_path = create_text_pdf()
+
+        with patch.object(rendering.fitz.TOOLS, "store_shrink") as mock_shrink:
+            with rendering.PDFSession(pdf_path) as session:
+                doc = session.doc
+
+        assert doc.is_closed
+        mock_shrink.assert_called_once_with(100)
+        assert str(pdf_path.resolve()) not in rendering._session_documents
+
+    def test_document_extraction_uses_session(self, create_multipage_text_pdf):
+        """extract_document() keeps the PDF open across its pages."""
+        pdf_path = create_multipage_text_pdf(pages=3)
+        backend = TesseractBackend(dpi=72)
+
+        with (
+            patch("text_extraction.backends.tesseract.pytesseract") as mock_tess,
+            patch.object(rendering.fitz, "open", wraps=rendering.fitz.open) as spy,
+        ):
+            mock_tess.image_to_data.return_value = {
+                "page_num": [], "block_num": [], "par_num": [],
+                "line_num": [], "text": [], "conf": [],
+            }
+            result = backend.extract_document(pdf_path, pages=[1, 2, 3])
+
+        assert result.success is True
+        spy.assert_called_once()
+
+    def test_sessionless_render_keeps_store(self, create_text_pdf):
+        """Per-page renders outside a session leave MuPDF's store alone."""
+        with patch.object(rendering.fitz.TOOLS, "store_shrink") as mock_shrink:
+            rendering.render_page(create_text_pdf(), 1, dpi=72)
+
+        mock_shrink.assert_not_called()
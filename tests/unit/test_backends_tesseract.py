@@ -0,0 +1,189 @@
+"""
+Tests for TesseractBackend
+==========================
+
+Unit tests for the local Tesseract OCR backend (pytesseract is mocked).
+"""
+
+import asyncio
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from text_extraction.backends import tesseract
+from text_extraction.backends.base import ExtractionMethod
+from text_extraction.backends.tesseract import TesseractBackend
+
+
+def _data(words, conf=None, lines=None, pars=None):
+    """Minimal image_to_data DICT output: one row per word."""
+    n = len(words)
+    return {
+        "page_num": [1] * n,
+        "block_num": [1] * n,
+        "par_num": pars or [1] * n,
+        "line_num": lines or [1] * n,
+        "text": words,
+        "conf": conf or [90] * n,
+    }
+
+
+# =============================================================================
+# TestTesseractBackendInit
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestTesseractBackendInit:
+    """Test TesseractBackend configuration."""
+
+    def test_concurrency_from_env(self):
+        """OCR_CONCURRENCY sets the number of parallel pages."""
+        with patch.dict(os.environ, {"OCR_CONCURRENCY": "3"}):
+            backend = TesseractBackend()
+        assert backend.concurrency == 3
+
+    def test_concurrency_param_overrides_env(self):
+        """An explicit concurrency wins over the environment."""
+        with patch.dict(os.environ, {"OCR_CONCURRENCY": "3"}):
+            backend = TesseractBackend(concurrency=5)
+        assert backend.concurrency == 5
+
+    @patch("text_extraction.backends.tesseract.pytesseract.get_tesseract_version")
+    def test_availability_probed_once(self, mock_version):
+        """is_available() runs `tesseract --version` only on the first call."""
+        backend = TesseractBackend()
+        assert backend.is_available() is True
+        assert backend.is_available() is True
+        mock_version.assert_called_once()
+
+
+# =============================================================================
+# TestMeanConfidence
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestMeanConfidence:
+    """Test confidence aggregation over image_to_data's conf column."""
+
+    @pytest.fixture(params=["numpy", "python"])
+    def mean_confidence(self, request):
+        if request.param == "numpy":
+            pytest.importorskip("numpy")
+            return tesseract._mean_confidence
+        with patch.object(tesseract, "np", None):
+            yield tesseract._mean_confidence
+
+    def test_non_word_boxes_skipped(self, mean_confidence):
+        """-1 entries (blocks, lines) do not pull the mean down."""
+        assert mean_confidence([-1, 90, -1, 70]) == pytest.approx(0.8)
+
+    def test_string_and_float_values(self, mean_confidence):
+        """Values arrive as ints, floats or strings depending on tesseract."""
+        assert mean_confidence(["95.5", "-1", 84.5]) == pytest.approx(0.9)
+
+    def test_no_words_defaults(self, mean_confidence):
+        """Pages without recognised words report 0.5."""
+        assert mean_confidence([-1, -1]) == 0.5
+        assert mean_confidence([]) == 0.5
+
+
+# =============================================================================
+# TestTextFromData
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestTextFromData:
+    """Test text reconstruction from a single image_to_data pass."""
+
+    def test_words_lines_and_paragraphs(self):
+        """Words join with spaces, lines with newlines, paragraphs with a blank line."""
+        data = _data(
+            ["", "Hello", "World", "second", "line", "", "New", "para"],
+            lines=[0, 1, 1, 2, 2, 0, 1, 1],
+            pars=[1, 1, 1, 1, 1, 2, 2, 2],
+        )
+        assert tesseract._text_from_data(data) == "Hello World\nsecond line\n\nNew para"
+
+    def test_empty_page(self):
+        """Pages with no words give empty text."""
+        assert tesseract._text_from_data(_data(["", " "])) == ""
+
+    @patch("text_extraction.backends.tesseract.pytesseract")
+    def test_single_tesseract_pass(self, mock_tess, create_text_pdf):
+        """extract_text runs Tesseract once and takes text and confidence from it."""
+        mock_tess.image_to_data.return_value = _data(["Hi", "there"], conf=[80, 100])
+
+        result = TesseractBackend().extract_text(create_text_pdf(), page_number=1)
+
+        mock_tess.image_to_data.assert_called_once()
+        mock_tess.image_to_string.assert_not_called()
+        assert result.text == "Hi there"
+        assert result.confidence == pytest.approx(0.9)
+
+
+# =============================================================================
+# TestTesseractAsyncExtraction
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestTesseractAsyncExtraction:
+    """Test concurrent page OCR."""
+
+    @patch("text_extraction.backends.tesseract.pytesseract")
+    async def test_extract_text_async(self, mock_tess, create_text_pdf):
+        """The async variant returns the same OCRResult as extract_text()."""
+        mock_tess.image_to_data.return_value = _data(["Hello", ""], conf=[90, -1])
+
+        backend = TesseractBackend()
+        result = await backend.extract_text_async(create_text_pdf(), page_number=1)
+
+        assert result.text == "Hello"
+        assert result.method == ExtractionMethod.TESSERACT
+        assert result.confidence == pytest.approx(0.9)
+
+    @patch("text_extraction.backends.tesseract.pytesseract")
+    async def test_pages_overlap_up_to_concurrency(
+        self, mock_tess, create_multipage_text_pdf
+    ):
+        """Pages run in parallel, never more than `concurrency` at a time."""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_ocr(*args, **kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.2)
+            with lock:
+                active -= 1
+            return _data(["text"])
+
+        mock_tess.image_to_data.side_effect = slow_ocr
+
+        backend = TesseractBackend(concurrency=2)
+        result = await backend.extract_document_async(create_multipage_text_pdf(pages=5))
+
+        assert result.success is True
+        assert [p.page_number for p in result.pages] == [1, 2, 3, 4, 5]
+        assert peak == 2
+
+    @patch("text_extraction.backends.tesseract.pytesseract")
+    def test_async_usable_from_sync_code(self, mock_tess, create_multipage_text_pdf):
+        """Sync callers can drive the concurrent path with asyncio.run()."""
+        mock_tess.image_to_data.return_value = _data(["text"])
+
+        backend = TesseractBackend(concurrency=4)
+        result = asyncio.run(
+            backend.extract_document_async(create_multipage_text_pdf(pages=3), pages=[1, 3])
+        )
+
+        assert [p.page_number for p in result.pages] == [1, 3]
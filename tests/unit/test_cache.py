@@ -0,0 +1,83 @@
+"""
+Tests for Result Cache
+======================
+
+Unit tests for the LRU cache used for classification/extraction results.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from service.cache import LRUCache
+
+# =============================================================================
+# TestLRUCache
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestLRUCache:
+    """Test LRUCache get/put/eviction."""
+
+    def test_get_missing_returns_none(self):
+        """Unknown keys return None."""
+        assert LRUCache(2).get("missing") is None
+
+    def test_put_and_get(self):
+        """Stored values are returned."""
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+
+    def test_evicts_least_recently_used(self):
+        """The least recently used entry is evicted when full."""
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_zero_size_disables_cache(self):
+        """maxsize=0 stores nothing."""
+        cache = LRUCache(0)
+        cache.put("a", 1)
+        assert cache.get("a") is None
+
+    def test_clear(self):
+        """clear() drops all entries."""
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.clear()
+        assert len(cache) == 0
+
+
+# =============================================================================
+# TestClassifyCache
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestClassifyCache:
+    """Test classification reuse for identical uploads in service/main.py."""
+
+    def test_identical_upload_classified_once(self, create_text_pdf):
+        """Repeated identical content is classified only once."""
+        from service import main
+
+        data = create_text_pdf().read_bytes()
+        main._classify_cache.clear()
+
+        with patch.object(
+            main.detector, "classify_pdf_stream", wraps=main.detector.classify_pdf_stream
+        ) as mock_classify:
+            first = main._classify_upload(data, "a.pdf")
+            second = main._classify_upload(data, "b.pdf")
+
+        assert first is second
+        mock_classify.assert_called_once()
@@ -11,6 +11,7 @@ Test Coverage:
 
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
 from text_extraction import PDFTypeDetector, PDFType, PDFClassificationResult, PageAnalysis
 
@@ -134,6 +135,299 @@ class TestPageAnalysis:
         assert total_categorized == result.total_pages
 
 
+    @pytest.mark.unit
+    def test_classify_matches_per_page_analysis(self, detector, create_hybrid_pdf):
+        """Single-pass classification agrees with analyze_page per page."""
+        import fitz
+
+        pdf_path = create_hybrid_pdf("hybrid_consistency.pdf")
+
+        result = detector.classify_pdf(pdf_path)
+
+        with fitz.open(pdf_path) as doc:
+            expected = [detector.analyze_page(page, i + 1) for i, page in enumerate(doc)]
+        assert result.page_analyses == expected
+        assert result.total_text_blocks == sum(a.text_blocks for a in expected)
+
+    @pytest.mark.unit
+    def test_block_counts_match_dict_blocks(self, detector, create_hybrid_pdf):
+        """Counting from get_text("blocks") matches block['type'] in the dict output."""
+        import fitz
+
+        pdf_path = create_hybrid_pdf("hybrid_blocks.pdf")
+
+        with fitz.open(pdf_path) as doc:
+            for page in doc:
+                types = [b["type"] for b in page.get_text("dict")["blocks"]]
+                assert detector._count_blocks(page) == (types.count(0), types.count(1))
+
+# =============================================================================
+# Test: In-Memory Classification
+# =============================================================================
+
+class TestStreamClassification:
+    """Tests for classify_pdf_stream (no file on disk)."""
+
+    @pytest.mark.unit
+    def test_stream_matches_path_classification(self, detector, create_hybrid_pdf):
+        """Classifying bytes gives the same result as classifying the file."""
+        pdf_path = create_hybrid_pdf("hybrid_stream.pdf")
+
+        from_path = detector.classify_pdf(pdf_path)
+        from_bytes = detector.classify_pdf_stream(pdf_path.read_bytes(), name="hybrid.pdf")
+
+        assert from_bytes == from_path
+
+    @pytest.mark.unit
+    def test_stream_accepts_file_object(self, detector, create_text_pdf):
+        """A binary file object is read and classified."""
+        pdf_path = create_text_pdf("text_stream.pdf")
+
+        with open(pdf_path, "rb") as f:
+            result = detector.classify_pdf_stream(f)
+
+        assert result.pdf_type == PDFType.PURE_TEXT
+
+    @pytest.mark.unit
+    def test_stream_invalid_data_raises(self, detector):
+        """Non-PDF bytes raise an exception."""
+        with pytest.raises(Exception):
+            detector.classify_pdf_stream(b"not a pdf")
+
+
+# =============================================================================
+# Test: Parallel Classification
+# =============================================================================
+
+class TestParallelClassification:
+    """Tests for classifying large PDFs across worker processes."""
+
+    @pytest.mark.unit
+    def test_parallel_matches_serial(self, create_multipage_text_pdf):
+        """Worker processes produce the same result as the serial pass."""
+        from text_extraction.detector import PARALLEL_MIN_PAGES
+
+        pdf_path = create_multipage_text_pdf(pages=PARALLEL_MIN_PAGES + 1)
+
+        serial = PDFTypeDetector(n_workers=1).classify_pdf(pdf_path)
+        parallel = PDFTypeDetector(n_workers=2).classify_pdf(pdf_path)
+
+        assert parallel == serial
+        assert [a.page_number for a in parallel.page_analyses] == list(
+            range(1, PARALLEL_MIN_PAGES + 2)
+        )
+
+    @pytest.mark.unit
+    def test_small_pdf_stays_serial(self, create_text_pdf):
+        """PDFs below PARALLEL_MIN_PAGES never start worker processes."""
+        detector = PDFTypeDetector(n_workers=4)
+
+        with patch.object(PDFTypeDetector, "_count_blocks_parallel") as mock_parallel:
+            detector.classify_pdf(create_text_pdf())
+
+        mock_parallel.assert_not_called()
+
+    @pytest.mark.unit
+    def test_serial_by_default(self, create_multipage_text_pdf):
+        """Library callers get serial classification unless they opt in."""
+        from text_extraction.detector import PARALLEL_MIN_PAGES
+
+        pdf_path = create_multipage_text_pdf(pages=PARALLEL_MIN_PAGES + 1)
+
+        with patch.object(PDFTypeDetector, "_count_blocks_parallel") as mock_parallel:
+            PDFTypeDetector()._classify_file(pdf_path)
+
+        mock_parallel.assert_not_called()
+
+    @pytest.mark.unit
+    def test_broken_pool_falls_back_to_serial(self, create_multipage_text_pdf):
+        """A broken worker pool is discarded and the pages are counted serially."""
+        from concurrent.futures.process import BrokenProcessPool
+        from unittest.mock import MagicMock
+
+        from text_extraction import detector_parallel
+
+        pdf_path = create_multipage_text_pdf(pages=3)
+        broken = MagicMock()
+        broken.submit.side_effect = BrokenProcessPool("worker died")
+
+        with patch.dict(detector_parallel._process_pools, {7: broken}):
+            counts = detector_parallel.count_blocks_parallel(pdf_path, 3, 7)
+            assert 7 not in detector_parallel._process_pools
+
+        assert len(counts) == 3
+        broken.shutdown.assert_called_once()
+
+
+# =============================================================================
+# Test: Classification Cache
+# =============================================================================
+
+class TestClassificationCache:
+    """Tests for the classify_pdf result cache."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        PDFTypeDetector.clear_cache()
+        yield
+        PDFTypeDetector.clear_cache()
+
+    @pytest.mark.unit
+    def test_unchanged_file_classified_once(self, detector, create_text_pdf):
+        """Repeated calls for the same unchanged file reuse the result."""
+        pdf_path = create_text_pdf()
+
+        with patch.object(
+            PDFTypeDetector, "_classify_file", autospec=True,
+            side_effect=PDFTypeDetector._classify_file
+        ) as spy:
+            first = detector.classify_pdf(pdf_path)
+            second = detector.classify_pdf(str(pdf_path))
+
+        assert second is first
+        spy.assert_called_once()
+
+    @pytest.mark.unit
+    def test_modified_file_reclassified(self, detector, create_text_pdf, create_image_pdf):
+        """A file rewritten in place (new size/mtime) is classified again."""
+        import os
+
+        pdf_path = create_text_pdf("changing.pdf")
+        assert detector.classify_pdf(pdf_path).pdf_type == PDFType.PURE_TEXT
+
+        image_pdf = create_image_pdf("replacement.pdf")
+        os.replace(image_pdf, pdf_path)
+
+        assert detector.classify_pdf(pdf_path).pdf_type == PDFType.PURE_IMAGE
+
+    @pytest.mark.unit
+    def test_equally_configured_detectors_share_entries(self, create_text_pdf):
+        """A new detector with the same settings reuses the cached result."""
+        pdf_path = create_text_pdf()
+
+        first = PDFTypeDetector().classify_pdf(pdf_path)
+
+        assert PDFTypeDetector().classify_pdf(pdf_path) is first
+
+    @pytest.mark.unit
+    def test_detectors_with_other_thresholds_not_shared(self, create_text_pdf):
+        """Cached results are per detector configuration, so thresholds are respected."""
+        pdf_path = create_text_pdf()
+
+        lenient = PDFTypeDetector().classify_pdf(pdf_path)
+        strict = PDFTypeDetector(text_block_threshold=100).classify_pdf(pdf_path)
+
+        assert lenient.pdf_type == PDFType.PURE_TEXT
+        assert strict.pdf_type != PDFType.PURE_TEXT
+
+    @pytest.mark.unit
+    def test_clear_cache(self, detector, create_text_pdf):
+        """clear_cache() forces the next call to parse the file again."""
+        pdf_path = create_text_pdf()
+        first = detector.classify_pdf(pdf_path)
+
+        detector.clear_cache()
+
+        assert detector.classify_pdf(pdf_path) is not first
+
+    @pytest.mark.unit
+    def test_mupdf_store_shrunk_after_classification(self, detector, create_text_pdf):
+        """MuPDF's resource store is emptied once the document is closed."""
+        with patch("text_extraction.detector.fitz.TOOLS.store_shrink") as mock_shrink:
+            detector.classify_pdf(create_text_pdf())
+            detector.classify_pdf_stream(create_text_pdf("stream.pdf").read_bytes())
+
+        assert mock_shrink.call_count == 2
+        mock_shrink.assert_called_with(100)
+
+
+# =============================================================================
+# Test: Early Exit
+# =============================================================================
+
+def _concat_pdfs(target: Path, sources: list) -> Path:
+    """Write the pages of the source PDFs, in order, to target."""
+    import fitz
+
+    with fitz.open() as doc:
+        for source in sources:
+            with fitz.open(source) as src:
+                doc.insert_pdf(src)
+        doc.save(str(target))
+    return target
+
+
+class TestEarlyExit:
+    """Tests for early-exit classification of uniform PDFs."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        PDFTypeDetector.clear_cache()
+        yield
+        PDFTypeDetector.clear_cache()
+
+    @pytest.mark.unit
+    def test_uniform_text_pdf_samples_leading_pages(self, create_multipage_text_pdf):
+        """Only early_exit_pages pages are read; the rest are assumed to be text."""
+        pdf_path = create_multipage_text_pdf(pages=10)
+        detector = PDFTypeDetector(n_workers=0, early_exit=True)
+
+        with patch.object(
+            PDFTypeDetector, "_count_blocks", wraps=PDFTypeDetector._count_blocks
+        ) as spy:
+            result = detector.classify_pdf(pdf_path)
+
+        assert spy.call_count == 5
+        assert result.sampled_only is True
+        assert result.pdf_type == PDFType.PURE_TEXT
+        assert result.total_pages == 10
+        assert result.text_pages == list(range(1, 11))
+        assert len(result.page_analyses) == 5
+        assert result.confidence == pytest.approx(0.5)
+
+    @pytest.mark.unit
+    def test_uniform_image_pdf(self, temp_dir, create_image_pdf):
+        """Scanned documents exit early as PURE_IMAGE with every page to OCR."""
+        pdf_path = _concat_pdfs(temp_dir / "scan.pdf", [create_image_pdf()] * 8)
+        detector = PDFTypeDetector(n_workers=0, early_exit=True, early_exit_pages=3)
+
+        result = detector.classify_pdf_stream(pdf_path.read_bytes())
+
+        assert result.sampled_only is True
+        assert result.pdf_type == PDFType.PURE_IMAGE
+        assert result.image_pages == list(range(1, 9))
+
+    @pytest.mark.unit
+    def test_mixed_sample_analyses_every_page(
+        self, temp_dir, create_multipage_text_pdf, create_image_pdf
+    ):
+        """A disagreeing sample falls back to the full analysis."""
+        pdf_path = _concat_pdfs(
+            temp_dir / "mixed.pdf",
+            [create_multipage_text_pdf(pages=3), create_image_pdf(),
+             create_multipage_text_pdf("more.pdf", pages=4)],
+        )
+        detector = PDFTypeDetector(n_workers=0, early_exit=True)
+
+        result = detector.classify_pdf(pdf_path)
+
+        assert result.sampled_only is False
+        assert result.pdf_type == PDFType.HYBRID
+        assert result.image_pages == [4]
+        assert len(result.page_analyses) == 8
+
+    @pytest.mark.unit
+    def test_short_or_default_not_sampled(self, create_multipage_text_pdf):
+        """Short PDFs and the default detector analyse every page."""
+        short = create_multipage_text_pdf("short.pdf", pages=5)
+        long = create_multipage_text_pdf("long.pdf", pages=10)
+
+        assert PDFTypeDetector(early_exit=True).classify_pdf(short).sampled_only is False
+        result = PDFTypeDetector(n_workers=0).classify_pdf(long)
+        assert result.sampled_only is False
+        assert len(result.page_analyses) == 10
+
+
 # =============================================================================
 # Test: Confidence Calculation
 # =============================================================================
@@ -5,17 +5,31 @@ Tests for Async Job Queue
 Unit tests for the async job processing system (Issue #6).
 """
 
+import asyncio
+import os
+import time
+from concurrent.futures import Future
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock
 
+import httpx
 import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from tenacity import wait_none
 
+from service import jobs, webhooks
 from service.jobs import (
     InMemoryJobStore,
     Job,
     JobStatus,
+    RedisJobStore,
+    _count_pages,
+    create_router,
     process_job,
+    run_cleanup_loop,
 )
+from service.webhooks import _WebhookCircuitBreaker, send_webhook
 
 # =============================================================================
 # TestJobModel
@@ -41,6 +55,18 @@ class TestJobModel:
         assert job.result is None
         assert job.error is None
 
+    def test_job_has_no_instance_dict(self, tmp_path):
+        """Job uses __slots__ (no per-instance __dict__)."""
+        job = Job(
+            job_id="slots",
+            file_name="test.pdf",
+            file_path=tmp_path / "test.pdf",
+            quality="fast",
+        )
+        assert not hasattr(job, "__dict__")
+        with pytest.raises(AttributeError):
+            job.unknown_field = 1
+
     def test_job_with_options(self, tmp_path):
         """Job accepts optional model and callback URL."""
         job = Job(
@@ -102,6 +128,26 @@ class TestInMemoryJobStore:
         assert updated.status == JobStatus.PROCESSING
         assert updated.progress == 50
 
+    def test_get_returns_snapshot(self, tmp_path):
+        """Jobs returned by get() are not changed by later updates."""
+        store = InMemoryJobStore()
+        job = Job(
+            job_id="snap",
+            file_name="test.pdf",
+            file_path=tmp_path / "test.pdf",
+            quality="fast",
+        )
+        store.create(job)
+        snapshot = store.get("snap")
+
+        store.update("snap", status=JobStatus.COMPLETED, result={"text": "done"})
+
+        assert snapshot.status == JobStatus.PENDING
+        assert snapshot.result is None
+        current = store.get("snap")
+        assert current.status == JobStatus.COMPLETED
+        assert current.result == {"text": "done"}
+
     def test_update_nonexistent(self):
         """Updating nonexistent job does nothing."""
         store = InMemoryJobStore()
@@ -135,6 +181,24 @@ class TestInMemoryJobStore:
         assert store.get("old") is None
         assert store.get("new") is not None
 
+    def test_cleanup_only_pops_expired(self, tmp_path):
+        """Cleanup leaves unexpired entries in the expiry heap."""
+        store = InMemoryJobStore()
+        for i, age_hours in enumerate([30, 25, 1]):
+            job = Job(
+                job_id=f"job-{i}",
+                file_name="test.pdf",
+                file_path=tmp_path / f"{i}.pdf",
+                quality="fast",
+            )
+            job.created_at = datetime.utcnow() - timedelta(hours=age_hours)
+            store.create(job)
+
+        assert store.cleanup_expired() == 2
+        assert store.get("job-2") is not None
+        assert len(store._expiry_heap) == 1
+        assert store.cleanup_expired() == 0
+
     def test_cleanup_removes_temp_file(self, tmp_path):
         """Cleanup deletes the temp file for expired jobs."""
         store = InMemoryJobStore()
@@ -154,6 +218,163 @@ class TestInMemoryJobStore:
         assert not temp_file.exists()
 
 
+    def test_result_spilled_to_disk(self, tmp_path):
+        """Results are written to a file and read back lazily."""
+        store = InMemoryJobStore()
+        job = Job(
+            job_id="spill",
+            file_name="test.pdf",
+            file_path=tmp_path / "test.pdf",
+            quality="fast",
+        )
+        store.create(job)
+        store.update("spill", status=JobStatus.COMPLETED, result={"text": "Hallo"})
+
+        assert job.result_path == tmp_path / "test.result.json"
+        assert job.result_path.exists()
+        assert job.result == {"text": "Hallo"}
+
+    def test_cleanup_removes_result_file(self, tmp_path):
+        """Cleanup deletes the result file of expired jobs."""
+        store = InMemoryJobStore()
+        job = Job(
+            job_id="expire-result",
+            file_name="test.pdf",
+            file_path=tmp_path / "test.pdf",
+            quality="fast",
+        )
+        job.result = {"text": "old"}
+        job.created_at = datetime.utcnow() - timedelta(hours=25)
+        store.create(job)
+
+        store.cleanup_expired()
+        assert not (tmp_path / "test.result.json").exists()
+
+
+    async def test_cleanup_loop_sweeps_periodically(self):
+        """Background loop keeps sweeping, even after a failed sweep."""
+        store = MagicMock()
+
+        def cleanup():
+            if store.cleanup_expired.call_count == 2:
+                raise RuntimeError("disk error")
+            return 1
+
+        store.cleanup_expired.side_effect = cleanup
+
+        task = asyncio.create_task(run_cleanup_loop(store, interval=0))
+        while store.cleanup_expired.call_count < 3:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert store.cleanup_expired.call_count >= 3
+
+
+# =============================================================================
+# TestRedisJobStore
+# =============================================================================
+
+
+class FakeRedis:
+    """Minimal dict-backed stand-in for redis.Redis."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+        self.ttls[key] = ttl
+
+    def set(self, key, value, keepttl=False):
+        self.data[key] = value
+        if not keepttl:
+            self.ttls.pop(key, None)
+
+    def get(self, key):
+        return self.data.get(key)
+
+
+@pytest.mark.unit
+class TestRedisJobStore:
+    """Test RedisJobStore with an in-memory fake client."""
+
+    def test_create_get_roundtrip(self, tmp_path):
+        """Jobs are stored with the expiry TTL and restored intact."""
+        client = FakeRedis()
+        store = RedisJobStore(client=client)
+        job = Job(
+            job_id="redis-1",
+            file_name="test.pdf",
+            file_path=tmp_path / "test.pdf",
+            quality="accurate",
+            model="gemini-2.5-flash",
+        )
+        store.create(job)
+
+        restored = store.get("redis-1")
+        assert restored is not None
+        assert restored.file_path == tmp_path / "test.pdf"
+        assert restored.model == "gemini-2.5-flash"
+        assert restored.created_at == job.created_at
+        assert client.ttls["textextract:job:redis-1"] == 24 * 3600
+
+    def test_update_keeps_ttl(self, tmp_path):
+        """Updates persist metadata and keep the original TTL."""
+        client = FakeRedis()
+        store = RedisJobStore(client=client)
+        job = Job(
+            job_id="redis-2",
+            file_name="test.pdf",
+            file_path=tmp_path / "test.pdf",
+            quality="fast",
+        )
+        store.create(job)
+        store.update("redis-2", status=JobStatus.COMPLETED, result={"text": "x"})
+
+        restored = store.get("redis-2")
+        assert restored.status == JobStatus.COMPLETED
+        assert restored.result == {"text": "x"}
+        assert "textextract:job:redis-2" in client.ttls
+
+    def test_get_nonexistent(self):
+        """Unknown job IDs return None."""
+        assert RedisJobStore(client=FakeRedis()).get("missing") is None
+
+    def test_get_by_hash(self, tmp_path):
+        """Jobs are found by content hash."""
+        store = RedisJobStore(client=FakeRedis())
+        job = Job(
+            job_id="redis-3",
+            file_name="test.pdf",
+            file_path=tmp_path / "test.pdf",
+            quality="fast",
+            content_hash="abc:fast:",
+        )
+        store.create(job)
+
+        assert store.get_by_hash("abc:fast:").job_id == "redis-3"
+        assert store.get_by_hash("other") is None
+
+    def test_cleanup_expired_removes_old_files(self, tmp_path):
+        """Result files and uploads older than the expiry are deleted."""
+        store = RedisJobStore(client=FakeRedis(), upload_dir=tmp_path)
+        old = time.time() - (jobs.JOB_EXPIRY_HOURS + 1) * 3600
+        for name in ("old.pdf", "old.result.json", "new.pdf", "new.result.json", "notes.txt"):
+            (tmp_path / name).write_bytes(b"x")
+        for name in ("old.pdf", "old.result.json", "notes.txt"):
+            os.utime(tmp_path / name, (old, old))
+
+        assert store.cleanup_expired() == 2
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "new.pdf",
+            "new.result.json",
+            "notes.txt",
+        ]
+
+
 # =============================================================================
 # TestProcessJob
 # =============================================================================
@@ -253,6 +474,8 @@ class TestProcessJob:
         assert updated is not None
         assert updated.status == JobStatus.FAILED
         assert "Unexpected crash" in (updated.error or "")
+        assert updated.processing_time_ms is not None
+        assert updated.processing_time_ms >= 0
 
     def test_temp_file_cleanup(self, tmp_path):
         """Temp file is cleaned up after processing."""
@@ -289,6 +512,300 @@ class TestProcessJob:
 
         assert not temp_file.exists()
 
+    def test_progress_reported_from_processor(self, tmp_path):
+        """Page progress from the processor is mapped into job.progress."""
+        store = InMemoryJobStore()
+        job = Job(
+            job_id="progress-test",
+            file_name="test.pdf",
+            file_path=tmp_path / "test.pdf",
+            quality="balanced",
+        )
+        store.create(job)
+        seen = []
+
+        def fake_extract(path, quality, model, progress_callback):
+            progress_callback(2, 4)
+            seen.append(store.get("progress-test").progress)
+            result = MagicMock()
+            result.success = False
+            result.error = "stop"
+            return result
+
+        mock_processor = MagicMock()
+        mock_processor.extract.side_effect = fake_extract
+
+        process_job(job, store, MagicMock(return_value=mock_processor))
+
+        assert seen == [52]
+
+
+# =============================================================================
+# TestJobResultEndpoint
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestJobResultEndpoint:
+    """Test GET /api/v1/jobs/{job_id}/result."""
+
+    def _client(self, store, upload_dir):
+        result = MagicMock(
+            success=True,
+            file_name="0123abcd.pdf",  # on-disk name
+            pdf_type="PURE_TEXT",
+            total_pages=1,
+            text="text",
+            word_count=1,
+            confidence=1.0,
+            processing_time_ms=1.0,
+            extraction_method="direct",
+            backend_status=None,
+            page_errors=[],
+        )
+        processor = MagicMock()
+        processor.extract.return_value = result
+        app = FastAPI()
+        app.include_router(
+            create_router(
+                store=store,
+                get_processor_fn=MagicMock(return_value=processor),
+                upload_dir=upload_dir,
+            )
+        )
+        return TestClient(app)
+
+    def test_serves_result_file(self, tmp_path):
+        """Completed jobs stream the spilled result file as JSON."""
+        store = InMemoryJobStore()
+        job = Job(
+            job_id="done",
+            file_name="test.pdf",
+            file_path=tmp_path / "test.pdf",
+            quality="fast",
+        )
+        store.create(job)
+        store.update("done", status=JobStatus.COMPLETED, result={"text": "Straße"})
+
+        response = self._client(store, tmp_path).get("/api/v1/jobs/done/result")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.content == (tmp_path / "test.result.json").read_bytes()
+        assert response.json() == {"text": "Straße"}
+
+    def test_identical_upload_reuses_completed_job(self, tmp_path, create_text_pdf):
+        """Second upload of the same PDF returns the completed job."""
+        pdf_bytes = create_text_pdf().read_bytes()
+        store = InMemoryJobStore()
+        client = self._client(store, tmp_path)
+        files = {"file": ("test.pdf", pdf_bytes, "application/pdf")}
+
+        first = client.post("/api/v1/extract/async?quality=fast", files=files)
+        assert first.status_code == 202
+        job_id = first.json()["job_id"]
+        for _ in range(100):
+            if store.get(job_id).status == JobStatus.COMPLETED:
+                break
+            time.sleep(0.01)
+
+        second = client.post("/api/v1/extract/async?quality=fast", files=files)
+        other_quality = client.post("/api/v1/extract/async?quality=accurate", files=files)
+
+        assert second.status_code == 200
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.json()["job_id"] == job_id
+        assert client.get(f"/api/v1/jobs/{job_id}/result").json()["file_name"] == "test.pdf"
+        assert other_quality.status_code == 202
+        assert other_quality.json()["job_id"] != job_id
+
+    def test_processing_job_conflict(self, tmp_path):
+        """Jobs still processing return 409."""
+        store = InMemoryJobStore()
+        job = Job(
+            job_id="busy",
+            file_name="test.pdf",
+            file_path=tmp_path / "test.pdf",
+            quality="fast",
+        )
+        job.status = JobStatus.PROCESSING
+        store.create(job)
+
+        response = self._client(store, tmp_path).get("/api/v1/jobs/busy/result")
+
+        assert response.status_code == 409
+
+
+# =============================================================================
+# TestJobExecutorRouting
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestJobExecutorRouting:
+    """Test routing of async jobs to the small/large executors by page count."""
+
+    def _post(self, pdf_path, small, large, upload_dir):
+        for executor in (small, large):
+            executor.submit.return_value = Future()
+        app = FastAPI()
+        app.include_router(
+            create_router(
+                store=InMemoryJobStore(),
+                get_processor_fn=MagicMock(),
+                executor=small,
+                large_executor=large,
+                upload_dir=upload_dir,
+            )
+        )
+        files = {"file": ("test.pdf", pdf_path.read_bytes(), "application/pdf")}
+        return TestClient(app).post("/api/v1/extract/async", files=files)
+
+    def test_small_pdf_uses_default_executor(self, create_multipage_text_pdf, tmp_path):
+        """PDFs up to LARGE_JOB_PAGES pages run on the default executor."""
+        small, large = MagicMock(), MagicMock()
+
+        response = self._post(create_multipage_text_pdf(pages=3), small, large, tmp_path)
+
+        assert response.status_code == 202
+        small.submit.assert_called_once()
+        large.submit.assert_not_called()
+
+    def test_large_pdf_uses_large_executor(
+        self, create_multipage_text_pdf, tmp_path, monkeypatch
+    ):
+        """PDFs above LARGE_JOB_PAGES pages run on the large-job executor."""
+        monkeypatch.setattr(jobs, "LARGE_JOB_PAGES", 2)
+        small, large = MagicMock(), MagicMock()
+
+        response = self._post(create_multipage_text_pdf(pages=3), small, large, tmp_path)
+
+        assert response.status_code == 202
+        large.submit.assert_called_once()
+        small.submit.assert_not_called()
+
+    def test_count_pages_invalid_pdf(self, tmp_path):
+        """Unreadable files count as 0 pages (routed as small jobs)."""
+        bad = tmp_path / "bad.pdf"
+        bad.write_bytes(b"not a pdf")
+
+        assert _count_pages(bad) == 0
+
+
+# =============================================================================
+# TestWebhook
+# =============================================================================
+
+
+def _webhook_job(store, tmp_path, job_id="hook", url="https://hooks.example.com/done"):
+    job = Job(
+        job_id=job_id,
+        file_name="test.pdf",
+        file_path=tmp_path / "test.pdf",
+        quality="fast",
+        callback_url=url,
+    )
+    job.status = JobStatus.COMPLETED
+    store.create(job)
+    return job
+
+
+@pytest.mark.unit
+class TestWebhook:
+    """Test async webhook delivery."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_breaker(self, monkeypatch):
+        monkeypatch.setattr(webhooks, "_webhook_breaker", _WebhookCircuitBreaker(2, 300))
+        monkeypatch.setattr(
+            webhooks, "_post_webhook", webhooks._post_webhook.retry_with(wait=wait_none())
+        )
+
+    async def test_posts_payload(self, tmp_path):
+        """Webhook POSTs job id, status and file name."""
+        received = []
+
+        def handler(request):
+            received.append(request)
+            return httpx.Response(200)
+
+        store = InMemoryJobStore()
+        job = _webhook_job(store, tmp_path)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            await send_webhook(job, store, client)
+
+        assert len(received) == 1
+        assert received[0].url == "https://hooks.example.com/done"
+        assert b'"status":"completed"' in received[0].content.replace(b" ", b"")
+
+    async def test_transport_error_retried(self, tmp_path):
+        """Connection errors are retried until the request succeeds."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) < 3:
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(204)
+
+        store = InMemoryJobStore()
+        job = _webhook_job(store, tmp_path)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            await send_webhook(job, store, client)
+
+        assert len(calls) == 3
+
+    async def test_circuit_opens_after_failures(self, tmp_path):
+        """Hosts that keep failing are skipped once the breaker opens."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+
+        store = InMemoryJobStore()
+        job = _webhook_job(store, tmp_path)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            for _ in range(4):
+                await send_webhook(job, store, client)
+
+        assert len(calls) == 2
+        assert webhooks._webhook_breaker.allow("hooks.example.com") is False
+
+    async def test_identical_inflight_webhooks_coalesced(self, tmp_path, monkeypatch):
+        """A notification identical to one in flight on the shared client is dropped."""
+        calls = []
+        release = asyncio.Event()
+
+        async def handler(request):
+            calls.append(request)
+            await release.wait()
+            return httpx.Response(200)
+
+        shared = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(webhooks, "_server_loop", asyncio.get_running_loop())
+        monkeypatch.setattr(webhooks, "_webhook_client", shared)
+        store = InMemoryJobStore()
+        job = _webhook_job(store, tmp_path)
+
+        first = asyncio.create_task(send_webhook(job, store))
+        await asyncio.sleep(0)
+        await send_webhook(job, store)
+        release.set()
+        await first
+        await shared.aclose()
+
+        assert len(calls) == 1
+        assert webhooks._inflight_webhooks == set()
+
+    def test_breaker_half_opens_after_reset(self):
+        """Breaker lets a request through after the reset period."""
+        breaker = _WebhookCircuitBreaker(threshold=1, reset_seconds=0)
+        breaker.record("host", success=False)
+        assert breaker.allow("host") is True
+        breaker.record("host", success=True)
+        assert breaker.allow("host") is True
+
 
 # =============================================================================
 # TestJobStatusEnum
@@ -257,6 +257,20 @@ class TestTwoPassProcessorExtract:
         assert result.total_pages == 3
         assert len(result.pages) == 3
 
+    def test_extract_keeps_other_documents_renders(
+        self, mock_primary_backend, create_text_pdf
+    ):
+        """Finishing one document does not evict renders of another in flight."""
+        from text_extraction.backends import rendering
+
+        other_pdf = create_text_pdf("other.pdf")
+        cached = rendering.render_page(other_pdf, 1, dpi=72)
+        processor = TwoPassProcessor(primary_backend=mock_primary_backend)
+
+        processor.extract(create_text_pdf(), quality="fast")
+
+        assert rendering.render_page(other_pdf, 1, dpi=72) is cached
+
 
 # =============================================================================
 # TwoPassProcessor OCR Fallback Tests
@@ -666,3 +680,110 @@ class TestOCRFailureCascade:
         assert result.success is True
         assert len(result.page_errors) > 0
         assert "empty response" in result.page_errors[0].error
+
+
+# =============================================================================
+# Page Batching Tests
+# =============================================================================
+
+
+class PageEchoBackend(MockOCRBackend):
+    """Mock backend returning page-specific text, slower for early pages."""
+
+    def extract_text(self, file_path, page_number=None, **kwargs):
+        import time
+
+        time.sleep(0.01 * (10 - page_number))
+        super().extract_text(file_path, page_number, **kwargs)
+        return OCRResult(
+            text=f"OCR page {page_number}",
+            confidence=0.95,
+            method=ExtractionMethod.LLM_OCR,
+            page_number=page_number,
+        )
+
+
+@pytest.fixture
+def create_multipage_image_pdf(temp_dir):
+    """Factory fixture to create a PDF with several image-only pages."""
+    def _create(filename: str = "images.pdf", pages: int = 6) -> Path:
+        import io
+
+        import fitz
+        from PIL import Image
+
+        img_bytes = io.BytesIO()
+        Image.new("RGB", (200, 100), color="white").save(img_bytes, format="PNG")
+        pdf_path = temp_dir / filename
+        doc = fitz.open()
+        for _ in range(pages):
+            page = doc.new_page()
+            page.insert_image(fitz.Rect(72, 72, 300, 200), stream=img_bytes.getvalue())
+        doc.save(str(pdf_path))
+        doc.close()
+        return pdf_path
+    return _create
+
+
+@pytest.mark.unit
+class TestPageBatching:
+    """Tests for batched, concurrent OCR of pages."""
+
+    def test_results_in_page_order(self, create_multipage_image_pdf):
+        """Pages finishing out of order are merged back in page order."""
+        pdf_path = create_multipage_image_pdf(pages=6)
+        backend = PageEchoBackend(name="Echo")
+        processor = TwoPassProcessor(
+            primary_backend=backend,
+            config=ProcessorConfig(page_batch_size=2, max_page_workers=3),
+        )
+
+        result = processor.extract(pdf_path, quality="balanced")
+
+        assert [p.page_number for p in result.pages] == [1, 2, 3, 4, 5, 6]
+        assert [p.text for p in result.pages] == [f"OCR page {n}" for n in range(1, 7)]
+        assert sorted(call[1] for call in backend.extract_calls) == [1, 2, 3, 4, 5, 6]
+
+    def test_progress_callback(self, create_multipage_image_pdf):
+        """Progress is reported per batch and ends at the total page count."""
+        pdf_path = create_multipage_image_pdf(pages=5)
+        processor = TwoPassProcessor(
+            primary_backend=PageEchoBackend(name="Echo"),
+            config=ProcessorConfig(page_batch_size=2),
+        )
+        progress = []
+
+        processor.extract(
+            pdf_path,
+            quality="balanced",
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+
+        assert progress[-1] == (5, 5)
+        assert [done for done, _ in progress] == sorted(done for done, _ in progress)
+
+    def test_page_callback(self, create_multipage_image_pdf):
+        """Every page result is passed to page_callback as it completes."""
+        pdf_path = create_multipage_image_pdf(pages=4)
+        processor = TwoPassProcessor(
+            primary_backend=PageEchoBackend(name="Echo"),
+            config=ProcessorConfig(page_batch_size=1, max_page_workers=2),
+        )
+        seen = []
+
+        result = processor.extract(pdf_path, quality="balanced", page_callback=seen.append)
+
+        assert sorted(p.page_number for p in seen) == [1, 2, 3, 4]
+        assert {id(p) for p in seen} == {id(p) for p in result.pages}
+
+    def test_page_errors_sorted(self, create_multipage_image_pdf):
+        """Page errors from concurrent batches are reported in page order."""
+        pdf_path = create_multipage_image_pdf(pages=4)
+        processor = TwoPassProcessor(
+            primary_backend=MockOCRBackend(name="Failing", should_fail=True),
+            config=ProcessorConfig(fallback_on_error=False, page_batch_size=1),
+        )
+
+        result = processor.extract(pdf_path, quality="balanced")
+
+        assert [e.page_number for e in result.page_errors] == [1, 2, 3, 4]
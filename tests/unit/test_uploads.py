@@ -0,0 +1,142 @@
+"""
+Tests for Upload Handling
+=========================
+
+Unit tests for streaming uploaded files to disk.
+"""
+
+import hashlib
+import io
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+from fastapi import UploadFile
+
+from service import uploads
+from service.uploads import is_pdf_filename, save_upload
+
+# =============================================================================
+# TestSaveUpload
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestSaveUpload:
+    """Test save_upload chunked copy."""
+
+    async def test_copies_content(self, tmp_path):
+        """Uploaded bytes are written to the destination unchanged."""
+        data = b"%PDF-1.7\n" + bytes(range(256)) * 1000
+        upload = UploadFile(file=io.BytesIO(data), filename="test.pdf")
+        dest = tmp_path / "out.pdf"
+
+        await save_upload(upload, dest)
+
+        assert dest.read_bytes() == data
+
+    async def test_copies_from_start_after_partial_read(self, tmp_path):
+        """Copy starts at offset 0 even if the upload was already read from."""
+        upload = UploadFile(file=io.BytesIO(b"abcdef"), filename="test.pdf")
+        await upload.read(3)
+        dest = tmp_path / "out.pdf"
+
+        await save_upload(upload, dest)
+
+        assert dest.read_bytes() == b"abcdef"
+
+    async def test_copies_in_chunks(self, tmp_path, monkeypatch):
+        """Content larger than the chunk size is copied completely."""
+        monkeypatch.setattr(uploads, "UPLOAD_CHUNK_SIZE", 4)
+        upload = UploadFile(file=io.BytesIO(b"0123456789"), filename="test.pdf")
+        dest = tmp_path / "out.pdf"
+
+        await save_upload(upload, dest)
+
+        assert dest.read_bytes() == b"0123456789"
+
+    async def test_returns_sha256(self, tmp_path):
+        """The SHA-256 digest of the content is returned."""
+        upload = UploadFile(file=io.BytesIO(b"%PDF-1.7 data"), filename="test.pdf")
+
+        digest = await save_upload(upload, tmp_path / "out.pdf")
+
+        assert digest == hashlib.sha256(b"%PDF-1.7 data").hexdigest()
+
+    async def test_rolled_spool_copied_in_chunks(self, tmp_path):
+        """Uploads spooled to disk are copied and hashed in one chunked pass."""
+        data = os.urandom(3 * uploads.UPLOAD_CHUNK_SIZE + 17)
+        spool = tempfile.SpooledTemporaryFile(max_size=16)
+        spool.write(data)
+        upload = UploadFile(file=spool, filename="test.pdf")
+
+        digest = await save_upload(upload, tmp_path / "out.pdf")
+
+        assert digest == hashlib.sha256(data).hexdigest()
+        assert (tmp_path / "out.pdf").read_bytes() == data
+
+    async def test_in_memory_spool_does_not_roll_over(self, tmp_path):
+        """Small in-memory spools are chunk-copied without rolling over to disk."""
+        spool = tempfile.SpooledTemporaryFile(max_size=1 << 20)
+        spool.write(b"%PDF-1.7 small")
+        upload = UploadFile(file=spool, filename="test.pdf")
+
+        await save_upload(upload, tmp_path / "out.pdf")
+
+        assert spool._rolled is False
+        assert (tmp_path / "out.pdf").read_bytes() == b"%PDF-1.7 small"
+
+    def test_service_raises_spool_threshold(self):
+        """The service keeps multipart uploads up to UPLOAD_SPOOL_MAX_SIZE in memory."""
+        from starlette.formparsers import MultiPartParser
+
+        import service.main  # noqa: F401
+
+        assert MultiPartParser.spool_max_size == uploads.UPLOAD_SPOOL_MAX_SIZE
+
+
+# =============================================================================
+# TestIsPdfFilename
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestIsPdfFilename:
+    """Test the upload filename check."""
+
+    @pytest.mark.parametrize("name", ["a.pdf", "A.PDF", "scan.Pdf", ".pdf"])
+    def test_pdf_names_accepted(self, name):
+        """Names ending in .pdf are accepted in any case."""
+        assert is_pdf_filename(name) is True
+
+    @pytest.mark.parametrize("name", [None, "", "pdf", "a.pdf.exe", "a.png"])
+    def test_other_names_rejected(self, name):
+        """Missing names and other extensions are rejected."""
+        assert is_pdf_filename(name) is False
+
+
+# =============================================================================
+# TestNewUploadPath
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestNewUploadPath:
+    """Test temp file placement for request uploads."""
+
+    def test_created_in_upload_tmp_dir(self, tmp_path):
+        """Upload files are created empty in UPLOAD_TMP_DIR."""
+        with patch.object(uploads, "UPLOAD_TMP_DIR", str(tmp_path)):
+            path = uploads.new_upload_path()
+
+        assert path.parent == tmp_path
+        assert path.suffix == ".pdf"
+        assert path.stat().st_size == 0
+
+    def test_default_prefers_dev_shm(self):
+        """/dev/shm is used when writable, otherwise the system temp dir."""
+        with patch("os.path.isdir", return_value=True), patch("os.access", return_value=True):
+            assert uploads._default_upload_tmp_dir() == "/dev/shm"
+        with patch("os.path.isdir", return_value=False):
+            assert uploads._default_upload_tmp_dir() is None